@@ -1102,16 +1102,14 @@ class RemoteClient:
         # 创建进度对话框
         progress_window = tk.Toplevel(self._root)
         progress_window.title("上传音频")
-        progress_window.geometry("400x150")
         progress_window.resizable(False, False)
         progress_window.transient(self._root)
         progress_window.grab_set()
         
-        # 居中显示
-        progress_window.update_idletasks()
+        # 居中显示（尺寸固定，无需先计算布局）
         x = self._root.winfo_x() + (self._root.winfo_width() - 400) // 2
         y = self._root.winfo_y() + (self._root.winfo_height() - 150) // 2
-        progress_window.geometry(f"+{x}+{y}")
+        progress_window.geometry(f"400x150+{x}+{y}")
         
         # 进度标签
         status_label = ttk.Label(
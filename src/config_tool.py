@@ -13,12 +13,14 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from src.tools.config_editor import ConfigEditor
+from src.tools.callback_profiler import CallbackProfiler
 
 
 def main():
     """配置工具入口
     
     独立启动 Cue 列表配置编辑器。
+    使用 --profile 参数启动时，退出后输出各回调的累计耗时。
     
     Requirements: 9.1
     """
@@ -29,7 +31,12 @@ def main():
     try:
         app = ConfigEditor()
         print("配置编辑器已启动")
-        app.mainloop()
+        if "--profile" in sys.argv[1:]:
+            with CallbackProfiler() as profiler:
+                app.mainloop()
+            print(profiler.format_report())
+        else:
+            app.mainloop()
     except Exception as e:
         print(f"启动配置编辑器失败: {e}")
         import traceback
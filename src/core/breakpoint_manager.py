@@ -3,11 +3,16 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from src.models.breakpoint import Breakpoint
 
 
+def _new_id() -> str:
+    """生成新的断点 ID"""
+    return str(uuid.uuid4())
+
+
 class BreakpointManager:
     """断点管理器 - 各音频独立存储
     
@@ -44,7 +49,7 @@ class BreakpointManager:
         Returns:
             新创建的断点 ID
         """
-        bp_id = str(uuid.uuid4())
+        bp_id = _new_id()
         breakpoint = Breakpoint(
             id=bp_id,
             audio_id=audio_id,
@@ -60,6 +65,43 @@ class BreakpointManager:
         self._breakpoints[audio_id].append(breakpoint)
         return bp_id
     
+    def save_breakpoints(
+        self,
+        audio_id: str,
+        positions: Iterable[float],
+        label: str = "",
+        auto_saved: bool = False
+    ) -> List[str]:
+        """为指定音频批量保存断点
+        
+        结果与依次调用 save_breakpoint 相同，只查找一次该音频的断点列表。
+        
+        Args:
+            audio_id: 音频 ID
+            positions: 播放位置列表（秒），按顺序保存
+            label: 断点标签
+            auto_saved: 是否为自动保存（被打断时）
+            
+        Returns:
+            新创建的断点 ID 列表，与 positions 顺序一致
+        """
+        new_breakpoints = [
+            Breakpoint(
+                id=_new_id(),
+                audio_id=audio_id,
+                position=position,
+                label=label,
+                created_at=datetime.now(),
+                auto_saved=auto_saved
+            )
+            for position in positions
+        ]
+        if not new_breakpoints:
+            return []
+        
+        self._breakpoints.setdefault(audio_id, []).extend(new_breakpoints)
+        return [bp.id for bp in new_breakpoints]
+    
     def get_breakpoints(self, audio_id: str) -> List[Breakpoint]:
         """获取指定音频的所有断点
         
@@ -167,6 +209,10 @@ class BreakpointManager:
         ]
         return original_len - len(self._breakpoints[audio_id])
     
+    def clear(self) -> None:
+        """清除所有音频的全部断点（包括自动保存的断点）"""
+        self._breakpoints.clear()
+    
     def get_latest_auto_saved_breakpoint(self, audio_id: str) -> Optional[Breakpoint]:
         """获取指定音频最新的自动保存断点
         
@@ -195,6 +241,14 @@ class BreakpointManager:
             ids.extend(bp.id for bp in breakpoints)
         return ids
     
+    def get_breakpoint_count(self) -> int:
+        """获取所有音频的断点总数
+        
+        Returns:
+            断点总数
+        """
+        return sum(map(len, self._breakpoints.values()))
+    
     def load_from_file(self, path: str) -> None:
         """从 JSON 文件加载断点数据
         
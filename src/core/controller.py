@@ -53,6 +53,9 @@ class CoreController:
     
     _instance: Optional["CoreController"] = None
     _lock = threading.Lock()
+    # 时间源，计算播放位置和静音剩余时间时使用（测试中可替换为固定时钟）
+    # 只用于求时间差，使用单调时钟，不受系统时间调整影响
+    _clock = staticmethod(time.perf_counter)
 
     def __new__(cls, *args, **kwargs):
         """单例模式实现"""
@@ -222,7 +225,7 @@ class CoreController:
         self._is_paused = False
         self._current_audio_id = audio.id
         self._current_position = cue.start_time
-        self._playback_start_time = time.time()
+        self._playback_start_time = self._clock()
         self._playback_start_position = cue.start_time
         self._cue_manager.is_playing = True
         
@@ -250,7 +253,7 @@ class CoreController:
         self._is_paused = False
         self._current_audio_id = self._manual_audio.id
         self._current_position = self._manual_start_pos
-        self._playback_start_time = time.time()
+        self._playback_start_time = self._clock()
         self._playback_start_position = self._manual_start_pos
         
         self._notify_listeners(EventType.PLAYBACK_STARTED, {
@@ -347,7 +350,7 @@ class CoreController:
             
             self._is_paused = False
             self._is_playing = True
-            self._playback_start_time = time.time()
+            self._playback_start_time = self._clock()
             self._playback_start_position = resume_position
             self._current_position = resume_position
             
@@ -483,7 +486,7 @@ class CoreController:
             self._audio_engine.play_bgm(audio, position)
             
             self._current_position = position
-            self._playback_start_time = time.time()
+            self._playback_start_time = self._clock()
             self._playback_start_position = position
             
             if not was_playing:
@@ -528,7 +531,7 @@ class CoreController:
             self._is_playing = True
             self._is_paused = False
             self._current_position = start_pos
-            self._playback_start_time = time.time()
+            self._playback_start_time = self._clock()
             self._playback_start_position = start_pos
             
             self._notify_listeners(EventType.PLAYBACK_STARTED, {
@@ -807,7 +810,7 @@ class CoreController:
             self._is_paused = False
             self._current_audio_id = audio_id
             self._current_position = bp.position
-            self._playback_start_time = time.time()
+            self._playback_start_time = self._clock()
             self._playback_start_position = bp.position
             
             # 更新手动模式状态
@@ -856,7 +859,7 @@ class CoreController:
             self._is_paused = False
             self._current_audio_id = audio.id
             self._current_position = start_pos
-            self._playback_start_time = time.time()
+            self._playback_start_time = self._clock()
             self._playback_start_position = start_pos
             
             # 更新手动模式状态
@@ -883,7 +886,7 @@ class CoreController:
         self._in_silence = True
         self._silence_duration = duration
         self._silence_remaining = duration
-        self._silence_start_time = time.time()
+        self._silence_start_time = self._clock()
         
         self._notify_listeners(EventType.SILENCE_STARTED, {
             "duration": duration,
@@ -922,7 +925,7 @@ class CoreController:
         if not self._in_silence:
             return False
         
-        elapsed = time.time() - self._silence_start_time
+        elapsed = self._clock() - self._silence_start_time
         self._silence_remaining = max(0.0, self._silence_duration - elapsed)
         
         if self._silence_remaining <= 0:
@@ -979,7 +982,7 @@ class CoreController:
             return self._current_position
         
         # 计算已播放时间
-        elapsed = time.time() - self._playback_start_time
+        elapsed = self._clock() - self._playback_start_time
         return self._playback_start_position + elapsed
     
     # ==================== 事件监听器 ====================
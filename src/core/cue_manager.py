@@ -3,7 +3,7 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 
 from src.models.cue import Cue
 from src.models.cue_config import CueListConfig
@@ -22,6 +22,8 @@ class CueManager:
     def __init__(self):
         """初始化 Cue 管理器"""
         self._cue_list: List[Cue] = []
+        # Cue ID -> 列表中第一个该 ID 的 Cue，与 _cue_list 同步维护
+        self._cue_by_id: Dict[str, Cue] = {}
         self._audio_files: List[AudioTrack] = []
         self._current_index: int = 0
         self._is_playing: bool = False
@@ -38,6 +40,14 @@ class CueManager:
         """获取音频文件列表（只读副本）"""
         return list(self._audio_files)
     
+    def iter_cues(self) -> Iterator[Cue]:
+        """遍历 Cue 列表（不复制列表，遍历期间不要修改 Cue 列表）"""
+        return iter(self._cue_list)
+    
+    def iter_audio_files(self) -> Iterator[AudioTrack]:
+        """遍历音频文件列表（不复制列表，遍历期间不要修改音频列表）"""
+        return iter(self._audio_files)
+    
     @property
     def current_index(self) -> int:
         """获取当前 Cue 索引"""
@@ -87,10 +97,46 @@ class CueManager:
         Returns:
             Cue 对象，不存在则返回 None
         """
+        return self._cue_by_id.get(cue_id)
+    
+    def _reindex_cue(self, cue_id: str) -> None:
+        """重新定位指定 ID 在列表中的第一个 Cue
+        
+        ID 全部唯一时（索引条目数等于列表长度）无需扫描列表。
+        
+        Args:
+            cue_id: Cue ID
+        """
+        if len(self._cue_by_id) == len(self._cue_list):
+            return
         for cue in self._cue_list:
             if cue.id == cue_id:
-                return cue
-        return None
+                self._cue_by_id[cue_id] = cue
+                return
+        self._cue_by_id.pop(cue_id, None)
+    
+    def _rebind_cue(self, old_id: str, cue: Cue) -> None:
+        """列表中第一个 old_id 的 Cue 被替换为 cue 后更新索引
+        
+        Args:
+            old_id: 被替换 Cue 的 ID
+            cue: 新的 Cue 对象
+        """
+        if cue.id == old_id:
+            self._cue_by_id[old_id] = cue
+            return
+        # ID 被修改：旧 ID 可能仍有重复项，新 ID 可能与已有 Cue 重复
+        del self._cue_by_id[old_id]
+        self._cue_by_id.setdefault(cue.id, cue)
+        self._reindex_cue(old_id)
+        self._reindex_cue(cue.id)
+    
+    def _rebuild_cue_index(self) -> None:
+        """根据 Cue 列表重建 ID 索引"""
+        index: Dict[str, Cue] = {}
+        for cue in self._cue_list:
+            index.setdefault(cue.id, cue)
+        self._cue_by_id = index
     
     def get_cue_by_index(self, index: int) -> Optional[Cue]:
         """根据索引获取 Cue
@@ -142,6 +188,18 @@ class CueManager:
             cue: 要添加的 Cue 对象
         """
         self._cue_list.append(cue)
+        self._cue_by_id.setdefault(cue.id, cue)
+    
+    def add_cues(self, cues: List[Cue]) -> None:
+        """批量添加 Cue 到列表末尾
+        
+        Args:
+            cues: Cue 对象列表，按顺序添加到末尾
+        """
+        self._cue_list.extend(cues)
+        setdefault = self._cue_by_id.setdefault
+        for cue in cues:
+            setdefault(cue.id, cue)
     
     def insert_cue(self, index: int, cue: Cue) -> bool:
         """在指定位置插入 Cue
@@ -155,6 +213,9 @@ class CueManager:
         """
         if 0 <= index <= len(self._cue_list):
             self._cue_list.insert(index, cue)
+            # 重复 ID 时插入位置可能在原有 Cue 之前
+            self._cue_by_id.setdefault(cue.id, cue)
+            self._reindex_cue(cue.id)
             # 如果插入位置在当前索引之前或等于当前索引，需要调整当前索引
             if index <= self._current_index and self._cue_list:
                 self._current_index += 1
@@ -173,6 +234,8 @@ class CueManager:
         for i, cue in enumerate(self._cue_list):
             if cue.id == cue_id:
                 self._cue_list.pop(i)
+                del self._cue_by_id[cue_id]
+                self._reindex_cue(cue_id)
                 # 调整当前索引
                 if i < self._current_index:
                     self._current_index -= 1
@@ -181,6 +244,44 @@ class CueManager:
                 return True
         return False
     
+    def remove_cues(self, cue_ids: Iterable[str]) -> int:
+        """批量移除多个 Cue
+        
+        只遍历一次 Cue 列表，结果与依次调用 remove_cue 相同
+        （每个 ID 移除列表中第一个匹配的 Cue）。
+        
+        Args:
+            cue_ids: 要移除的 Cue ID
+            
+        Returns:
+            实际移除的 Cue 数量
+        """
+        pending = set(cue_ids)
+        if not pending:
+            return 0
+        
+        kept: List[Cue] = []
+        removed_before_current = 0
+        for i, cue in enumerate(self._cue_list):
+            if cue.id in pending:
+                pending.discard(cue.id)
+                if i < self._current_index:
+                    removed_before_current += 1
+            else:
+                kept.append(cue)
+        
+        removed = len(self._cue_list) - len(kept)
+        if removed == 0:
+            return 0
+        self._cue_list = kept
+        self._rebuild_cue_index()
+        
+        # 调整当前索引
+        self._current_index -= removed_before_current
+        if self._current_index >= len(self._cue_list):
+            self._current_index = max(0, len(self._cue_list) - 1)
+        return removed
+    
     def update_cue(self, cue_id: str, **kwargs) -> bool:
         """更新指定 Cue 的属性
         
@@ -197,9 +298,37 @@ class CueManager:
                 cue_dict = cue.to_dict()
                 cue_dict.update(kwargs)
                 self._cue_list[i] = Cue.from_dict(cue_dict)
+                self._rebind_cue(cue_id, self._cue_list[i])
                 return True
         return False
     
+    def update_cues(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """批量更新多个 Cue 的属性
+        
+        只遍历一次 Cue 列表，结果与依次调用 update_cue 相同。
+        
+        Args:
+            updates: Cue ID -> 要更新的属性
+            
+        Returns:
+            成功更新的 Cue 数量
+        """
+        pending = dict(updates)
+        updated = 0
+        for i, cue in enumerate(self._cue_list):
+            if not pending:
+                break
+            # 与 update_cue 一致，重复 ID 只更新第一个
+            kwargs = pending.pop(cue.id, None)
+            if kwargs is None:
+                continue
+            cue_dict = cue.to_dict()
+            cue_dict.update(kwargs)
+            self._cue_list[i] = Cue.from_dict(cue_dict)
+            self._rebind_cue(cue.id, self._cue_list[i])
+            updated += 1
+        return updated
+    
     def move_cue(self, from_index: int, to_index: int) -> bool:
         """移动 Cue 位置（用于拖拽排序）
         
@@ -215,6 +344,8 @@ class CueManager:
         
         cue = self._cue_list.pop(from_index)
         self._cue_list.insert(to_index, cue)
+        # 有重复 ID 时，移动可能改变第一个 Cue
+        self._reindex_cue(cue.id)
         
         # 调整当前索引
         if from_index == self._current_index:
@@ -229,6 +360,7 @@ class CueManager:
     def clear_cues(self) -> None:
         """清空所有 Cue"""
         self._cue_list.clear()
+        self._cue_by_id.clear()
         self._current_index = 0
         self._is_playing = False
 
@@ -240,6 +372,14 @@ class CueManager:
         """
         self._audio_files.append(audio)
     
+    def add_audio_files(self, audios: List[AudioTrack]) -> None:
+        """批量添加音频文件
+        
+        Args:
+            audios: 音频轨道对象列表，按顺序添加到末尾
+        """
+        self._audio_files.extend(audios)
+    
     def remove_audio_file(self, audio_id: str) -> bool:
         """移除音频文件
         
@@ -255,6 +395,32 @@ class CueManager:
                 return True
         return False
     
+    def remove_audio_files(self, audio_ids: Iterable[str]) -> int:
+        """批量移除多个音频文件
+        
+        只遍历一次音频列表，结果与依次调用 remove_audio_file 相同。
+        
+        Args:
+            audio_ids: 要移除的音频 ID
+            
+        Returns:
+            实际移除的音频数量
+        """
+        pending = set(audio_ids)
+        if not pending:
+            return 0
+        
+        kept: List[AudioTrack] = []
+        for audio in self._audio_files:
+            if audio.id in pending:
+                pending.discard(audio.id)
+            else:
+                kept.append(audio)
+        
+        removed = len(self._audio_files) - len(kept)
+        self._audio_files = kept
+        return removed
+    
     def get_audio_file(self, audio_id: str) -> Optional[AudioTrack]:
         """获取音频文件
         
@@ -269,6 +435,18 @@ class CueManager:
                 return audio
         return None
     
+    def get_audio_count(self) -> int:
+        """获取音频文件总数"""
+        return len(self._audio_files)
+    
+    def get_audio_ids(self) -> Set[str]:
+        """获取所有音频文件 ID（不复制音频列表）
+        
+        Returns:
+            音频 ID 集合
+        """
+        return {audio.id for audio in self._audio_files}
+    
     def load_config(self, config_path: str) -> None:
         """从 JSON 文件加载配置
         
@@ -284,6 +462,7 @@ class CueManager:
         
         config = CueListConfig.from_dict(data)
         self._cue_list = config.cues
+        self._rebuild_cue_index()
         self._audio_files = config.audio_files
         self._config_name = config.name
         self._config_version = config.version
@@ -317,6 +496,7 @@ class CueManager:
             config: CueListConfig 对象
         """
         self._cue_list = list(config.cues)
+        self._rebuild_cue_index()
         self._audio_files = list(config.audio_files)
         self._config_name = config.name
         self._config_version = config.version
@@ -362,7 +542,7 @@ class CueManager:
         Returns:
             是否包含
         """
-        return any(cue.id == cue_id for cue in self._cue_list)
+        return cue_id in self._cue_by_id
     
     def get_cue_index(self, cue_id: str) -> int:
         """获取 Cue 的索引
@@ -51,6 +51,9 @@ class LongPressHandler:
     
     DEFAULT_DURATION_MS = 500  # 默认长按阈值（毫秒）
     
+    # 时间源（秒），只用于计算按压时长；使用单调时钟，测试中可替换
+    _clock = staticmethod(time.monotonic)
+    
     def __init__(self, widget: Any = None, duration_ms: int = DEFAULT_DURATION_MS):
         """
         初始化长按处理器
@@ -143,7 +146,7 @@ class LongPressHandler:
         Args:
             event: Tkinter 事件对象（可选）
         """
-        self._press_start = time.time()
+        self._press_start = self._clock()
         self._state = LongPressState.PRESSING
         
         # 开始进度更新
@@ -257,7 +260,7 @@ class LongPressHandler:
         """
         self._stop_progress_timer()
         
-        duration_ms = self.get_elapsed_ms() if self._press_start else 0.0
+        duration_ms = self.get_elapsed_ms() if self._press_start is not None else 0.0
         
         self._state = LongPressState.CANCELLED
         self._press_start = None
@@ -284,7 +287,7 @@ class LongPressHandler:
         """
         if self._press_start is None:
             return 0.0
-        return (time.time() - self._press_start) * 1000
+        return (self._clock() - self._press_start) * 1000
     
     def get_progress(self) -> float:
         """
@@ -343,7 +346,7 @@ def simulate_long_press(
     handler.on_press()
     
     # 模拟时间流逝（通过直接设置 _press_start）
-    handler._press_start = time.time() - (press_duration_ms / 1000)
+    handler._press_start = handler._clock() - (press_duration_ms / 1000)
     
     # 模拟释放
     return handler.on_release()
@@ -1,5 +1,5 @@
 """断点数据模型"""
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 import json
 
@@ -16,9 +16,15 @@ class Breakpoint:
 
     def to_dict(self) -> dict:
         """转换为字典"""
-        data = asdict(self)
-        data["created_at"] = self.created_at.isoformat()
-        return data
+        # 直接构造字典，省去 asdict 对 datetime 等字段的递归深拷贝
+        return {
+            "id": self.id,
+            "audio_id": self.audio_id,
+            "position": self.position,
+            "label": self.label,
+            "created_at": self.created_at.isoformat(),
+            "auto_saved": self.auto_saved
+        }
 
     def to_json(self) -> str:
         """序列化为 JSON 字符串"""
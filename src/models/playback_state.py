@@ -1,5 +1,5 @@
 """播放状态数据模型"""
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, Literal
 import json
 
@@ -21,7 +21,20 @@ class PlaybackState:
 
     def to_dict(self) -> dict:
         """转换为字典"""
-        return asdict(self)
+        # 字段均为标量，直接构造字典，省去 asdict 的递归深拷贝
+        return {
+            "mode": self.mode,
+            "is_playing": self.is_playing,
+            "is_paused": self.is_paused,
+            "current_audio_id": self.current_audio_id,
+            "current_position": self.current_position,
+            "current_cue_index": self.current_cue_index,
+            "bgm_volume": self.bgm_volume,
+            "sfx_volume": self.sfx_volume,
+            "in_silence": self.in_silence,
+            "silence_remaining": self.silence_remaining,
+            "duration": self.duration
+        }
 
     def to_json(self) -> str:
         """序列化为 JSON 字符串"""
@@ -0,0 +1,123 @@
+"""回调耗时诊断工具
+
+基于 sys.setprofile 统计配置编辑器中各回调函数的调用次数和累计耗时。
+
+只监听函数级的 call/return 事件（不使用 sys.settrace 的逐行事件），
+编辑器中遍历 Cue 的 for 循环不会因此被逐行放大开销。
+项目目录（src/）以外的帧（Tk/Tcl、标准库）直接忽略。
+"""
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+# 仅统计该目录下的代码
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 本模块自身不参与统计
+_SELF_FILE = os.path.abspath(__file__)
+
+
+class CallbackProfiler:
+    """函数级回调耗时统计器
+
+    用法：
+        with CallbackProfiler() as profiler:
+            app.mainloop()
+        print(profiler.format_report())
+    """
+
+    def __init__(self, src_dir: str = _SRC_DIR):
+        """初始化统计器
+
+        Args:
+            src_dir: 需要统计的源码目录，其他目录的帧会被忽略
+        """
+        self._src_dir = os.path.abspath(src_dir) + os.sep
+        # code 对象 -> 是否属于 src 目录（避免每个事件重复做字符串判断）
+        self._code_filter: Dict[object, bool] = {}
+        # 帧 -> 进入时间
+        self._start_times: Dict[object, float] = {}
+        # 函数键 -> [调用次数, 累计耗时]
+        self._stats: Dict[Tuple[str, int, str], List[float]] = {}
+        self._previous_profile = None
+        self._skip_first_return = False
+
+    def _is_tracked(self, code) -> bool:
+        """判断代码对象是否需要统计"""
+        tracked = self._code_filter.get(code)
+        if tracked is None:
+            filename = os.path.abspath(code.co_filename)
+            tracked = filename.startswith(self._src_dir) and filename != _SELF_FILE
+            self._code_filter[code] = tracked
+        return tracked
+
+    def _profile(self, frame, event, arg):
+        """sys.setprofile 回调"""
+        if event == "call":
+            if self._is_tracked(frame.f_code):
+                self._start_times[frame] = time.perf_counter()
+        elif event == "return":
+            # 安装后收到的第一个 return 事件来自 start() 自身，忽略
+            if self._skip_first_return:
+                self._skip_first_return = False
+                return
+            start = self._start_times.pop(frame, None)
+            if start is None:
+                return
+            code = frame.f_code
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += time.perf_counter() - start
+
+    def start(self) -> None:
+        """开始统计"""
+        self._previous_profile = sys.getprofile()
+        self._skip_first_return = True
+        sys.setprofile(self._profile)
+
+    def stop(self) -> None:
+        """停止统计"""
+        sys.setprofile(self._previous_profile)
+        self._previous_profile = None
+        self._start_times.clear()
+
+    def __enter__(self) -> "CallbackProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def get_stats(self) -> List[Tuple[str, int, float]]:
+        """获取统计结果
+
+        Returns:
+            (函数描述, 调用次数, 累计耗时秒) 列表，按累计耗时降序
+        """
+        result = []
+        for (filename, lineno, name), (count, total) in self._stats.items():
+            location = os.path.relpath(filename, os.path.dirname(self._src_dir.rstrip(os.sep)))
+            result.append((f"{location}:{lineno}({name})", int(count), total))
+        result.sort(key=lambda item: item[2], reverse=True)
+        return result
+
+    def format_report(self, limit: Optional[int] = 30) -> str:
+        """格式化统计报告
+
+        Args:
+            limit: 最多显示的条目数，None 表示全部
+
+        Returns:
+            报告文本
+        """
+        stats = self.get_stats()
+        if limit is not None:
+            stats = stats[:limit]
+        lines = [f"{'累计耗时(ms)':>12}  {'调用次数':>8}  函数"]
+        for func, count, total in stats:
+            lines.append(f"{total * 1000:>12.2f}  {count:>8}  {func}")
+        return "\n".join(lines)
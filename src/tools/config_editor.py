@@ -13,46 +13,403 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import uuid
 import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import wave
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import count, islice
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Set, Dict, Tuple, Iterator
 
 from src.models.cue import Cue
 from src.models.audio_track import AudioTrack
 from src.models.cue_config import CueListConfig
 from src.core.cue_manager import CueManager
 
+try:
+    from tinytag import TinyTag
+except ImportError:
+    TinyTag = None
+
+try:
+    from mutagen import File as MutagenFile
+except ImportError:
+    MutagenFile = None
+
+
+def _set_entry_text(entry: ttk.Entry, text: str) -> None:
+    """替换输入框内容"""
+    entry.delete(0, tk.END)
+    entry.insert(0, text)
+
+
+# 普通十进制数字，可直接 float() 转换，无需异常处理
+_DECIMAL_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+def _bind_percent_label(var: tk.DoubleVar, label: ttk.Label) -> None:
+    """让标签以百分比显示变量的值
+    
+    拖动滑块时变量每个像素都会写入一次，标签更新合并到空闲时执行，
+    每轮事件循环最多重绘一次。
+    
+    Args:
+        var: 0~1 的音量变量
+        label: 显示百分比的标签
+    """
+    pending = False
+    
+    def redraw():
+        nonlocal pending
+        pending = False
+        label.config(text=f"{int(var.get() * 100)}%")
+    
+    def on_write(*args):
+        nonlocal pending
+        if not pending:
+            pending = True
+            label.after_idle(redraw)
+    
+    var.trace_add("write", on_write)
+
+
+def _parse_number_entry(entry: ttk.Entry, name: str, errors: List[str],
+                        default: Optional[float] = 0.0) -> Optional[float]:
+    """解析数字输入框
+    
+    Args:
+        entry: 输入框
+        name: 字段名称（用于错误信息）
+        errors: 错误信息列表，解析失败时追加
+        default: 输入为空时的返回值
+        
+    Returns:
+        解析结果，输入为空返回 default，解析失败返回 None
+    """
+    text = entry.get().strip()
+    if not text:
+        return default
+    if _DECIMAL_RE.fullmatch(text):
+        return float(text)
+    # 科学计数法等少见写法仍交给 float() 判断
+    try:
+        return float(text)
+    except ValueError:
+        errors.append(f"{name}必须是有效的数字")
+        return None
+
+
+# 新建音频的 ID 序号，以启动时刻（微秒）为起点，不同会话生成的 ID 也不会重复
+_AUDIO_ID_COUNTER = count(time.time_ns() // 1000)
+
+
+def _new_audio_id() -> str:
+    """生成新的音频 ID（不读取系统随机数）"""
+    return f"audio_{next(_AUDIO_ID_COUNTER):x}"
+
+
+# 支持添加的音频文件扩展名
+_AUDIO_EXTENSIONS = (".mp3", ".m4a", ".wav", ".ogg", ".flac", ".opus")
+
+# MP3 Layer III 比特率表（kbps），按 MPEG1 / MPEG2(2.5) 区分
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# MP3 采样率表，键为帧头中的版本位（0: MPEG2.5, 2: MPEG2, 3: MPEG1）
+_MP3_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+
+def _wav_duration(filepath: str) -> float:
+    """从 WAV 文件头读取时长（只读 fmt/data 块头，不读取采样数据）"""
+    with wave.open(filepath, "rb") as w:
+        rate = w.getframerate()
+        return w.getnframes() / rate if rate else 0.0
+
+
+def _mp3_duration(filepath: str, size: int) -> float:
+    """从 MP3 首帧头估算时长
+    
+    有 Xing/Info 头时按总帧数计算，否则按首帧比特率（CBR）估算。
+    只读取文件开头最多 64KB。
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(65536)
+        
+        # 跳过 ID3v2 标签，base 为 head 在文件中的偏移
+        base = 0
+        if head[:3] == b"ID3" and len(head) >= 10:
+            base = 10 + ((head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9])
+            if head[5] & 0x10:
+                base += 10
+            f.seek(base)
+            head = f.read(65536)
+    
+    # 查找第一个有效的 Layer III 帧头
+    for pos in range(len(head) - 4):
+        if head[pos] != 0xFF or (head[pos + 1] & 0xE0) != 0xE0:
+            continue
+        header = int.from_bytes(head[pos:pos + 4], "big")
+        version = (header >> 19) & 0x3
+        layer = (header >> 17) & 0x3
+        bitrate_index = (header >> 12) & 0xF
+        rate_index = (header >> 10) & 0x3
+        if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            continue
+        
+        mpeg1 = version == 3
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+        bitrate = _MP3_BITRATES[1 if mpeg1 else 2][bitrate_index] * 1000
+        samples_per_frame = 1152 if mpeg1 else 576
+        
+        # Xing/Info 头位于边信息之后
+        mono = ((header >> 6) & 0x3) == 3
+        side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+        xing = pos + 4 + side_info
+        if head[xing:xing + 4] in (b"Xing", b"Info"):
+            flags = int.from_bytes(head[xing + 4:xing + 8], "big")
+            if flags & 0x1:
+                frames = int.from_bytes(head[xing + 8:xing + 12], "big")
+                return frames * samples_per_frame / sample_rate
+        
+        return (size - base - pos) * 8 / bitrate
+    return 0.0
+
+
+# 无第三方库可用时按扩展名选择的文件头解析函数
+_HEADER_PROBES = {
+    ".wav": lambda filepath, size: _wav_duration(filepath),
+    ".mp3": _mp3_duration,
+}
+
+
+@lru_cache(maxsize=4096)
+def _read_audio_duration(filepath: str, mtime_ns: int, size: int) -> float:
+    """读取音频文件头获取时长
+    
+    mtime_ns 和 size 作为缓存键，文件被修改后会重新读取。
+    优先使用 tinytag（只读取文件头），tinytag 不支持的格式再交给 mutagen，
+    两者都不可用时用标准库解析 WAV / MP3 文件头。
+    不使用 pygame.mixer.Sound，它会把整个文件解码到内存。
+    """
+    if TinyTag is not None:
+        try:
+            duration = TinyTag.get(filepath).duration
+            if duration:
+                return duration
+        except Exception:
+            pass
+    
+    if MutagenFile is not None:
+        try:
+            audio = MutagenFile(filepath)
+            if audio is not None and audio.info:
+                return audio.info.length
+        except Exception:
+            pass
+    
+    probe = _HEADER_PROBES.get(os.path.splitext(filepath)[1].lower())
+    if probe is not None:
+        try:
+            return probe(filepath, size)
+        except Exception:
+            pass
+    
+    return 0.0
+
+
+def _probe_audio_duration(filepath: str) -> float:
+    """获取音频文件时长（可在工作线程中调用）
+    
+    Args:
+        filepath: 音频文件路径
+        
+    Returns:
+        时长（秒），失败返回 0
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return 0.0
+    return _read_audio_duration(filepath, st.st_mtime_ns, st.st_size)
+
+
+class _DurationCache:
+    """音频时长持久化缓存
+    
+    以 (路径, st_mtime_ns, st_size) 为键保存在 SQLite 中，再次添加相同文件时
+    只需 stat() 即可得到时长。只在 Tk 主线程中访问。
+    缓存文件无法打开时退化为不缓存。
+    """
+    
+    def __init__(self, db_path: Path):
+        """初始化缓存
+        
+        Args:
+            db_path: SQLite 数据库文件路径
+        """
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS durations ("
+                "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, duration REAL)"
+            )
+        except (OSError, sqlite3.Error):
+            # 目录无法创建（同名文件、只读目录）或数据库无法打开时不缓存
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+    
+    def get(self, filepath: str, mtime_ns: int, size: int) -> Optional[float]:
+        """查询缓存的时长
+        
+        Returns:
+            时长（秒），未命中或文件已变化返回 None
+        """
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT duration FROM durations WHERE path=? AND mtime=? AND size=?",
+                (filepath, mtime_ns, size)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+    
+    def put_many(self, rows: List[Tuple[str, int, int, float]]) -> None:
+        """在一个事务中写入多条记录
+        
+        Args:
+            rows: (路径, mtime_ns, size, 时长) 列表
+        """
+        if self._conn is None or not rows:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO durations VALUES (?, ?, ?, ?)", rows
+                )
+        except sqlite3.Error:
+            pass
+    
+    def close(self) -> None:
+        """关闭数据库连接"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class _AudioProbeJob:
+    """一次批量添加音频时在后台读取时长的任务状态"""
+    
+    def __init__(self, filepaths: List[str],
+                 results: List[Tuple[float, Optional[Exception]]],
+                 misses: List[Tuple[int, int, int]]):
+        """初始化任务
+        
+        Args:
+            filepaths: 选中的全部文件
+            results: 每个文件的 (时长, 异常)，缓存命中的已填好
+            misses: 需要读取的文件 (序号, mtime_ns, size)
+        """
+        self.filepaths = filepaths
+        self.results = results
+        self.misses = misses
+        # 工作线程推送 (misses 序号, 时长, 异常)，结束时推送 None
+        self.queue: queue.Queue = queue.Queue()
+        self.cancel = threading.Event()
+        self.done = 0
+        self.new_rows: List[Tuple[str, int, int, float]] = []
+        self.show_after_id: Optional[str] = None
+        self.dialog: Optional[tk.Toplevel] = None
+        self.progress_var: Optional[tk.IntVar] = None
+
 
 class CueEditDialog(tk.Toplevel):
-    """Cue 编辑对话框"""
+    """Cue 编辑对话框
     
-    def __init__(self, parent, audio_files: List[AudioTrack], cue: Optional[Cue] = None):
+    对话框关闭时只隐藏不销毁，再次打开时通过 prepare() 重新加载数据，
+    避免重复创建组件。
+    """
+    
+    def __init__(self, parent, audio_choices: Tuple[List[str], List[str]],
+                 cue: Optional[Cue] = None):
         """初始化 Cue 编辑对话框
         
         Args:
             parent: 父窗口
-            audio_files: 可用的音频文件列表
+            audio_choices: 可选音频的 (显示文本列表, ID 列表)
             cue: 要编辑的 Cue（None 表示新建）
         """
         super().__init__(parent)
-        self.audio_files = audio_files
-        self.cue = cue
+        self.parent = parent
+        self.cue: Optional[Cue] = None
         self.result: Optional[Cue] = None
+        self._audio_choices: Optional[Tuple[List[str], List[str]]] = None
+        self._audio_ids: List[str] = []
+        self._done_var = tk.BooleanVar(self, value=False)
         
-        self.title("编辑 Cue" if cue else "新建 Cue")
-        self.geometry("450x400")
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
         
         self._create_widgets()
+        self.prepare(audio_choices, cue)
+    
+    def prepare(self, audio_choices: Tuple[List[str], List[str]], cue: Optional[Cue] = None):
+        """重新加载对话框数据并显示
+        
+        Args:
+            audio_choices: 可选音频的 (显示文本列表, ID 列表)
+            cue: 要编辑的 Cue（None 表示新建）
+        """
+        self.cue = cue
+        self.result = None
+        
+        self.title("编辑 Cue" if cue else "新建 Cue")
+        # 音频列表未变化时沿用上次的下拉选项
+        if audio_choices is not self._audio_choices:
+            self._audio_choices = audio_choices
+            self.audio_combo["values"], self._audio_ids = audio_choices
+        
+        self._reset_fields()
         self._load_cue_data()
         
-        # 居中显示
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
+        # 居中显示（尺寸已知，一次设置大小和位置）
+        self.geometry(self.parent._centered_geometry(450, 400))
+        
+        self.deiconify()
+        self.grab_set()
+    
+    def show(self) -> Optional[Cue]:
+        """等待对话框关闭
+        
+        Returns:
+            编辑结果，取消则返回 None
+        """
+        self._done_var.set(False)
+        self.wait_variable(self._done_var)
+        return self.result
+    
+    def _close(self):
+        """隐藏对话框并结束等待"""
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(True)
     
     def _create_widgets(self):
         """创建界面组件"""
@@ -61,50 +418,36 @@ class CueEditDialog(tk.Toplevel):
         
         # 标签
         ttk.Label(main_frame, text="标签:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.label_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.label_var, width=35).grid(
-            row=0, column=1, columnspan=2, sticky=tk.W, pady=5
-        )
+        self.label_entry = ttk.Entry(main_frame, width=35)
+        self.label_entry.grid(row=0, column=1, columnspan=2, sticky=tk.W, pady=5)
         
         # 音频选择
         ttk.Label(main_frame, text="音频文件:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.audio_var = tk.StringVar()
-        audio_combo = ttk.Combobox(
-            main_frame, textvariable=self.audio_var, width=32, state="readonly"
-        )
-        audio_combo["values"] = [f"{a.title} ({a.id})" for a in self.audio_files]
-        audio_combo.grid(row=1, column=1, columnspan=2, sticky=tk.W, pady=5)
+        self.audio_combo = ttk.Combobox(main_frame, width=32, state="readonly")
+        self.audio_combo.grid(row=1, column=1, columnspan=2, sticky=tk.W, pady=5)
         
         # 入点
         ttk.Label(main_frame, text="入点 (秒):").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.start_time_var = tk.StringVar(value="0.0")
-        ttk.Entry(main_frame, textvariable=self.start_time_var, width=15).grid(
-            row=2, column=1, sticky=tk.W, pady=5
-        )
+        self.start_time_entry = ttk.Entry(main_frame, width=15)
+        self.start_time_entry.grid(row=2, column=1, sticky=tk.W, pady=5)
         
         # 出点
         ttk.Label(main_frame, text="出点 (秒):").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.end_time_var = tk.StringVar(value="")
-        ttk.Entry(main_frame, textvariable=self.end_time_var, width=15).grid(
-            row=3, column=1, sticky=tk.W, pady=5
-        )
+        self.end_time_entry = ttk.Entry(main_frame, width=15)
+        self.end_time_entry.grid(row=3, column=1, sticky=tk.W, pady=5)
         ttk.Label(main_frame, text="(留空表示播放到结束)").grid(
             row=3, column=2, sticky=tk.W, pady=5
         )
         
         # 前置静音
         ttk.Label(main_frame, text="前置静音 (秒):").grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.silence_before_var = tk.StringVar(value="0.0")
-        ttk.Entry(main_frame, textvariable=self.silence_before_var, width=15).grid(
-            row=4, column=1, sticky=tk.W, pady=5
-        )
+        self.silence_before_entry = ttk.Entry(main_frame, width=15)
+        self.silence_before_entry.grid(row=4, column=1, sticky=tk.W, pady=5)
         
         # 后置静音
         ttk.Label(main_frame, text="后置静音 (秒):").grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.silence_after_var = tk.StringVar(value="0.0")
-        ttk.Entry(main_frame, textvariable=self.silence_after_var, width=15).grid(
-            row=5, column=1, sticky=tk.W, pady=5
-        )
+        self.silence_after_entry = ttk.Entry(main_frame, width=15)
+        self.silence_after_entry.grid(row=5, column=1, sticky=tk.W, pady=5)
         
         # 音量
         ttk.Label(main_frame, text="音量:").grid(row=6, column=0, sticky=tk.W, pady=5)
@@ -120,7 +463,7 @@ class CueEditDialog(tk.Toplevel):
         
         self.volume_label = ttk.Label(volume_frame, text="100%")
         self.volume_label.pack(side=tk.LEFT, padx=10)
-        self.volume_var.trace_add("write", self._update_volume_label)
+        _bind_percent_label(self.volume_var, self.volume_label)
         
         # 按钮
         btn_frame = ttk.Frame(main_frame)
@@ -133,57 +476,59 @@ class CueEditDialog(tk.Toplevel):
             side=tk.LEFT, padx=10
         )
     
-    def _update_volume_label(self, *args):
-        """更新音量标签"""
-        self.volume_label.config(text=f"{int(self.volume_var.get() * 100)}%")
+    def _reset_fields(self):
+        """恢复表单默认值"""
+        _set_entry_text(self.label_entry, "")
+        self.audio_combo.set("")
+        _set_entry_text(self.start_time_entry, "0.0")
+        _set_entry_text(self.end_time_entry, "")
+        _set_entry_text(self.silence_before_entry, "0.0")
+        _set_entry_text(self.silence_after_entry, "0.0")
+        self.volume_var.set(1.0)
     
     def _load_cue_data(self):
         """加载 Cue 数据到表单"""
         if self.cue:
-            self.label_var.set(self.cue.label)
+            _set_entry_text(self.label_entry, self.cue.label)
             # 查找音频索引
-            for i, audio in enumerate(self.audio_files):
-                if audio.id == self.cue.audio_id:
-                    self.audio_var.set(f"{audio.title} ({audio.id})")
-                    break
-            self.start_time_var.set(str(self.cue.start_time))
+            if self.cue.audio_id in self._audio_ids:
+                self.audio_combo.current(self._audio_ids.index(self.cue.audio_id))
+            _set_entry_text(self.start_time_entry, str(self.cue.start_time))
             if self.cue.end_time is not None:
-                self.end_time_var.set(str(self.cue.end_time))
-            self.silence_before_var.set(str(self.cue.silence_before))
-            self.silence_after_var.set(str(self.cue.silence_after))
+                _set_entry_text(self.end_time_entry, str(self.cue.end_time))
+            _set_entry_text(self.silence_before_entry, str(self.cue.silence_before))
+            _set_entry_text(self.silence_after_entry, str(self.cue.silence_after))
             self.volume_var.set(self.cue.volume)
     
     def _on_ok(self):
         """确定按钮处理"""
-        # 验证输入
-        if not self.audio_var.get():
-            messagebox.showerror("错误", "请选择音频文件", parent=self)
-            return
+        # 验证输入（收集全部错误后一次提示）
+        errors: List[str] = []
+        audio_index = self.audio_combo.current()
+        if audio_index < 0:
+            errors.append("请选择音频文件")
         
-        try:
-            start_time = float(self.start_time_var.get() or "0")
-            end_time_str = self.end_time_var.get().strip()
-            end_time = float(end_time_str) if end_time_str else None
-            silence_before = float(self.silence_before_var.get() or "0")
-            silence_after = float(self.silence_after_var.get() or "0")
-        except ValueError:
-            messagebox.showerror("错误", "请输入有效的数字", parent=self)
-            return
+        start_time = _parse_number_entry(self.start_time_entry, "入点", errors)
+        end_time = _parse_number_entry(self.end_time_entry, "出点", errors, default=None)
+        silence_before = _parse_number_entry(self.silence_before_entry, "前置静音", errors)
+        silence_after = _parse_number_entry(self.silence_after_entry, "后置静音", errors)
         
         # 验证时间值
-        if start_time < 0:
-            messagebox.showerror("错误", "入点不能为负数", parent=self)
-            return
-        if end_time is not None and end_time <= start_time:
-            messagebox.showerror("错误", "出点必须大于入点", parent=self)
-            return
-        if silence_before < 0 or silence_after < 0:
-            messagebox.showerror("错误", "静音时间不能为负数", parent=self)
+        if start_time is not None:
+            if start_time < 0:
+                errors.append("入点不能为负数")
+            if end_time is not None and end_time <= start_time:
+                errors.append("出点必须大于入点")
+        if (silence_before is not None and silence_before < 0) or \
+                (silence_after is not None and silence_after < 0):
+            errors.append("静音时间不能为负数")
+        
+        if errors:
+            messagebox.showerror("错误", "\n".join(errors), parent=self)
             return
         
         # 获取音频 ID
-        audio_str = self.audio_var.get()
-        audio_id = audio_str.split("(")[-1].rstrip(")")
+        audio_id = self._audio_ids[audio_index]
         
         # 创建 Cue
         cue_id = self.cue.id if self.cue else f"cue_{uuid.uuid4().hex[:8]}"
@@ -195,17 +540,27 @@ class CueEditDialog(tk.Toplevel):
             silence_before=silence_before,
             silence_after=silence_after,
             volume=self.volume_var.get(),
-            label=self.label_var.get() or f"Cue {cue_id}"
+            label=self.label_entry.get() or f"Cue {cue_id}"
         )
-        self.destroy()
+        self._close()
     
     def _on_cancel(self):
         """取消按钮处理"""
-        self.destroy()
+        self.result = None
+        self._close()
 
 
 class AudioEditDialog(tk.Toplevel):
-    """音频文件编辑对话框"""
+    """音频文件编辑对话框
+    
+    与 CueEditDialog 相同，关闭时只隐藏，再次打开时通过 prepare() 复用。
+    """
+    
+    # 音频文件选择框的文件类型
+    _FILETYPES = [
+        ("音频文件", " ".join(f"*{ext}" for ext in _AUDIO_EXTENSIONS)),
+        ("所有文件", "*.*")
+    ]
     
     def __init__(self, parent, audio: Optional[AudioTrack] = None):
         """初始化音频编辑对话框
@@ -215,23 +570,52 @@ class AudioEditDialog(tk.Toplevel):
             audio: 要编辑的音频（None 表示新建）
         """
         super().__init__(parent)
-        self.audio = audio
+        self.parent = parent
+        self.audio: Optional[AudioTrack] = None
         self.result: Optional[AudioTrack] = None
+        self._done_var = tk.BooleanVar(self, value=False)
         
-        self.title("编辑音频" if audio else "添加音频")
-        self.geometry("500x280")
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
         
         self._create_widgets()
+        self.prepare(audio)
+    
+    def prepare(self, audio: Optional[AudioTrack] = None):
+        """重新加载对话框数据并显示
+        
+        Args:
+            audio: 要编辑的音频（None 表示新建）
+        """
+        self.audio = audio
+        self.result = None
+        
+        self.title("编辑音频" if audio else "添加音频")
+        self._reset_fields()
         self._load_audio_data()
         
-        # 居中显示
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
+        # 居中显示（尺寸已知，一次设置大小和位置）
+        self.geometry(self.parent._centered_geometry(500, 280))
+        
+        self.deiconify()
+        self.grab_set()
+    
+    def show(self) -> Optional[AudioTrack]:
+        """等待对话框关闭
+        
+        Returns:
+            编辑结果，取消则返回 None
+        """
+        self._done_var.set(False)
+        self.wait_variable(self._done_var)
+        return self.result
+    
+    def _close(self):
+        """隐藏对话框并结束等待"""
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(True)
     
     def _create_widgets(self):
         """创建界面组件"""
@@ -243,25 +627,21 @@ class AudioEditDialog(tk.Toplevel):
         path_frame = ttk.Frame(main_frame)
         path_frame.grid(row=0, column=1, sticky=tk.W, pady=5)
         
-        self.path_var = tk.StringVar()
-        ttk.Entry(path_frame, textvariable=self.path_var, width=30).pack(side=tk.LEFT)
+        self.path_entry = ttk.Entry(path_frame, width=30)
+        self.path_entry.pack(side=tk.LEFT)
         ttk.Button(path_frame, text="浏览...", command=self._browse_file).pack(
             side=tk.LEFT, padx=5
         )
         
         # 标题
         ttk.Label(main_frame, text="标题:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.title_var = tk.StringVar()
-        ttk.Entry(main_frame, textvariable=self.title_var, width=35).grid(
-            row=1, column=1, sticky=tk.W, pady=5
-        )
+        self.title_entry = ttk.Entry(main_frame, width=35)
+        self.title_entry.grid(row=1, column=1, sticky=tk.W, pady=5)
         
         # 时长
         ttk.Label(main_frame, text="时长 (秒):").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.duration_var = tk.StringVar(value="0.0")
-        ttk.Entry(main_frame, textvariable=self.duration_var, width=15).grid(
-            row=2, column=1, sticky=tk.W, pady=5
-        )
+        self.duration_entry = ttk.Entry(main_frame, width=15)
+        self.duration_entry.grid(row=2, column=1, sticky=tk.W, pady=5)
         
         # 类型
         ttk.Label(main_frame, text="类型:").grid(row=3, column=0, sticky=tk.W, pady=5)
@@ -288,27 +668,23 @@ class AudioEditDialog(tk.Toplevel):
     
     def _browse_file(self):
         """浏览文件"""
-        filetypes = [
-            ("音频文件", "*.mp3 *.m4a *.wav *.ogg"),
-            ("所有文件", "*.*")
-        ]
         filepath = filedialog.askopenfilename(
             parent=self,
             title="选择音频文件",
-            filetypes=filetypes
+            filetypes=self._FILETYPES
         )
         if filepath:
-            self.path_var.set(filepath)
+            _set_entry_text(self.path_entry, filepath)
             # 自动填充标题
-            if not self.title_var.get():
+            if not self.title_entry.get():
                 filename = os.path.basename(filepath)
                 name_without_ext = os.path.splitext(filename)[0]
-                self.title_var.set(name_without_ext)
+                _set_entry_text(self.title_entry, name_without_ext)
             
             # 自动获取音频时长
             duration = self._get_audio_duration(filepath)
             if duration > 0:
-                self.duration_var.set(f"{duration:.1f}")
+                _set_entry_text(self.duration_entry, f"{duration:.1f}")
     
     def _get_audio_duration(self, filepath: str) -> float:
         """获取音频文件时长
@@ -319,73 +695,255 @@ class AudioEditDialog(tk.Toplevel):
         Returns:
             时长（秒），失败返回 0
         """
-        try:
-            # 尝试使用 mutagen 库（更准确）
-            try:
-                from mutagen import File as MutagenFile
-                audio = MutagenFile(filepath)
-                if audio is not None and audio.info:
-                    return audio.info.length
-            except ImportError:
-                pass
-            
-            # 尝试使用 pygame
-            try:
-                import pygame
-                if not pygame.mixer.get_init():
-                    pygame.mixer.init()
-                sound = pygame.mixer.Sound(filepath)
-                duration = sound.get_length()
-                return duration
-            except Exception:
-                pass
-            
-            return 0.0
-        except Exception:
-            return 0.0
+        return _probe_audio_duration(filepath)
+    
+    def _reset_fields(self):
+        """恢复表单默认值"""
+        _set_entry_text(self.path_entry, "")
+        _set_entry_text(self.title_entry, "")
+        _set_entry_text(self.duration_entry, "0.0")
+        self.type_var.set("bgm")
     
     def _load_audio_data(self):
         """加载音频数据到表单"""
         if self.audio:
-            self.path_var.set(self.audio.file_path)
-            self.title_var.set(self.audio.title)
-            self.duration_var.set(str(self.audio.duration))
+            _set_entry_text(self.path_entry, self.audio.file_path)
+            _set_entry_text(self.title_entry, self.audio.title)
+            _set_entry_text(self.duration_entry, str(self.audio.duration))
             self.type_var.set(self.audio.track_type)
     
     def _on_ok(self):
         """确定按钮处理"""
-        # 验证输入
-        if not self.path_var.get():
-            messagebox.showerror("错误", "请选择音频文件", parent=self)
-            return
-        if not self.title_var.get():
-            messagebox.showerror("错误", "请输入标题", parent=self)
-            return
-        
-        try:
-            duration = float(self.duration_var.get() or "0")
-        except ValueError:
-            messagebox.showerror("错误", "请输入有效的时长", parent=self)
-            return
-        
-        if duration < 0:
-            messagebox.showerror("错误", "时长不能为负数", parent=self)
+        # 验证输入（收集全部错误后一次提示）
+        errors: List[str] = []
+        file_path = self.path_entry.get()
+        title = self.title_entry.get()
+        if not file_path:
+            errors.append("请选择音频文件")
+        if not title:
+            errors.append("请输入标题")
+        
+        duration = _parse_number_entry(self.duration_entry, "时长", errors)
+        if duration is not None and duration < 0:
+            errors.append("时长不能为负数")
+        
+        if errors:
+            messagebox.showerror("错误", "\n".join(errors), parent=self)
             return
         
         # 创建 AudioTrack
-        audio_id = self.audio.id if self.audio else f"audio_{uuid.uuid4().hex[:8]}"
+        audio_id = self.audio.id if self.audio else _new_audio_id()
         self.result = AudioTrack(
             id=audio_id,
-            file_path=self.path_var.get(),
+            file_path=file_path,
             duration=duration,
-            title=self.title_var.get(),
+            title=title,
             track_type=self.type_var.get()
         )
-        self.destroy()
+        self._close()
     
     def _on_cancel(self):
         """取消按钮处理"""
-        self.destroy()
+        self.result = None
+        self._close()
+
+
+class BatchVolumeDialog(tk.Toplevel):
+    """批量设置音量对话框
+    
+    与 CueEditDialog 相同，关闭时只隐藏，再次打开时通过 prepare() 复用。
+    """
+    
+    def __init__(self, parent, count: int):
+        """初始化批量音量对话框
+        
+        Args:
+            parent: 父窗口
+            count: 选中的 Cue 数量
+        """
+        super().__init__(parent)
+        self.parent = parent
+        self.result: Optional[float] = None
+        self._done_var = tk.BooleanVar(self, value=False)
+        
+        self.title("批量设置音量")
+        self.resizable(False, False)
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        
+        self._create_widgets()
+        self.prepare(count)
+    
+    def prepare(self, count: int):
+        """重置对话框并显示
+        
+        Args:
+            count: 选中的 Cue 数量
+        """
+        self.result = None
+        self.prompt_label.config(text=f"为选中的 {count} 个 Cue 设置音量:")
+        self.volume_var.set(1.0)
+        
+        self.geometry(self.parent._centered_geometry(300, 120))
+        self.deiconify()
+        self.grab_set()
+    
+    def show(self) -> Optional[float]:
+        """等待对话框关闭
+        
+        Returns:
+            设置的音量，取消则返回 None
+        """
+        self._done_var.set(False)
+        self.wait_variable(self._done_var)
+        return self.result
+    
+    def _close(self):
+        """隐藏对话框并结束等待"""
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(True)
+    
+    def _create_widgets(self):
+        """创建界面组件"""
+        frame = ttk.Frame(self, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.prompt_label = ttk.Label(frame)
+        self.prompt_label.pack(anchor=tk.W)
+        
+        volume_frame = ttk.Frame(frame)
+        volume_frame.pack(fill=tk.X, pady=10)
+        
+        self.volume_var = tk.DoubleVar(self, value=1.0)
+        ttk.Scale(volume_frame, from_=0.0, to=1.0, variable=self.volume_var,
+                  orient=tk.HORIZONTAL, length=180).pack(side=tk.LEFT)
+        
+        self.volume_label = ttk.Label(volume_frame, text="100%", width=6)
+        self.volume_label.pack(side=tk.LEFT, padx=5)
+        _bind_percent_label(self.volume_var, self.volume_label)
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack(pady=5)
+        ttk.Button(btn_frame, text="确定", command=self._on_ok, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="取消", command=self._on_cancel, width=8).pack(side=tk.LEFT)
+    
+    def _on_ok(self):
+        """确定按钮处理"""
+        self.result = self.volume_var.get()
+        self._close()
+    
+    def _on_cancel(self):
+        """取消按钮处理"""
+        self.result = None
+        self._close()
+
+
+class BatchSilenceDialog(tk.Toplevel):
+    """批量设置静音间隔对话框
+    
+    与 CueEditDialog 相同，关闭时只隐藏，再次打开时通过 prepare() 复用。
+    """
+    
+    def __init__(self, parent, count: int):
+        """初始化批量静音对话框
+        
+        Args:
+            parent: 父窗口
+            count: 选中的 Cue 数量
+        """
+        super().__init__(parent)
+        self.parent = parent
+        self.result: Optional[Tuple[float, float]] = None
+        self._done_var = tk.BooleanVar(self, value=False)
+        
+        self.title("批量设置静音间隔")
+        self.resizable(False, False)
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        
+        self._create_widgets()
+        self.prepare(count)
+    
+    def prepare(self, count: int):
+        """重置对话框并显示
+        
+        Args:
+            count: 选中的 Cue 数量
+        """
+        self.result = None
+        self.prompt_label.config(text=f"为选中的 {count} 个 Cue 设置静音间隔:")
+        _set_entry_text(self.before_entry, "0.0")
+        _set_entry_text(self.after_entry, "0.0")
+        
+        self.geometry(self.parent._centered_geometry(320, 180))
+        self.deiconify()
+        self.grab_set()
+    
+    def show(self) -> Optional[Tuple[float, float]]:
+        """等待对话框关闭
+        
+        Returns:
+            (前置静音, 后置静音)，取消则返回 None
+        """
+        self._done_var.set(False)
+        self.wait_variable(self._done_var)
+        return self.result
+    
+    def _close(self):
+        """隐藏对话框并结束等待"""
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(True)
+    
+    def _create_widgets(self):
+        """创建界面组件"""
+        frame = ttk.Frame(self, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.prompt_label = ttk.Label(frame)
+        self.prompt_label.pack(anchor=tk.W)
+        
+        # 前置静音
+        before_frame = ttk.Frame(frame)
+        before_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(before_frame, text="前置静音 (秒):").pack(side=tk.LEFT)
+        self.before_entry = ttk.Entry(before_frame, width=10)
+        self.before_entry.pack(side=tk.LEFT, padx=5)
+        
+        # 后置静音
+        after_frame = ttk.Frame(frame)
+        after_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(after_frame, text="后置静音 (秒):").pack(side=tk.LEFT)
+        self.after_entry = ttk.Entry(after_frame, width=10)
+        self.after_entry.pack(side=tk.LEFT, padx=5)
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack(pady=10)
+        ttk.Button(btn_frame, text="确定", command=self._on_ok, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="取消", command=self._on_cancel, width=8).pack(side=tk.LEFT)
+    
+    def _on_ok(self):
+        """确定按钮处理"""
+        # 验证输入（收集全部错误后一次提示）
+        errors: List[str] = []
+        silence_before = _parse_number_entry(self.before_entry, "前置静音", errors)
+        silence_after = _parse_number_entry(self.after_entry, "后置静音", errors)
+        if (silence_before is not None and silence_before < 0) or \
+                (silence_after is not None and silence_after < 0):
+            errors.append("静音时间不能为负数")
+        
+        if errors:
+            messagebox.showerror("错误", "\n".join(errors), parent=self)
+            return
+        
+        self.result = (silence_before, silence_after)
+        self._close()
+    
+    def _on_cancel(self):
+        """取消按钮处理"""
+        self.result = None
+        self._close()
 
 
 class ConfigEditor(tk.Tk):
@@ -401,6 +959,15 @@ class ConfigEditor(tk.Tk):
     Requirements: 9.1-9.4
     """
     
+    # Cue 列表每次空闲时插入的行数
+    _CUE_CHUNK = 200
+    
+    # 配置文件选择框的文件类型
+    _JSON_FILETYPES = [("JSON 文件", "*.json"), ("所有文件", "*.*")]
+    
+    # 音频时长缓存文件
+    _DURATION_CACHE_PATH = Path("config") / "duration_cache.sqlite"
+    
     def __init__(self):
         """初始化配置编辑器"""
         super().__init__()
@@ -414,6 +981,33 @@ class ConfigEditor(tk.Tk):
         self.current_file: Optional[str] = None
         self.modified = False
         
+        # 批量添加音频时使用的时长缓存
+        self._duration_cache = _DurationCache(self._DURATION_CACHE_PATH)
+        # 正在后台读取时长的批量添加任务
+        self._probe_job: Optional[_AudioProbeJob] = None
+        
+        # 批量操作期间暂停界面刷新，退出时统一刷新一次
+        self._refresh_suspended = False
+        self._pending_refresh: Set[str] = set()
+        
+        # 主窗口位置和大小 (x, y, width, height)，由 <Configure> 事件维护
+        self._geom: Optional[Tuple[int, int, int, int]] = None
+        
+        # Cue 编辑对话框的音频下拉选项缓存，音频列表变化时失效
+        self._audio_choices: Optional[Tuple[List[str], List[str]]] = None
+        
+        # Cue 列表当前显示的 Cue（iid -> Cue），随 _refresh_cue_list 重建
+        self._cues_by_id: Dict[str, Cue] = {}
+        # 尚未插入 Cue 列表的行及下一批插入的 after 任务
+        self._cue_fill_rows: Optional[Iterator[Tuple[str, tuple]]] = None
+        self._cue_fill_after: Optional[str] = None
+        
+        # 编辑对话框首次打开时创建，之后隐藏复用
+        self._cue_dialog: Optional[CueEditDialog] = None
+        self._audio_dialog: Optional[AudioEditDialog] = None
+        self._volume_dialog: Optional[BatchVolumeDialog] = None
+        self._silence_dialog: Optional[BatchSilenceDialog] = None
+        
         self._create_menu()
         self._create_widgets()
         self._bind_events()
@@ -584,9 +1178,32 @@ class ConfigEditor(tk.Tk):
     def _bind_events(self):
         """绑定事件"""
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind("<Configure>", self._on_configure)
         self.cue_tree.bind("<Double-1>", lambda e: self._edit_cue())
         self.audio_listbox.bind("<Double-1>", lambda e: self._edit_audio())
     
+    def _on_configure(self, event):
+        """记录主窗口位置和大小"""
+        # 绑定在根窗口上时子组件的 <Configure> 也会传到这里
+        if event.widget is self:
+            self._geom = (event.x, event.y, event.width, event.height)
+    
+    def _centered_geometry(self, width: int, height: int) -> str:
+        """计算在主窗口中居中显示的对话框几何字符串
+        
+        Args:
+            width: 对话框宽度
+            height: 对话框高度
+            
+        Returns:
+            "宽x高+x+y" 格式的几何字符串
+        """
+        if self._geom is None:
+            self._geom = (self.winfo_x(), self.winfo_y(),
+                          self.winfo_width(), self.winfo_height())
+        x, y, w, h = self._geom
+        return f"{width}x{height}+{x + (w - width) // 2}+{y + (h - height) // 2}"
+    
     def _update_title(self):
         """更新窗口标题"""
         title = "Cue 列表配置编辑器"
@@ -599,41 +1216,165 @@ class ConfigEditor(tk.Tk):
     def _set_modified(self, modified: bool = True):
         """设置修改状态"""
         self.modified = modified
+        if self._refresh_suspended:
+            self._pending_refresh.add("title")
+            return
         self._update_title()
     
+    @contextmanager
+    def _suspend_refresh(self):
+        """暂停界面刷新
+        
+        上下文内的 _set_modified / _refresh_* 调用只记录待刷新项，
+        退出时每项只刷新一次。
+        """
+        self._refresh_suspended = True
+        try:
+            yield
+        finally:
+            self._refresh_suspended = False
+            pending = self._pending_refresh
+            self._pending_refresh = set()
+            if "audio" in pending:
+                self._refresh_audio_list()
+            if "cue" in pending:
+                self._refresh_cue_list()
+            if "title" in pending:
+                self._update_title()
+    
     def _refresh_audio_list(self):
         """刷新音频列表"""
+        # 所有音频增删改都会经过这里，同时使下拉选项缓存失效
+        self._audio_choices = None
+        if self._refresh_suspended:
+            self._pending_refresh.add("audio")
+            return
         self.audio_listbox.delete(0, tk.END)
-        for audio in self.cue_manager.audio_files:
-            display = f"{audio.title} [{audio.track_type.upper()}]"
-            self.audio_listbox.insert(tk.END, display)
+        items = [f"{a.title} [{a.track_type.upper()}]" for a in self.cue_manager.iter_audio_files()]
+        if items:
+            # 一次调用插入全部条目
+            self.audio_listbox.insert(tk.END, *items)
     
     def _refresh_cue_list(self):
         """刷新 Cue 列表"""
-        # 清空列表
-        for item in self.cue_tree.get_children():
-            self.cue_tree.delete(item)
-        
-        # 添加 Cue
-        for i, cue in enumerate(self.cue_manager.cue_list):
-            # 获取音频标题
-            audio = self.cue_manager.get_audio_file(cue.audio_id)
-            audio_title = audio.title if audio else cue.audio_id
-            
+        if self._refresh_suspended:
+            self._pending_refresh.add("cue")
+            return
+        
+        # 取消上一次尚未完成的分批插入
+        if self._cue_fill_after is not None:
+            self.after_cancel(self._cue_fill_after)
+            self._cue_fill_after = None
+        
+        # 清空列表（一次调用删除全部行）
+        children = self.cue_tree.get_children()
+        if children:
+            self.cue_tree.delete(*children)
+        
+        titles = {a.id: a.title for a in self.cue_manager.iter_audio_files()}
+        cue_list = self.cue_manager.cue_list
+        self._cues_by_id = {cue.id: cue for cue in cue_list}
+        
+        # 首批立即插入，其余在之后的事件循环中分批插入，避免长列表卡住界面
+        self._cue_fill_rows = self._iter_cue_rows(cue_list, titles)
+        self._insert_cue_chunk()
+    
+    @staticmethod
+    def _iter_cue_rows(cue_list: List[Cue], titles: Dict[str, str]) -> Iterator[Tuple[str, tuple]]:
+        """生成 Cue 列表各行的 (iid, values)
+        
+        Args:
+            cue_list: Cue 列表
+            titles: 音频 ID -> 标题
+        """
+        for i, cue in enumerate(cue_list):
             # 格式化出点
             end_time_str = f"{cue.end_time:.1f}" if cue.end_time is not None else "结束"
             
-            values = (
+            yield cue.id, (
                 i + 1,
                 cue.label,
-                audio_title,
+                titles.get(cue.audio_id, cue.audio_id),
                 f"{cue.start_time:.1f}",
                 end_time_str,
                 f"{cue.silence_before:.1f}",
                 f"{cue.silence_after:.1f}",
                 f"{int(cue.volume * 100)}%"
             )
-            self.cue_tree.insert("", tk.END, iid=cue.id, values=values)
+    
+    def _insert_cue_chunk(self):
+        """插入一批 Cue 行，未插完时安排下一批"""
+        self._cue_fill_after = None
+        rows = self._cue_fill_rows
+        if rows is None:
+            return
+        
+        tree_insert = self.cue_tree.insert
+        count = 0
+        for iid, values in islice(rows, self._CUE_CHUNK):
+            tree_insert("", tk.END, iid=iid, values=values)
+            count += 1
+        
+        if count < self._CUE_CHUNK:
+            self._cue_fill_rows = None
+        else:
+            self._cue_fill_after = self.after(1, self._insert_cue_chunk)
+    
+    def _flush_cue_fill(self):
+        """立即插入所有剩余的 Cue 行
+        
+        按 iid 操作 Cue 行之前调用，确保目标行已存在。
+        """
+        rows = self._cue_fill_rows
+        if rows is None:
+            return
+        if self._cue_fill_after is not None:
+            self.after_cancel(self._cue_fill_after)
+            self._cue_fill_after = None
+        self._cue_fill_rows = None
+        
+        tree_insert = self.cue_tree.insert
+        for iid, values in rows:
+            tree_insert("", tk.END, iid=iid, values=values)
+    
+    def _update_cue_rows_audio_title(self, audio_id: str, title: str):
+        """更新引用指定音频的 Cue 行的音频标题列
+        
+        Args:
+            audio_id: 音频 ID
+            title: 新标题
+        """
+        self._flush_cue_fill()
+        for cue in self._cues_by_id.values():
+            if cue.audio_id == audio_id:
+                self.cue_tree.set(cue.id, "音频", title)
+    
+    def _update_cue_row(self, old: Cue, new: Cue):
+        """只更新 Cue 行中发生变化的列
+        
+        Args:
+            old: 修改前的 Cue
+            new: 修改后的 Cue
+        """
+        self._flush_cue_fill()
+        tree_set = self.cue_tree.set
+        iid = new.id
+        if new.label != old.label:
+            tree_set(iid, "标签", new.label)
+        if new.audio_id != old.audio_id:
+            audio = self.cue_manager.get_audio_file(new.audio_id)
+            tree_set(iid, "音频", audio.title if audio else new.audio_id)
+        if new.start_time != old.start_time:
+            tree_set(iid, "入点", f"{new.start_time:.1f}")
+        if new.end_time != old.end_time:
+            tree_set(iid, "出点", f"{new.end_time:.1f}" if new.end_time is not None else "结束")
+        if new.silence_before != old.silence_before:
+            tree_set(iid, "前静音", f"{new.silence_before:.1f}")
+        if new.silence_after != old.silence_after:
+            tree_set(iid, "后静音", f"{new.silence_after:.1f}")
+        if new.volume != old.volume:
+            tree_set(iid, "音量", f"{int(new.volume * 100)}%")
+        self._cues_by_id[iid] = new
     
     def _get_selected_cue_id(self) -> Optional[str]:
         """获取选中的 Cue ID"""
@@ -670,7 +1411,7 @@ class ConfigEditor(tk.Tk):
         filepath = filedialog.askopenfilename(
             parent=self,
             title="打开配置文件",
-            filetypes=[("JSON 文件", "*.json"), ("所有文件", "*.*")]
+            filetypes=self._JSON_FILETYPES
         )
         if filepath:
             try:
@@ -701,7 +1442,7 @@ class ConfigEditor(tk.Tk):
             parent=self,
             title="保存配置文件",
             defaultextension=".json",
-            filetypes=[("JSON 文件", "*.json"), ("所有文件", "*.*")]
+            filetypes=self._JSON_FILETYPES
         )
         if filepath:
             try:
@@ -717,7 +1458,7 @@ class ConfigEditor(tk.Tk):
         filepath = filedialog.askopenfilename(
             parent=self,
             title="导入 JSON 配置",
-            filetypes=[("JSON 文件", "*.json"), ("所有文件", "*.*")]
+            filetypes=self._JSON_FILETYPES
         )
         if filepath:
             try:
@@ -735,7 +1476,7 @@ class ConfigEditor(tk.Tk):
             parent=self,
             title="导出 JSON 配置",
             defaultextension=".json",
-            filetypes=[("JSON 文件", "*.json"), ("所有文件", "*.*")]
+            filetypes=self._JSON_FILETYPES
         )
         if filepath:
             try:
@@ -764,6 +1505,9 @@ class ConfigEditor(tk.Tk):
         if self.modified:
             if not self._confirm_discard():
                 return
+        if self._probe_job is not None:
+            self._probe_job.cancel.set()
+        self._duration_cache.close()
         self.destroy()
     
     # ========== 编辑操作 ==========
@@ -774,7 +1518,6 @@ class ConfigEditor(tk.Tk):
         
         dialog = tk.Toplevel(self)
         dialog.title("配置名称")
-        dialog.geometry("300x100")
         dialog.resizable(False, False)
         dialog.transient(self)
         dialog.grab_set()
@@ -802,24 +1545,58 @@ class ConfigEditor(tk.Tk):
         dialog.bind("<Return>", lambda e: on_ok())
         dialog.bind("<Escape>", lambda e: dialog.destroy())
         
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - dialog.winfo_width()) // 2
-        y = self.winfo_y() + (self.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
+        # 居中（尺寸已知，一次设置大小和位置）
+        dialog.geometry(self._centered_geometry(300, 100))
+    
+    # ========== 对话框 ==========
+    
+    def _show_cue_dialog(self, cue: Optional[Cue] = None) -> Optional[Cue]:
+        """显示 Cue 编辑对话框并等待结果
+        
+        Args:
+            cue: 要编辑的 Cue（None 表示新建）
+            
+        Returns:
+            编辑结果，取消则返回 None
+        """
+        if self._audio_choices is None:
+            audio_files = self.cue_manager.audio_files
+            self._audio_choices = (
+                [f"{a.title} ({a.id})" for a in audio_files],
+                [a.id for a in audio_files]
+            )
+        if self._cue_dialog is None:
+            self._cue_dialog = CueEditDialog(self, self._audio_choices, cue)
+        else:
+            self._cue_dialog.prepare(self._audio_choices, cue)
+        return self._cue_dialog.show()
+    
+    def _show_audio_dialog(self, audio: Optional[AudioTrack] = None) -> Optional[AudioTrack]:
+        """显示音频编辑对话框并等待结果
+        
+        Args:
+            audio: 要编辑的音频（None 表示新建）
+            
+        Returns:
+            编辑结果，取消则返回 None
+        """
+        if self._audio_dialog is None:
+            self._audio_dialog = AudioEditDialog(self, audio)
+        else:
+            self._audio_dialog.prepare(audio)
+        return self._audio_dialog.show()
     
     # ========== 音频操作 ==========
     
     def _add_audio(self):
         """添加音频"""
-        dialog = AudioEditDialog(self)
-        self.wait_window(dialog)
+        result = self._show_audio_dialog()
         
-        if dialog.result:
-            self.cue_manager.add_audio_file(dialog.result)
+        if result:
+            self.cue_manager.add_audio_file(result)
             self._set_modified(True)
             self._refresh_audio_list()
-            self.status_var.set(f"已添加音频: {dialog.result.title}")
+            self.status_var.set(f"已添加音频: {result.title}")
     
     def _edit_audio(self):
         """编辑音频"""
@@ -833,24 +1610,25 @@ class ConfigEditor(tk.Tk):
             return
         
         audio = audio_list[index]
-        dialog = AudioEditDialog(self, audio)
-        self.wait_window(dialog)
+        result = self._show_audio_dialog(audio)
         
-        if dialog.result:
+        if result:
             # 更新音频（通过删除再添加）
             self.cue_manager.remove_audio_file(audio.id)
             # 保持原 ID
             updated_audio = AudioTrack(
                 id=audio.id,
-                file_path=dialog.result.file_path,
-                duration=dialog.result.duration,
-                title=dialog.result.title,
-                track_type=dialog.result.track_type
+                file_path=result.file_path,
+                duration=result.duration,
+                title=result.title,
+                track_type=result.track_type
             )
             self.cue_manager._audio_files.insert(index, updated_audio)
             self._set_modified(True)
             self._refresh_audio_list()
-            self._refresh_cue_list()
+            # 只有标题变化才影响 Cue 列表，且只需更新引用该音频的行
+            if updated_audio.title != audio.title:
+                self._update_cue_rows_audio_title(audio.id, updated_audio.title)
             self.status_var.set(f"已更新音频: {updated_audio.title}")
     
     def _delete_audio(self):
@@ -867,11 +1645,11 @@ class ConfigEditor(tk.Tk):
         audio = audio_list[index]
         
         # 检查是否有 Cue 使用此音频
-        using_cues = [c for c in self.cue_manager.cue_list if c.audio_id == audio.id]
-        if using_cues:
+        using_count = sum(1 for c in self.cue_manager.iter_cues() if c.audio_id == audio.id)
+        if using_count:
             messagebox.showwarning(
                 "无法删除",
-                f"有 {len(using_cues)} 个 Cue 正在使用此音频，请先删除相关 Cue。",
+                f"有 {using_count} 个 Cue 正在使用此音频，请先删除相关 Cue。",
                 parent=self
             )
             return
@@ -890,14 +1668,13 @@ class ConfigEditor(tk.Tk):
             messagebox.showinfo("提示", "请先添加音频文件", parent=self)
             return
         
-        dialog = CueEditDialog(self, self.cue_manager.audio_files)
-        self.wait_window(dialog)
+        result = self._show_cue_dialog()
         
-        if dialog.result:
-            self.cue_manager.add_cue(dialog.result)
+        if result:
+            self.cue_manager.add_cue(result)
             self._set_modified(True)
             self._refresh_cue_list()
-            self.status_var.set(f"已添加 Cue: {dialog.result.label}")
+            self.status_var.set(f"已添加 Cue: {result.label}")
     
     def _edit_cue(self):
         """编辑 Cue"""
@@ -906,28 +1683,29 @@ class ConfigEditor(tk.Tk):
             messagebox.showinfo("提示", "请先选择要编辑的 Cue", parent=self)
             return
         
-        cue = self.cue_manager.get_cue_by_id(cue_id)
+        cue = self._cues_by_id.get(cue_id)
         if not cue:
             return
         
-        dialog = CueEditDialog(self, self.cue_manager.audio_files, cue)
-        self.wait_window(dialog)
+        result = self._show_cue_dialog(cue)
         
-        if dialog.result:
+        if result:
             # 更新 Cue
             self.cue_manager.update_cue(
                 cue_id,
-                audio_id=dialog.result.audio_id,
-                start_time=dialog.result.start_time,
-                end_time=dialog.result.end_time,
-                silence_before=dialog.result.silence_before,
-                silence_after=dialog.result.silence_after,
-                volume=dialog.result.volume,
-                label=dialog.result.label
+                audio_id=result.audio_id,
+                start_time=result.start_time,
+                end_time=result.end_time,
+                silence_before=result.silence_before,
+                silence_after=result.silence_after,
+                volume=result.volume,
+                label=result.label
             )
             self._set_modified(True)
-            self._refresh_cue_list()
-            self.status_var.set(f"已更新 Cue: {dialog.result.label}")
+            updated = self.cue_manager.get_cue_by_id(cue_id)
+            if updated:
+                self._update_cue_row(cue, updated)
+            self.status_var.set(f"已更新 Cue: {result.label}")
     
     def _delete_cue(self):
         """删除 Cue"""
@@ -936,7 +1714,7 @@ class ConfigEditor(tk.Tk):
             messagebox.showinfo("提示", "请先选择要删除的 Cue", parent=self)
             return
         
-        cue = self.cue_manager.get_cue_by_id(cue_id)
+        cue = self._cues_by_id.get(cue_id)
         if not cue:
             return
         
@@ -961,6 +1739,7 @@ class ConfigEditor(tk.Tk):
             self._set_modified(True)
             self._refresh_cue_list()
             # 保持选中
+            self._flush_cue_fill()
             self.cue_tree.selection_set(cue_id)
             self.cue_tree.see(cue_id)
             self.status_var.set("已上移 Cue")
@@ -980,6 +1759,7 @@ class ConfigEditor(tk.Tk):
             self._set_modified(True)
             self._refresh_cue_list()
             # 保持选中
+            self._flush_cue_fill()
             self.cue_tree.selection_set(cue_id)
             self.cue_tree.see(cue_id)
             self.status_var.set("已下移 Cue")
@@ -987,74 +1767,226 @@ class ConfigEditor(tk.Tk):
     # ========== 批量操作 ==========
     
     def _batch_add_audio(self):
-        """批量添加音频文件"""
-        filetypes = [
-            ("音频文件", "*.mp3 *.m4a *.wav *.ogg"),
-            ("所有文件", "*.*")
-        ]
+        """批量添加音频文件
+        
+        时长在工作线程中读取，主线程每 50ms 取一次结果；
+        超过 200ms 仍未完成时显示可取消的进度对话框。
+        """
+        if self._probe_job is not None:
+            # 上一批仍在读取时长
+            self.status_var.set("上一批音频仍在读取时长，请等待完成或取消后再添加")
+            return
+        
         filepaths = filedialog.askopenfilenames(
             parent=self,
             title="选择音频文件（可多选）",
-            filetypes=filetypes
+            filetypes=AudioEditDialog._FILETYPES
         )
         
         if not filepaths:
             return
         
-        added_count = 0
+        # 不支持的扩展名在读取时长前直接跳过，统一提示一次
+        valid: List[str] = []
+        skipped: List[str] = []
         for filepath in filepaths:
+            if os.path.splitext(filepath)[1].lower() in _AUDIO_EXTENSIONS:
+                valid.append(filepath)
+            else:
+                skipped.append(os.path.basename(filepath))
+        if skipped:
+            msg = f"以下 {len(skipped)} 个文件不是支持的音频格式，已跳过:\n"
+            msg += "\n".join(skipped[:10])
+            if len(skipped) > 10:
+                msg += f"\n... 等共 {len(skipped)} 个"
+            messagebox.showwarning("跳过文件", msg, parent=self)
+        if not valid:
+            return
+        filepaths = valid
+        
+        # 先查持久化缓存，文件未变化时只需 stat()
+        results: List[Tuple[float, Optional[Exception]]] = []
+        misses: List[Tuple[int, int, int]] = []  # (序号, mtime_ns, size)
+        for i, filepath in enumerate(filepaths):
             try:
-                # 获取文件信息
-                filename = os.path.basename(filepath)
-                name_without_ext = os.path.splitext(filename)[0]
-                
-                # 获取音频时长
-                duration = self._get_audio_duration_static(filepath)
+                st = os.stat(filepath)
+            except OSError:
+                # 无法读取的文件按时长 0 添加，与探测失败时一致
+                results.append((0.0, None))
+                continue
+            if st.st_size == 0:
+                # 空文件无需读取
+                results.append((0.0, None))
+                continue
+            cached = self._duration_cache.get(filepath, st.st_mtime_ns, st.st_size)
+            if cached is None:
+                misses.append((i, st.st_mtime_ns, st.st_size))
+            results.append((cached or 0.0, None))
+        
+        if not misses:
+            self._finish_batch_add_audio(filepaths, results)
+            return
+        
+        # 在工作线程中读取未命中文件的时长
+        job = _AudioProbeJob(filepaths, results, misses)
+        self._probe_job = job
+        threading.Thread(
+            target=self._probe_worker,
+            args=([filepaths[i] for i, _, _ in misses], job.queue, job.cancel),
+            daemon=True
+        ).start()
+        self.status_var.set(f"正在读取音频时长 0/{len(misses)}...")
+        job.show_after_id = self.after(200, self._show_probe_progress)
+        self.after(50, self._drain_probe_queue)
+    
+    @staticmethod
+    def _probe_worker(filepaths: List[str], out_queue: queue.Queue,
+                      cancel: threading.Event) -> None:
+        """工作线程：并发读取音频时长并把结果放入队列
+        
+        Args:
+            filepaths: 需要读取的文件
+            out_queue: 结果队列，放入 (序号, 时长, 异常)，结束时放入 None
+            cancel: 取消标志，每完成一个文件检查一次
+        """
+        # 不使用 with：退出时的 shutdown(wait=True) 会等正在读取的文件全部结束
+        executor = ThreadPoolExecutor(max_workers=min(16, len(filepaths)))
+        try:
+            futures = {
+                executor.submit(_probe_audio_duration, fp): n
+                for n, fp in enumerate(filepaths)
+            }
+            for future in as_completed(futures):
+                if cancel.is_set():
+                    break
+                error = future.exception()
+                duration = 0.0 if error is not None else future.result()
+                out_queue.put((futures[future], duration, error))
+        finally:
+            # 取消时丢弃排队中的文件，正在读取的文件在后台自行结束
+            executor.shutdown(wait=False, cancel_futures=True)
+            out_queue.put(None)
+    
+    def _show_probe_progress(self):
+        """读取时长超过 200ms 时显示进度对话框"""
+        job = self._probe_job
+        if job is None:
+            return
+        job.show_after_id = None
+        
+        dialog = tk.Toplevel(self)
+        dialog.title("批量添加音频")
+        dialog.resizable(False, False)
+        dialog.transient(self)
+        dialog.protocol("WM_DELETE_WINDOW", job.cancel.set)
+        
+        frame = ttk.Frame(dialog, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text=f"正在读取 {len(job.misses)} 个音频文件的时长...").pack(anchor=tk.W)
+        job.progress_var = tk.IntVar(dialog, value=job.done)
+        ttk.Progressbar(
+            frame, maximum=len(job.misses), variable=job.progress_var, length=280
+        ).pack(fill=tk.X, pady=10)
+        ttk.Button(frame, text="取消", command=job.cancel.set, width=8).pack()
+        
+        dialog.geometry(self._centered_geometry(320, 120))
+        dialog.grab_set()
+        job.dialog = dialog
+    
+    def _drain_probe_queue(self):
+        """在主线程中取出工作线程的结果，全部完成后添加音频"""
+        job = self._probe_job
+        if job is None:
+            return
+        
+        finished = False
+        try:
+            while True:
+                item = job.queue.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                n, duration, error = item
+                i, mtime_ns, size = job.misses[n]
+                if error is not None:
+                    job.results[i] = (0.0, error)
+                else:
+                    job.results[i] = (duration, None)
+                    if duration > 0:
+                        job.new_rows.append((job.filepaths[i], mtime_ns, size, duration))
+                job.done += 1
+        except queue.Empty:
+            pass
+        
+        # 取消后立即结束任务，不等待工作线程中仍在读取的文件
+        if job.cancel.is_set():
+            finished = True
+        
+        if job.progress_var is not None:
+            job.progress_var.set(job.done)
+        if not finished:
+            self.status_var.set(f"正在读取音频时长 {job.done}/{len(job.misses)}...")
+            self.after(50, self._drain_probe_queue)
+            return
+        
+        # 任务结束，关闭进度对话框
+        self._probe_job = None
+        if job.show_after_id is not None:
+            self.after_cancel(job.show_after_id)
+        if job.dialog is not None:
+            job.dialog.grab_release()
+            job.dialog.destroy()
+        
+        # 新结果在一个事务中写入缓存（取消时也保留已读取的部分）
+        self._duration_cache.put_many(job.new_rows)
+        
+        if job.cancel.is_set():
+            self.status_var.set("已取消批量添加音频")
+            return
+        self._finish_batch_add_audio(job.filepaths, job.results)
+    
+    def _finish_batch_add_audio(self, filepaths: List[str],
+                                results: List[Tuple[float, Optional[Exception]]]):
+        """根据读取到的时长创建音频轨道并一次性添加
+        
+        Args:
+            filepaths: 选中的全部文件
+            results: 每个文件的 (时长, 异常)
+        """
+        new_audios: List[AudioTrack] = []
+        for filepath, (duration, error) in zip(filepaths, results):
+            # 获取文件信息（每个文件只计算一次）
+            filename = os.path.basename(filepath)
+            name_without_ext = os.path.splitext(filename)[0]
+            try:
+                if error is not None:
+                    raise error
                 
                 # 创建音频轨道
                 audio = AudioTrack(
-                    id=f"audio_{uuid.uuid4().hex[:8]}",
+                    id=_new_audio_id(),
                     file_path=filepath,
                     duration=duration,
                     title=name_without_ext,
                     track_type="bgm"
                 )
                 
-                self.cue_manager.add_audio_file(audio)
-                added_count += 1
+                new_audios.append(audio)
             except Exception as e:
                 messagebox.showwarning(
                     "添加失败",
-                    f"无法添加文件 {os.path.basename(filepath)}:\n{e}",
+                    f"无法添加文件 {filename}:\n{e}",
                     parent=self
                 )
         
+        self.cue_manager.add_audio_files(new_audios)
+        added_count = len(new_audios)
         if added_count > 0:
             self._set_modified(True)
             self._refresh_audio_list()
             self.status_var.set(f"已批量添加 {added_count} 个音频文件")
     
-    def _get_audio_duration_static(self, filepath: str) -> float:
-        """获取音频文件时长（静态方法）"""
-        try:
-            from mutagen import File as MutagenFile
-            audio = MutagenFile(filepath)
-            if audio is not None and audio.info:
-                return audio.info.length
-        except Exception:
-            pass
-        
-        try:
-            import pygame
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
-            sound = pygame.mixer.Sound(filepath)
-            return sound.get_length()
-        except Exception:
-            pass
-        
-        return 0.0
-    
     def _batch_delete_audio(self):
         """批量删除音频文件"""
         selection = self.audio_listbox.curselection()
@@ -1066,13 +1998,16 @@ class ConfigEditor(tk.Tk):
         to_delete = []
         blocked = []
         
+        # 一次遍历统计每个音频被多少个 Cue 使用
+        usage = Counter(c.audio_id for c in self.cue_manager.iter_cues())
+        
         for index in selection:
             if index < len(audio_list):
                 audio = audio_list[index]
                 # 检查是否有 Cue 使用此音频
-                using_cues = [c for c in self.cue_manager.cue_list if c.audio_id == audio.id]
-                if using_cues:
-                    blocked.append(f"{audio.title} (被 {len(using_cues)} 个 Cue 使用)")
+                using_count = usage.get(audio.id, 0)
+                if using_count:
+                    blocked.append(f"{audio.title} (被 {using_count} 个 Cue 使用)")
                 else:
                     to_delete.append(audio)
         
@@ -1095,11 +2030,10 @@ class ConfigEditor(tk.Tk):
             msg += "\n".join(blocked[:5])
         
         if messagebox.askyesno("确认批量删除", msg, parent=self):
-            for audio in to_delete:
-                self.cue_manager.remove_audio_file(audio.id)
-            
-            self._set_modified(True)
-            self._refresh_audio_list()
+            with self._suspend_refresh():
+                self.cue_manager.remove_audio_files(a.id for a in to_delete)
+                self._set_modified(True)
+                self._refresh_audio_list()
             self.status_var.set(f"已批量删除 {len(to_delete)} 个音频")
     
     def _get_selected_cue_ids(self) -> List[str]:
@@ -1113,8 +2047,7 @@ class ConfigEditor(tk.Tk):
             messagebox.showinfo("提示", "请先选择要删除的 Cue（可按住 Ctrl 多选）", parent=self)
             return
         
-        cues = [self.cue_manager.get_cue_by_id(cid) for cid in cue_ids]
-        cues = [c for c in cues if c is not None]
+        cues = [c for c in map(self._cues_by_id.get, cue_ids) if c is not None]
         
         if not cues:
             return
@@ -1125,11 +2058,10 @@ class ConfigEditor(tk.Tk):
             msg += f"\n... 等共 {len(cues)} 个"
         
         if messagebox.askyesno("确认批量删除", msg, parent=self):
-            for cue_id in cue_ids:
-                self.cue_manager.remove_cue(cue_id)
-            
-            self._set_modified(True)
-            self._refresh_cue_list()
+            with self._suspend_refresh():
+                self.cue_manager.remove_cues(cue_ids)
+                self._set_modified(True)
+                self._refresh_cue_list()
             self.status_var.set(f"已批量删除 {len(cues)} 个 Cue")
     
     def _batch_set_volume(self):
@@ -1139,53 +2071,19 @@ class ConfigEditor(tk.Tk):
             messagebox.showinfo("提示", "请先选择要修改的 Cue（可按住 Ctrl 多选）", parent=self)
             return
         
-        # 创建音量设置对话框
-        dialog = tk.Toplevel(self)
-        dialog.title("批量设置音量")
-        dialog.geometry("300x120")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        frame = ttk.Frame(dialog, padding=15)
-        frame.pack(fill=tk.BOTH, expand=True)
-        
-        ttk.Label(frame, text=f"为选中的 {len(cue_ids)} 个 Cue 设置音量:").pack(anchor=tk.W)
-        
-        volume_frame = ttk.Frame(frame)
-        volume_frame.pack(fill=tk.X, pady=10)
-        
-        volume_var = tk.DoubleVar(value=1.0)
-        volume_scale = ttk.Scale(volume_frame, from_=0.0, to=1.0, variable=volume_var,
-                                 orient=tk.HORIZONTAL, length=180)
-        volume_scale.pack(side=tk.LEFT)
-        
-        volume_label = ttk.Label(volume_frame, text="100%", width=6)
-        volume_label.pack(side=tk.LEFT, padx=5)
-        
-        def update_label(*args):
-            volume_label.config(text=f"{int(volume_var.get() * 100)}%")
-        volume_var.trace_add("write", update_label)
+        if self._volume_dialog is None:
+            self._volume_dialog = BatchVolumeDialog(self, len(cue_ids))
+        else:
+            self._volume_dialog.prepare(len(cue_ids))
+        volume = self._volume_dialog.show()
+        if volume is None:
+            return
         
-        def on_ok():
-            volume = volume_var.get()
-            for cue_id in cue_ids:
-                self.cue_manager.update_cue(cue_id, volume=volume)
+        with self._suspend_refresh():
+            self.cue_manager.update_cues({cid: {"volume": volume} for cid in cue_ids})
             self._set_modified(True)
             self._refresh_cue_list()
-            self.status_var.set(f"已为 {len(cue_ids)} 个 Cue 设置音量为 {int(volume * 100)}%")
-            dialog.destroy()
-        
-        btn_frame = ttk.Frame(frame)
-        btn_frame.pack(pady=5)
-        ttk.Button(btn_frame, text="确定", command=on_ok, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="取消", command=dialog.destroy, width=8).pack(side=tk.LEFT)
-        
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - dialog.winfo_width()) // 2
-        y = self.winfo_y() + (self.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
+        self.status_var.set(f"已为 {len(cue_ids)} 个 Cue 设置音量为 {int(volume * 100)}%")
     
     def _batch_set_silence(self):
         """批量设置 Cue 静音间隔"""
@@ -1194,66 +2092,23 @@ class ConfigEditor(tk.Tk):
             messagebox.showinfo("提示", "请先选择要修改的 Cue（可按住 Ctrl 多选）", parent=self)
             return
         
-        # 创建静音设置对话框
-        dialog = tk.Toplevel(self)
-        dialog.title("批量设置静音间隔")
-        dialog.geometry("320x180")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        frame = ttk.Frame(dialog, padding=15)
-        frame.pack(fill=tk.BOTH, expand=True)
-        
-        ttk.Label(frame, text=f"为选中的 {len(cue_ids)} 个 Cue 设置静音间隔:").pack(anchor=tk.W)
-        
-        # 前置静音
-        before_frame = ttk.Frame(frame)
-        before_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(before_frame, text="前置静音 (秒):").pack(side=tk.LEFT)
-        before_var = tk.StringVar(value="0.0")
-        ttk.Entry(before_frame, textvariable=before_var, width=10).pack(side=tk.LEFT, padx=5)
-        
-        # 后置静音
-        after_frame = ttk.Frame(frame)
-        after_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(after_frame, text="后置静音 (秒):").pack(side=tk.LEFT)
-        after_var = tk.StringVar(value="0.0")
-        ttk.Entry(after_frame, textvariable=after_var, width=10).pack(side=tk.LEFT, padx=5)
-        
-        def on_ok():
-            try:
-                silence_before = float(before_var.get() or "0")
-                silence_after = float(after_var.get() or "0")
-                
-                if silence_before < 0 or silence_after < 0:
-                    messagebox.showerror("错误", "静音时间不能为负数", parent=dialog)
-                    return
-                
-                for cue_id in cue_ids:
-                    self.cue_manager.update_cue(
-                        cue_id,
-                        silence_before=silence_before,
-                        silence_after=silence_after
-                    )
-                
-                self._set_modified(True)
-                self._refresh_cue_list()
-                self.status_var.set(f"已为 {len(cue_ids)} 个 Cue 设置静音间隔")
-                dialog.destroy()
-            except ValueError:
-                messagebox.showerror("错误", "请输入有效的数字", parent=dialog)
+        if self._silence_dialog is None:
+            self._silence_dialog = BatchSilenceDialog(self, len(cue_ids))
+        else:
+            self._silence_dialog.prepare(len(cue_ids))
+        result = self._silence_dialog.show()
+        if result is None:
+            return
         
-        btn_frame = ttk.Frame(frame)
-        btn_frame.pack(pady=10)
-        ttk.Button(btn_frame, text="确定", command=on_ok, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="取消", command=dialog.destroy, width=8).pack(side=tk.LEFT)
-        
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - dialog.winfo_width()) // 2
-        y = self.winfo_y() + (self.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
+        silence_before, silence_after = result
+        with self._suspend_refresh():
+            self.cue_manager.update_cues({
+                cid: {"silence_before": silence_before, "silence_after": silence_after}
+                for cid in cue_ids
+            })
+            self._set_modified(True)
+            self._refresh_cue_list()
+        self.status_var.set(f"已为 {len(cue_ids)} 个 Cue 设置静音间隔")
 
 
 def main():
@@ -0,0 +1,31 @@
+"""pytest 公共配置
+
+安装 pytest-xdist 后可并行运行属性测试：
+
+    pytest -n auto
+
+控制器等模块级共用实例在每个进程中各自创建，测试之间无需分组；
+hypothesis 样例数据库按目录存储，多进程同时读写是安全的，
+各测试文件中显式设置 database=None 的测试则完全不读写数据库。
+"""
+import os
+
+from hypothesis import Phase, settings
+
+
+# hypothesis 配置档：本地默认 dev，CI 中设置环境变量 HYP_PROFILE=ci
+# max_examples 仅影响未显式指定的测试（往返、完整性等属性）；
+# CI 中使用固定种子、只生成样例，不读写样例数据库、不做失败缩减（本地 dev 保留缩减便于调试）
+settings.register_profile(
+    "ci",
+    max_examples=30,
+    derandomize=True,
+    database=None,
+    phases=[Phase.explicit, Phase.generate]
+)
+settings.register_profile("dev", max_examples=20)
+# 回归档：只重放显式样例和样例数据库中记录过的失败样例，不生成新样例，
+# 用于提交前快速确认已修复的问题没有复发（HYP_PROFILE=regress）；
+# 没有可重放样例的测试会被标记为 skipped，显式设置 database=None 的测试只运行 @example
+settings.register_profile("regress", phases=[Phase.explicit, Phase.reuse])
+settings.load_profile(os.getenv("HYP_PROFILE", "dev"))
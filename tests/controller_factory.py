@@ -0,0 +1,100 @@
+"""测试用 CoreController 工厂
+
+控制器与 API 属性测试共用：不经过 __init__ 创建控制器，换上模拟音频引擎和固定时钟，
+并在各样例之间复用同一个实例、只重置状态。
+"""
+import threading
+from typing import Callable
+
+from src.core.controller import CoreController, PlayMode, EventType
+from src.core.cue_manager import CueManager
+from src.core.breakpoint_manager import BreakpointManager
+
+
+# 测试均为单线程，控制器共用同一把操作锁
+_TEST_LOCK = threading.Lock()
+# 固定时钟的当前时间，播放位置计算结果与真实时间无关
+FROZEN_NOW = 1000.0
+
+
+def frozen_clock() -> float:
+    """固定时钟"""
+    return FROZEN_NOW
+
+
+def build_controller(audio_engine) -> CoreController:
+    """创建控制器实例（不经过 __init__，使用给定的模拟音频引擎）
+
+    Args:
+        audio_engine: 模拟音频引擎，需提供 reset() 恢复初始状态
+
+    Returns:
+        已重置状态的控制器
+    """
+    # 直接分配实例，绕过单例缓存，不读写 CoreController._instance
+    ctrl = object.__new__(CoreController)
+    ctrl._initialized = False
+    ctrl._audio_engine = audio_engine
+    ctrl._cue_manager = CueManager()
+    ctrl._breakpoint_manager = BreakpointManager()
+    ctrl._operation_lock = _TEST_LOCK
+    ctrl._clock = frozen_clock
+    ctrl._listeners = {event_type: [] for event_type in EventType}
+    reset_controller(ctrl)
+    ctrl._initialized = True
+    return ctrl
+
+
+def reset_controller(ctrl: CoreController) -> None:
+    """把控制器恢复到刚创建时的状态"""
+    ctrl._audio_engine.reset()
+    ctrl._cue_manager.clear_cues()
+    ctrl._cue_manager._audio_files.clear()
+    ctrl._breakpoint_manager.clear()
+    for listeners in ctrl._listeners.values():
+        listeners.clear()
+
+    # 初始化状态
+    ctrl._mode = PlayMode.AUTO
+    ctrl._is_playing = False
+    ctrl._is_paused = False
+    ctrl._current_audio_id = None
+    ctrl._current_position = 0.0
+    ctrl._bgm_volume = 1.0
+    ctrl._sfx_volume = 1.0
+    ctrl._in_silence = False
+    ctrl._silence_remaining = 0.0
+    ctrl._silence_start_time = None
+    ctrl._silence_duration = 0.0
+    ctrl._manual_audio = None
+    ctrl._manual_start_pos = 0.0
+    ctrl._manual_silence_before = 0.0
+    ctrl._paused_audio_id = None
+    ctrl._paused_position = 0.0
+    ctrl._local_priority = True
+    ctrl._pending_remote_ops = []
+    ctrl._playback_start_time = None
+    ctrl._playback_start_position = 0.0
+
+
+def make_controller_getter(engine_factory: Callable) -> Callable[[], CoreController]:
+    """生成按需创建、跨测试样例复用控制器的获取函数
+
+    Args:
+        engine_factory: 创建模拟音频引擎的无参函数，只在首次获取时调用
+
+    Returns:
+        get_controller 函数，每次调用返回已重置状态的同一个控制器
+    """
+    controller = None
+
+    def get_controller() -> CoreController:
+        """获取已重置状态的控制器实例（跨测试样例复用）"""
+        nonlocal controller
+        if controller is None:
+            controller = build_controller(engine_factory())
+        else:
+            reset_controller(controller)
+        return controller
+
+    return get_controller
@@ -3,26 +3,30 @@
 使用 hypothesis 进行属性测试，验证 API 服务器的正确性属性。
 """
 import asyncio
+from math import isclose
 import pytest
-from hypothesis import given, strategies as st, settings, assume, HealthCheck
+from hypothesis import given, strategies as st, settings, assume
 import time
-import threading
 import json
-from unittest.mock import MagicMock, AsyncMock, patch
 from aiohttp import web
 from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 
-from src.core.controller import CoreController, PlayMode, EventType
-from src.core.cue_manager import CueManager
-from src.core.breakpoint_manager import BreakpointManager
+from src.core.controller import PlayMode
 from src.models.audio_track import AudioTrack
 from src.models.cue import Cue
 from src.models.playback_state import PlaybackState
 from src.api.server import APIServer
+from tests.controller_factory import FROZEN_NOW, make_controller_getter
 
 
 # ==================== 测试策略 ====================
 
+# 字母和数字字符（ID 文本共用，只构造一次）
+_ALPHANUM = st.characters(whitelist_categories=('L', 'N'))
+_MAYBE_EMPTY_ID_TEXT = st.text(min_size=0, max_size=20, alphabet=_ALPHANUM)
+_ID_TEXT = st.text(min_size=1, max_size=20, alphabet=_ALPHANUM)
+_SHORT_ID_TEXT = st.text(min_size=1, max_size=10, alphabet=_ALPHANUM)
+
 @st.composite
 def volume_strategy(draw):
     """生成有效的音量值"""
@@ -46,7 +50,7 @@ def playback_state_strategy(draw):
         "mode": mode,
         "is_playing": is_playing,
         "is_paused": is_paused,
-        "current_audio_id": draw(st.text(min_size=0, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N')))) if is_playing else None,
+        "current_audio_id": draw(_MAYBE_EMPTY_ID_TEXT) if is_playing else None,
         "current_position": draw(position_strategy()) if is_playing else 0.0,
         "current_cue_index": draw(st.integers(min_value=0, max_value=100)),
         "bgm_volume": draw(volume_strategy()),
@@ -56,13 +60,32 @@ def playback_state_strategy(draw):
     }
 
 
-@st.composite
-def audio_track_strategy(draw):
-    """生成有效的音频轨道"""
-    audio_id = draw(st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N'))))
+def _track(audio_id, duration=100.0, title=None, track_type="bgm"):
+    """创建测试用音频轨道，文件路径由 ID 生成
+    
+    Args:
+        audio_id: 音频 ID
+        duration: 时长（秒）
+        title: 标题，默认为 "Audio <ID>"
+        track_type: 轨道类型
+        
+    Returns:
+        音频轨道对象
+    """
     return AudioTrack(
         id=audio_id,
         file_path=f"/fake/path/{audio_id}.mp3",
+        duration=duration,
+        title=f"Audio {audio_id}" if title is None else title,
+        track_type=track_type
+    )
+
+
+@st.composite
+def audio_track_strategy(draw):
+    """生成有效的音频轨道"""
+    return _track(
+        draw(_ID_TEXT),
         duration=draw(st.floats(min_value=1.0, max_value=600.0, allow_nan=False, allow_infinity=False)),
         title=draw(st.text(min_size=1, max_size=50)),
         track_type=draw(st.sampled_from(["bgm", "sfx"]))
@@ -75,6 +98,10 @@ class MockAudioEngine:
     """模拟音频引擎，用于测试"""
     
     def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        """恢复初始状态"""
         self._bgm_playing = False
         self._bgm_paused = False
         self._bgm_position = 0.0
@@ -144,7 +171,7 @@ class MockAudioEngine:
         return sfx_id in self._playing_sfx
     
     def get_playing_sfx_ids(self):
-        return list(self._playing_sfx.keys())
+        return list(self._playing_sfx)
     
     def set_bgm_volume(self, volume: float) -> None:
         self._bgm_volume = max(0.0, min(1.0, volume))
@@ -173,55 +200,30 @@ class MockAudioEngine:
 
 # ==================== 工厂函数 ====================
 
-def create_controller():
-    """创建新的控制器实例"""
-    # 重置单例
-    CoreController._instance = None
-    
-    mock_engine = MockAudioEngine()
-    cue_manager = CueManager()
-    breakpoint_manager = BreakpointManager()
-    
-    # 创建新实例
-    ctrl = CoreController.__new__(CoreController)
-    ctrl._initialized = False
-    ctrl._audio_engine = mock_engine
-    ctrl._cue_manager = cue_manager
-    ctrl._breakpoint_manager = breakpoint_manager
-    
-    # 初始化状态
-    ctrl._mode = PlayMode.AUTO
-    ctrl._is_playing = False
-    ctrl._is_paused = False
-    ctrl._current_audio_id = None
-    ctrl._current_position = 0.0
-    ctrl._bgm_volume = 1.0
-    ctrl._sfx_volume = 1.0
-    ctrl._in_silence = False
-    ctrl._silence_remaining = 0.0
-    ctrl._silence_start_time = None
-    ctrl._silence_duration = 0.0
-    ctrl._manual_audio = None
-    ctrl._manual_start_pos = 0.0
-    ctrl._manual_silence_before = 0.0
-    ctrl._operation_lock = threading.Lock()
-    ctrl._local_priority = True
-    ctrl._pending_remote_ops = []
-    ctrl._listeners = {event_type: [] for event_type in EventType}
-    ctrl._playback_start_time = None
-    ctrl._playback_start_position = 0.0
-    ctrl._initialized = True
-    
-    return ctrl
+# 所有测试共用的控制器实例，每次获取时重置状态
+get_controller = make_controller_getter(MockAudioEngine)
+
+
+# 模块内共用的事件循环，避免每次调用都创建新循环
+_TEST_LOOP = asyncio.new_event_loop()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def close_test_loop():
+    """模块结束时关闭事件循环"""
+    yield
+    _TEST_LOOP.close()
 
 
 def run_async(coro):
     """运行异步函数"""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return _TEST_LOOP.run_until_complete(coro)
+
+
+# 共用的 hypothesis 设置（控制器为模块级复用，无需再屏蔽 function_scoped_fixture 检查）
+_FAST = settings(max_examples=100, deadline=None)
+# 单一状态维度的属性，取样空间小，使用固定种子
+_AXIS = settings(_FAST, max_examples=30, derandomize=True)
 
 
 # ==================== Property 26: API 状态查询一致性 ====================
@@ -234,47 +236,27 @@ class TestAPIStateQueryConsistencyProperty:
     **Validates: Requirements 14.5**
     """
     
+    # 各状态维度互不影响，分开验证，每个属性只在自己的输入维度上取样
+    
     @given(
         mode=st.sampled_from(["auto", "manual"]),
-        is_playing=st.booleans(),
-        bgm_volume=volume_strategy(),
-        sfx_volume=volume_strategy(),
-        current_cue_index=st.integers(min_value=0, max_value=100),
-        in_silence=st.booleans(),
-        silence_remaining=st.floats(min_value=0.0, max_value=10.0, allow_nan=False, allow_infinity=False)
+        is_playing=st.booleans()
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_api_state_matches_controller_state(
-        self,
-        mode,
-        is_playing,
-        bgm_volume,
-        sfx_volume,
-        current_cue_index,
-        in_silence,
-        silence_remaining
-    ):
-        """API 返回的状态应与控制器实际状态一致"""
-        controller = create_controller()
+    @_AXIS
+    def test_mode_roundtrip(self, mode, is_playing):
+        """API 返回的模式和播放状态应与控制器一致"""
+        controller = get_controller()
         
         # 设置控制器状态
         controller._mode = PlayMode.AUTO if mode == "auto" else PlayMode.MANUAL
         controller._is_playing = is_playing
         controller._is_paused = False
-        controller._bgm_volume = bgm_volume
-        controller._sfx_volume = sfx_volume
-        controller._cue_manager._current_index = current_cue_index
-        controller._in_silence = in_silence
-        controller._silence_remaining = silence_remaining
         
         if is_playing:
             controller._current_audio_id = "test_audio"
             controller._current_position = 10.0
-            controller._playback_start_time = time.time()
+            controller._playback_start_time = FROZEN_NOW
             controller._playback_start_position = 10.0
-        else:
-            controller._current_audio_id = None
-            controller._current_position = 0.0
         
         # 获取状态
         state_dict = controller.get_state_dict()
@@ -284,23 +266,77 @@ class TestAPIStateQueryConsistencyProperty:
             f"Mode mismatch: expected {mode}, got {state_dict['mode']}"
         assert state_dict["is_playing"] == is_playing, \
             f"is_playing mismatch: expected {is_playing}, got {state_dict['is_playing']}"
-        assert abs(state_dict["bgm_volume"] - bgm_volume) < 0.001, \
+    
+    @given(
+        bgm_volume=volume_strategy(),
+        sfx_volume=volume_strategy()
+    )
+    @_AXIS
+    def test_volumes_roundtrip(self, bgm_volume, sfx_volume):
+        """API 返回的音量应与控制器一致"""
+        controller = get_controller()
+        
+        # 设置控制器状态
+        controller._bgm_volume = bgm_volume
+        controller._sfx_volume = sfx_volume
+        
+        # 获取状态
+        state_dict = controller.get_state_dict()
+        
+        # 验证状态一致性
+        assert isclose(state_dict["bgm_volume"], bgm_volume, abs_tol=0.001), \
             f"bgm_volume mismatch: expected {bgm_volume}, got {state_dict['bgm_volume']}"
-        assert abs(state_dict["sfx_volume"] - sfx_volume) < 0.001, \
+        assert isclose(state_dict["sfx_volume"], sfx_volume, abs_tol=0.001), \
             f"sfx_volume mismatch: expected {sfx_volume}, got {state_dict['sfx_volume']}"
-        assert state_dict["current_cue_index"] == current_cue_index, \
-            f"current_cue_index mismatch: expected {current_cue_index}, got {state_dict['current_cue_index']}"
+    
+    @given(
+        in_silence=st.booleans(),
+        silence_remaining=st.floats(min_value=0.0, max_value=10.0, allow_nan=False, allow_infinity=False)
+    )
+    @_AXIS
+    def test_silence_state_roundtrip(self, in_silence, silence_remaining):
+        """API 返回的静音状态应与控制器一致"""
+        controller = get_controller()
+        
+        # 设置控制器状态
+        controller._in_silence = in_silence
+        controller._silence_remaining = silence_remaining
+        
+        # 获取状态
+        state_dict = controller.get_state_dict()
+        
+        # 验证状态一致性
         assert state_dict["in_silence"] == in_silence, \
             f"in_silence mismatch: expected {in_silence}, got {state_dict['in_silence']}"
+        assert isclose(state_dict["silence_remaining"], silence_remaining, abs_tol=0.001), \
+            f"silence_remaining mismatch: expected {silence_remaining}, got {state_dict['silence_remaining']}"
+    
+    @given(
+        current_cue_index=st.integers(min_value=0, max_value=100)
+    )
+    @_AXIS
+    def test_cue_index_roundtrip(self, current_cue_index):
+        """API 返回的 Cue 索引应与控制器一致"""
+        controller = get_controller()
+        
+        # 设置控制器状态
+        controller._cue_manager._current_index = current_cue_index
+        
+        # 获取状态
+        state_dict = controller.get_state_dict()
+        
+        # 验证状态一致性
+        assert state_dict["current_cue_index"] == current_cue_index, \
+            f"current_cue_index mismatch: expected {current_cue_index}, got {state_dict['current_cue_index']}"
     
     @given(
         position=position_strategy(),
         is_paused=st.booleans()
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @_FAST
     def test_api_state_position_accuracy(self, position, is_paused):
         """API 返回的播放位置应准确"""
-        controller = create_controller()
+        controller = get_controller()
         
         # 创建测试音频
         audio = AudioTrack(
@@ -319,29 +355,23 @@ class TestAPIStateQueryConsistencyProperty:
         controller._current_audio_id = "test_audio"
         controller._current_position = position
         controller._playback_start_position = position
-        controller._playback_start_time = time.time()
+        controller._playback_start_time = FROZEN_NOW
         
         # 获取状态
         state_dict = controller.get_state_dict()
         
-        # 验证位置（允许小误差，因为时间可能有微小变化）
-        if is_paused:
-            # 暂停时位置应该精确
-            assert abs(state_dict["current_position"] - position) < 0.1, \
-                f"Position mismatch when paused: expected ~{position}, got {state_dict['current_position']}"
-        else:
-            # 播放时位置可能有微小增加
-            assert state_dict["current_position"] >= position - 0.1, \
-                f"Position should be >= {position}, got {state_dict['current_position']}"
+        # 验证位置（时钟固定，播放和暂停时位置都应精确）
+        assert state_dict["current_position"] == position, \
+            f"Position mismatch (paused={is_paused}): expected {position}, got {state_dict['current_position']}"
     
     @given(
         bgm_volume=volume_strategy(),
         sfx_volume=volume_strategy()
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @_FAST
     def test_api_volume_state_consistency(self, bgm_volume, sfx_volume):
         """API 返回的音量状态应与设置一致"""
-        controller = create_controller()
+        controller = get_controller()
         
         # 设置音量
         controller.set_bgm_volume(bgm_volume)
@@ -351,14 +381,14 @@ class TestAPIStateQueryConsistencyProperty:
         state_dict = controller.get_state_dict()
         
         # 验证音量一致性
-        assert abs(state_dict["bgm_volume"] - bgm_volume) < 0.001, \
+        assert isclose(state_dict["bgm_volume"], bgm_volume, abs_tol=0.001), \
             f"BGM volume mismatch: expected {bgm_volume}, got {state_dict['bgm_volume']}"
-        assert abs(state_dict["sfx_volume"] - sfx_volume) < 0.001, \
+        assert isclose(state_dict["sfx_volume"], sfx_volume, abs_tol=0.001), \
             f"SFX volume mismatch: expected {sfx_volume}, got {state_dict['sfx_volume']}"
         
         # 验证通过 getter 获取的值也一致
-        assert abs(controller.get_bgm_volume() - bgm_volume) < 0.001
-        assert abs(controller.get_sfx_volume() - sfx_volume) < 0.001
+        assert isclose(controller.get_bgm_volume(), bgm_volume, abs_tol=0.001)
+        assert isclose(controller.get_sfx_volume(), sfx_volume, abs_tol=0.001)
 
 
 # ==================== Property 27: 音频列表一致性 ====================
@@ -374,40 +404,39 @@ class TestAudioListConsistencyProperty:
     @given(
         num_audio_files=st.integers(min_value=0, max_value=20)
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @_FAST
     def test_audio_list_contains_all_added_files(self, num_audio_files):
         """音频列表应包含所有已添加的文件"""
-        controller = create_controller()
+        controller = get_controller()
         
-        # 添加音频文件
-        added_ids = set()
-        for i in range(num_audio_files):
-            audio = AudioTrack(
-                id=f"audio_{i}",
-                file_path=f"/fake/path/audio_{i}.mp3",
+        # 批量添加音频文件
+        controller.cue_manager.add_audio_files([
+            _track(
+                f"audio_{i}",
                 duration=100.0 + i,
                 title=f"Audio {i}",
                 track_type="bgm" if i % 2 == 0 else "sfx"
             )
-            controller.cue_manager.add_audio_file(audio)
-            added_ids.add(f"audio_{i}")
+            for i in range(num_audio_files)
+        ])
+        added_ids = {f"audio_{i}" for i in range(num_audio_files)}
         
-        # 获取音频列表
-        audio_files = controller.cue_manager.audio_files
-        retrieved_ids = {audio.id for audio in audio_files}
+        # 获取音频 ID 集合和数量
+        retrieved_ids = controller.cue_manager.get_audio_ids()
+        audio_count = controller.cue_manager.get_audio_count()
         
         # 验证所有添加的文件都在列表中
         assert added_ids == retrieved_ids, \
             f"Audio list mismatch: added {added_ids}, retrieved {retrieved_ids}"
         
         # 验证数量一致
-        assert len(audio_files) == num_audio_files, \
-            f"Audio count mismatch: expected {num_audio_files}, got {len(audio_files)}"
+        assert audio_count == num_audio_files, \
+            f"Audio count mismatch: expected {num_audio_files}, got {audio_count}"
     
     @given(
         audio_tracks=st.lists(
             st.tuples(
-                st.text(min_size=1, max_size=10, alphabet=st.characters(whitelist_categories=('L', 'N'))),
+                _SHORT_ID_TEXT,
                 st.floats(min_value=1.0, max_value=600.0, allow_nan=False, allow_infinity=False),
                 st.text(min_size=1, max_size=30),
                 st.sampled_from(["bgm", "sfx"])
@@ -417,23 +446,17 @@ class TestAudioListConsistencyProperty:
             unique_by=lambda x: x[0]  # 确保 ID 唯一
         )
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @_FAST
     def test_audio_list_preserves_properties(self, audio_tracks):
         """音频列表应保留所有文件的属性"""
-        controller = create_controller()
+        controller = get_controller()
         
-        # 添加音频文件
-        expected_audios = {}
-        for audio_id, duration, title, track_type in audio_tracks:
-            audio = AudioTrack(
-                id=audio_id,
-                file_path=f"/fake/path/{audio_id}.mp3",
-                duration=duration,
-                title=title,
-                track_type=track_type
-            )
-            controller.cue_manager.add_audio_file(audio)
-            expected_audios[audio_id] = audio
+        # 批量添加音频文件
+        expected_audios = {
+            audio_id: _track(audio_id, duration, title, track_type)
+            for audio_id, duration, title, track_type in audio_tracks
+        }
+        controller.cue_manager.add_audio_files(list(expected_audios.values()))
         
         # 获取音频列表
         audio_files = controller.cue_manager.audio_files
@@ -444,7 +467,7 @@ class TestAudioListConsistencyProperty:
             assert expected is not None, f"Unexpected audio: {audio.id}"
             assert audio.file_path == expected.file_path, \
                 f"file_path mismatch for {audio.id}"
-            assert abs(audio.duration - expected.duration) < 0.001, \
+            assert isclose(audio.duration, expected.duration, abs_tol=0.001), \
                 f"duration mismatch for {audio.id}"
             assert audio.title == expected.title, \
                 f"title mismatch for {audio.id}"
@@ -452,38 +475,33 @@ class TestAudioListConsistencyProperty:
                 f"track_type mismatch for {audio.id}"
     
     @given(
-        initial_count=st.integers(min_value=1, max_value=10),
-        remove_count=st.integers(min_value=0, max_value=5)
+        data=st.data(),
+        initial_count=st.integers(min_value=1, max_value=10)
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_audio_list_after_removal(self, initial_count, remove_count):
+    @settings(_FAST, max_examples=50)
+    def test_audio_list_after_removal(self, data, initial_count):
         """删除音频后，列表应正确更新"""
-        # 确保删除数量不超过初始数量
-        remove_count = min(remove_count, initial_count)
+        # 删除数量依赖初始数量，直接在有效范围内生成
+        remove_count = data.draw(st.integers(min_value=0, max_value=initial_count))
         
-        controller = create_controller()
+        controller = get_controller()
         
-        # 添加音频文件
-        added_ids = []
-        for i in range(initial_count):
-            audio = AudioTrack(
-                id=f"audio_{i}",
-                file_path=f"/fake/path/audio_{i}.mp3",
-                duration=100.0,
-                title=f"Audio {i}",
-                track_type="bgm"
-            )
-            controller.cue_manager.add_audio_file(audio)
-            added_ids.append(f"audio_{i}")
+        # 批量添加音频文件
+        added_ids = [f"audio_{i}" for i in range(initial_count)]
+        controller.cue_manager.add_audio_files([
+            _track(audio_id, title=f"Audio {i}")
+            for i, audio_id in enumerate(added_ids)
+        ])
         
         # 删除部分音频
         removed_ids = added_ids[:remove_count]
-        for audio_id in removed_ids:
-            controller.cue_manager.remove_audio_file(audio_id)
+        removed = controller.cue_manager.remove_audio_files(removed_ids)
+        assert removed == remove_count, \
+            f"Removed count mismatch: expected {remove_count}, got {removed}"
         
-        # 获取音频列表
-        audio_files = controller.cue_manager.audio_files
-        remaining_ids = {audio.id for audio in audio_files}
+        # 获取剩余音频 ID 集合和数量
+        remaining_ids = controller.cue_manager.get_audio_ids()
+        audio_count = controller.cue_manager.get_audio_count()
         
         # 验证删除的文件不在列表中
         for removed_id in removed_ids:
@@ -492,25 +510,19 @@ class TestAudioListConsistencyProperty:
         
         # 验证剩余文件数量正确
         expected_count = initial_count - remove_count
-        assert len(audio_files) == expected_count, \
-            f"Audio count mismatch: expected {expected_count}, got {len(audio_files)}"
+        assert audio_count == expected_count, \
+            f"Audio count mismatch: expected {expected_count}, got {audio_count}"
     
     @given(
-        audio_id=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N')))
+        audio_id=_ID_TEXT
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @_FAST
     def test_get_audio_file_by_id(self, audio_id):
         """通过 ID 获取音频文件应返回正确的文件"""
-        controller = create_controller()
+        controller = get_controller()
         
         # 添加音频文件
-        audio = AudioTrack(
-            id=audio_id,
-            file_path=f"/fake/path/{audio_id}.mp3",
-            duration=120.0,
-            title=f"Test Audio {audio_id}",
-            track_type="bgm"
-        )
+        audio = _track(audio_id, duration=120.0, title=f"Test Audio {audio_id}")
         controller.cue_manager.add_audio_file(audio)
         
         # 通过 ID 获取
@@ -526,31 +538,23 @@ class TestAudioListConsistencyProperty:
     
     @given(
         existing_ids=st.lists(
-            st.text(min_size=1, max_size=10, alphabet=st.characters(whitelist_categories=('L', 'N'))),
+            _SHORT_ID_TEXT,
             min_size=0,
             max_size=10,
             unique=True
         ),
-        query_id=st.text(min_size=1, max_size=10, alphabet=st.characters(whitelist_categories=('L', 'N')))
+        query_id=_SHORT_ID_TEXT
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @_FAST
     def test_get_nonexistent_audio_returns_none(self, existing_ids, query_id):
         """获取不存在的音频应返回 None"""
         # 确保查询 ID 不在已存在的 ID 中
         assume(query_id not in existing_ids)
         
-        controller = create_controller()
+        controller = get_controller()
         
         # 添加已存在的音频
-        for audio_id in existing_ids:
-            audio = AudioTrack(
-                id=audio_id,
-                file_path=f"/fake/path/{audio_id}.mp3",
-                duration=100.0,
-                title=f"Audio {audio_id}",
-                track_type="bgm"
-            )
-            controller.cue_manager.add_audio_file(audio)
+        controller.cue_manager.add_audio_files([_track(audio_id) for audio_id in existing_ids])
         
         # 查询不存在的 ID
         result = controller.cue_manager.get_audio_file(query_id)
@@ -14,7 +14,17 @@ from src.core.audio_engine import AudioEngine
 volume_strategy = st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False)
 
 
-# 模块级别的引擎实例，避免重复初始化 pygame.mixer
+class _MixerlessAudioEngine(AudioEngine):
+    """不初始化 pygame.mixer 的音频引擎
+    
+    音量属性只读写引擎自身的字段，不需要音频设备，也省去 mixer 初始化开销。
+    """
+    
+    def _init_mixer(self) -> None:
+        pass
+
+
+# 模块级别的引擎实例，避免重复创建
 _engine = None
 
 
@@ -22,18 +32,16 @@ def get_engine() -> AudioEngine:
     """获取或创建音频引擎实例"""
     global _engine
     if _engine is None:
-        _engine = AudioEngine()
+        _engine = _MixerlessAudioEngine()
     return _engine
 
 
 @pytest.fixture(scope="module", autouse=True)
 def cleanup_engine():
-    """模块结束时清理引擎"""
+    """模块结束时清理引擎（未初始化 mixer，无需 shutdown）"""
     yield
     global _engine
-    if _engine is not None:
-        _engine.shutdown()
-        _engine = None
+    _engine = None
 
 
 class TestVolumeConsistency:
@@ -45,7 +53,7 @@ class TestVolumeConsistency:
     """
     
     @given(volume=volume_strategy)
-    @settings(max_examples=100)
+    @settings(max_examples=25, derandomize=True)
     def test_bgm_volume_consistency(self, volume: float):
         """
         属性测试：BGM 音量设置一致性
@@ -67,7 +75,7 @@ class TestVolumeConsistency:
         assert result == volume, f"Expected BGM volume {volume}, got {result}"
     
     @given(volume=volume_strategy)
-    @settings(max_examples=100)
+    @settings(max_examples=25, derandomize=True)
     def test_sfx_volume_consistency(self, volume: float):
         """
         属性测试：音效音量设置一致性
@@ -89,7 +97,7 @@ class TestVolumeConsistency:
         assert result == volume, f"Expected SFX volume {volume}, got {result}"
     
     @given(bgm_vol=volume_strategy, sfx_vol=volume_strategy)
-    @settings(max_examples=100)
+    @settings(max_examples=25, derandomize=True)
     def test_volume_independence(self, bgm_vol: float, sfx_vol: float):
         """
         属性测试：BGM 和音效音量独立性
@@ -7,19 +7,23 @@ BreakpointManager 属性测试
 - Property 12: 单音频断点清除
 - Property 14: 断点存储独立性
 """
+import string
+from itertools import count
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, settings, HealthCheck
 from datetime import datetime
 
+from src.core import breakpoint_manager
 from src.core.breakpoint_manager import BreakpointManager
 from src.models.breakpoint import Breakpoint
 
 
 # 定义生成策略
+# 音频 ID 只参与相等比较，使用固定的 ASCII 字母表，避免按 Unicode 分类筛选字符
 audio_id_strategy = st.text(
     min_size=1, 
     max_size=30, 
-    alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-')
+    alphabet=string.ascii_letters + string.digits + "_-"
 )
 
 position_strategy = st.floats(
@@ -31,6 +35,59 @@ position_strategy = st.floats(
 
 label_strategy = st.text(min_size=0, max_size=100)
 
+# 独立性属性只关心音频 ID 是否相同，从固定的 ID 池中无放回抽取，去重时不会重抽
+_AUDIO_ID_POOL = [f"aud_{i:02d}" for i in range(64)]
+
+# 两个不同的音频 ID
+distinct_audio_ids = st.lists(st.sampled_from(_AUDIO_ID_POOL), min_size=2, max_size=2, unique=True)
+
+
+@st.composite
+def positions_and_delete_indices(draw):
+    """生成断点位置列表及要删除的断点下标（至少1个，最多全部）"""
+    positions = draw(st.lists(position_strategy, min_size=2, max_size=8))
+    n = len(positions)
+    num_to_delete = draw(st.integers(min_value=1, max_value=n))
+    indices = draw(st.lists(
+        st.integers(min_value=0, max_value=n - 1),
+        min_size=num_to_delete,
+        max_size=num_to_delete,
+        unique=True
+    ))
+    return positions, indices
+
+# 断点存取的属性只涉及结构（增删与独立性），没有数值边界情况：
+# 使用固定种子、不读写样例数据库，样例数取自当前 hypothesis 配置档（见 conftest.py）
+FAST_SETTINGS = settings(
+    deadline=None,
+    derandomize=True,
+    database=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def sequential_breakpoint_ids():
+    """用递增计数器代替 uuid4 生成断点 ID（测试只依赖 ID 唯一）"""
+    counter = count()
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(breakpoint_manager, "_new_id", lambda: f"bp_{next(counter)}")
+        yield
+
+
+# 模块级别的断点管理器实例，跨测试样例复用
+_manager = None
+
+
+def get_manager() -> BreakpointManager:
+    """获取已清空的断点管理器实例"""
+    global _manager
+    if _manager is None:
+        _manager = BreakpointManager()
+    else:
+        _manager.clear()
+    return _manager
+
 
 class TestBreakpointSaveIntegrity:
     """
@@ -44,113 +101,91 @@ class TestBreakpointSaveIntegrity:
         audio_id=audio_id_strategy,
         position=position_strategy,
         label=label_strategy,
-        auto_saved=st.booleans()
+        auto_saved=st.booleans(),
+        positions=st.lists(position_strategy, min_size=0, max_size=8)
     )
-    @settings(max_examples=100)
-    def test_save_breakpoint_adds_to_list(
+    @FAST_SETTINGS
+    def test_save_integrity(
         self, 
         audio_id: str, 
         position: float, 
         label: str,
-        auto_saved: bool
+        auto_saved: bool,
+        positions: list
     ):
         """
-        属性测试：保存断点后，断点列表应包含该断点
+        属性测试：保存断点后，断点列表应包含所有保存的断点，且可通过 ID 获取
         
-        对于任意有效的音频 ID 和播放位置：
-        1. 创建新的断点管理器
-        2. 保存断点
-        3. 获取该音频的断点列表
-        4. 列表应包含刚保存的断点，且位置正确
+        对于任意有效的音频 ID 和播放位置（单个保存、批量保存、按 ID 获取合并为一次运行）：
+        1. 获取已清空的断点管理器
+        2. 保存一个带标签的断点，再批量保存多个断点
+        3. 获取该音频的断点列表，列表应包含所有保存的断点
+        4. 通过 ID 获取的断点应与保存时一致
         """
-        manager = BreakpointManager()
+        manager = get_manager()
         
         # 保存断点
         bp_id = manager.save_breakpoint(audio_id, position, label, auto_saved)
+        saved_ids = [bp_id] + manager.save_breakpoints(audio_id, positions)
         
         # 获取断点列表
         breakpoints = manager.get_breakpoints(audio_id)
         
-        # 验证断点存在
-        assert len(breakpoints) >= 1
+        # 验证数量及所有 ID 都存在
+        assert len(breakpoints) == len(saved_ids)
+        assert {bp.id for bp in breakpoints} == set(saved_ids)
         
-        # 查找刚保存的断点
-        saved_bp = None
-        for bp in breakpoints:
-            if bp.id == bp_id:
-                saved_bp = bp
-                break
+        # 通过 ID 获取，验证断点属性
+        for saved_id, saved_position in zip(saved_ids, [position] + positions):
+            bp = manager.get_breakpoint(audio_id, saved_id)
+            assert bp is not None, "保存的断点应该可以通过 ID 获取"
+            assert bp.id == saved_id
+            assert bp.audio_id == audio_id
+            assert bp.position == saved_position
         
-        # 验证断点属性
-        assert saved_bp is not None, "保存的断点应该在列表中"
-        assert saved_bp.audio_id == audio_id
-        assert saved_bp.position == position
+        saved_bp = manager.get_breakpoint(audio_id, bp_id)
         assert saved_bp.label == label
         assert saved_bp.auto_saved == auto_saved
 
-
     @given(
         audio_id=audio_id_strategy,
-        positions=st.lists(position_strategy, min_size=1, max_size=20)
+        existing=st.lists(position_strategy, min_size=0, max_size=5),
+        positions=st.lists(position_strategy, min_size=0, max_size=8),
+        label=label_strategy,
+        auto_saved=st.booleans()
     )
-    @settings(max_examples=100)
-    def test_multiple_breakpoints_all_saved(self, audio_id: str, positions: list):
+    @FAST_SETTINGS
+    def test_save_breakpoints_matches_save_breakpoint(
+        self,
+        audio_id: str,
+        existing: list,
+        positions: list,
+        label: str,
+        auto_saved: bool
+    ):
         """
-        属性测试：多次保存断点后，所有断点都应存在
-        
-        对于任意音频 ID 和多个播放位置：
-        1. 依次保存所有断点
-        2. 获取断点列表
-        3. 列表应包含所有保存的断点
+        属性测试：批量保存与依次调用 save_breakpoint 的结果一致（ID 除外）
         """
-        manager = BreakpointManager()
-        saved_ids = []
+        batch = get_manager()
+        single = BreakpointManager()
+        for pos in existing:
+            batch.save_breakpoint(audio_id, pos)
+            single.save_breakpoint(audio_id, pos)
         
-        # 保存所有断点
+        saved_ids = batch.save_breakpoints(audio_id, positions, label, auto_saved)
         for pos in positions:
-            bp_id = manager.save_breakpoint(audio_id, pos)
-            saved_ids.append(bp_id)
-        
-        # 获取断点列表
-        breakpoints = manager.get_breakpoints(audio_id)
-        
-        # 验证数量
-        assert len(breakpoints) == len(positions)
-        
-        # 验证所有 ID 都存在
-        bp_ids_in_list = {bp.id for bp in breakpoints}
-        for saved_id in saved_ids:
-            assert saved_id in bp_ids_in_list
-
-    @given(
-        audio_id=audio_id_strategy,
-        position=position_strategy
-    )
-    @settings(max_examples=100)
-    def test_get_breakpoint_by_id(self, audio_id: str, position: float):
-        """
-        属性测试：通过 ID 获取断点应返回正确的断点
-        
-        对于任意音频 ID 和播放位置：
-        1. 保存断点
-        2. 通过 ID 获取断点
-        3. 返回的断点应与保存的一致
-        """
-        manager = BreakpointManager()
-        
-        # 保存断点
-        bp_id = manager.save_breakpoint(audio_id, position, "test_label")
-        
-        # 通过 ID 获取
-        bp = manager.get_breakpoint(audio_id, bp_id)
-        
-        # 验证
-        assert bp is not None
-        assert bp.id == bp_id
-        assert bp.audio_id == audio_id
-        assert bp.position == position
-        assert bp.label == "test_label"
-
+            single.save_breakpoint(audio_id, pos, label, auto_saved)
+        
+        def fields(manager):
+            return [
+                (bp.audio_id, bp.position, bp.label, bp.auto_saved)
+                for bp in manager.get_breakpoints(audio_id)
+            ]
+        
+        assert fields(batch) == fields(single)
+        # 返回的 ID 与新增断点一一对应且顺序一致
+        assert saved_ids == [bp.id for bp in batch.get_breakpoints(audio_id)[len(existing):]]
+        assert len(set(saved_ids)) == len(saved_ids)
 
 
 class TestBreakpointDeleteIntegrity:
@@ -163,9 +198,9 @@ class TestBreakpointDeleteIntegrity:
 
     @given(
         audio_id=audio_id_strategy,
-        positions=st.lists(position_strategy, min_size=1, max_size=20)
+        positions=st.lists(position_strategy, min_size=1, max_size=8)
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_delete_single_breakpoint(self, audio_id: str, positions: list):
         """
         属性测试：删除单个断点后，该断点不应存在于列表中
@@ -176,13 +211,10 @@ class TestBreakpointDeleteIntegrity:
         3. 该断点不应再存在于列表中
         4. 其他断点应保持不变
         """
-        manager = BreakpointManager()
-        saved_ids = []
+        manager = get_manager()
         
         # 保存所有断点
-        for pos in positions:
-            bp_id = manager.save_breakpoint(audio_id, pos)
-            saved_ids.append(bp_id)
+        saved_ids = manager.save_breakpoints(audio_id, positions)
         
         # 删除第一个断点
         deleted_id = saved_ids[0]
@@ -199,16 +231,14 @@ class TestBreakpointDeleteIntegrity:
         assert deleted_id not in bp_ids
         
         # 验证其他断点仍存在
-        for bp_id in saved_ids[1:]:
-            assert bp_id in bp_ids
+        assert bp_ids.issuperset(saved_ids[1:])
 
     @given(
         audio_id=audio_id_strategy,
-        positions=st.lists(position_strategy, min_size=2, max_size=20),
-        delete_indices=st.data()
+        spec=positions_and_delete_indices()
     )
-    @settings(max_examples=100)
-    def test_batch_delete_breakpoints(self, audio_id: str, positions: list, delete_indices):
+    @FAST_SETTINGS
+    def test_batch_delete_breakpoints(self, audio_id: str, spec: tuple):
         """
         属性测试：批量删除断点后，所有选中的断点都不应存在
         
@@ -218,31 +248,15 @@ class TestBreakpointDeleteIntegrity:
         3. 所有被删除的断点都不应存在于列表中
         4. 未被删除的断点应保持不变
         """
-        manager = BreakpointManager()
-        saved_ids = []
+        positions, indices_to_delete = spec
+        manager = get_manager()
         
         # 保存所有断点
-        for pos in positions:
-            bp_id = manager.save_breakpoint(audio_id, pos)
-            saved_ids.append(bp_id)
-        
-        # 随机选择要删除的断点数量（至少1个，最多全部）
-        num_to_delete = delete_indices.draw(
-            st.integers(min_value=1, max_value=len(saved_ids))
-        )
-        
-        # 随机选择要删除的断点
-        indices_to_delete = delete_indices.draw(
-            st.lists(
-                st.integers(min_value=0, max_value=len(saved_ids)-1),
-                min_size=num_to_delete,
-                max_size=num_to_delete,
-                unique=True
-            )
-        )
+        saved_ids = manager.save_breakpoints(audio_id, positions)
         
+        delete_set = set(indices_to_delete)
         ids_to_delete = [saved_ids[i] for i in indices_to_delete]
-        ids_to_keep = [saved_ids[i] for i in range(len(saved_ids)) if i not in indices_to_delete]
+        ids_to_keep = [bp_id for i, bp_id in enumerate(saved_ids) if i not in delete_set]
         
         # 批量删除
         deleted_count = manager.clear_selected(ids_to_delete)
@@ -255,20 +269,18 @@ class TestBreakpointDeleteIntegrity:
         bp_ids = {bp.id for bp in breakpoints}
         
         # 验证已删除的断点都不存在
-        for deleted_id in ids_to_delete:
-            assert deleted_id not in bp_ids
+        assert bp_ids.isdisjoint(ids_to_delete)
         
         # 验证未删除的断点仍存在
-        for kept_id in ids_to_keep:
-            assert kept_id in bp_ids
+        assert bp_ids.issuperset(ids_to_keep)
 
     @given(audio_id=audio_id_strategy)
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_delete_nonexistent_breakpoint(self, audio_id: str):
         """
         属性测试：删除不存在的断点应返回 False
         """
-        manager = BreakpointManager()
+        manager = get_manager()
         
         # 尝试删除不存在的断点
         result = manager.delete_breakpoint(audio_id, "nonexistent_id")
@@ -288,9 +300,9 @@ class TestSingleAudioBreakpointClear:
 
     @given(
         audio_id=audio_id_strategy,
-        positions=st.lists(position_strategy, min_size=1, max_size=20)
+        positions=st.lists(position_strategy, min_size=1, max_size=8)
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_clear_audio_breakpoints_empties_list(self, audio_id: str, positions: list):
         """
         属性测试：清除单个音频的断点后，该音频断点列表应为空
@@ -300,11 +312,10 @@ class TestSingleAudioBreakpointClear:
         2. 执行一键清除
         3. 该音频的断点列表应为空
         """
-        manager = BreakpointManager()
+        manager = get_manager()
         
         # 保存断点
-        for pos in positions:
-            manager.save_breakpoint(audio_id, pos)
+        manager.save_breakpoints(audio_id, positions)
         
         # 验证断点已保存
         assert len(manager.get_breakpoints(audio_id)) == len(positions)
@@ -316,16 +327,14 @@ class TestSingleAudioBreakpointClear:
         assert len(manager.get_breakpoints(audio_id)) == 0
 
     @given(
-        audio_id_1=audio_id_strategy,
-        audio_id_2=audio_id_strategy,
-        positions_1=st.lists(position_strategy, min_size=1, max_size=10),
-        positions_2=st.lists(position_strategy, min_size=1, max_size=10)
+        audio_ids=distinct_audio_ids,
+        positions_1=st.lists(position_strategy, min_size=1, max_size=5),
+        positions_2=st.lists(position_strategy, min_size=1, max_size=5)
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_clear_one_audio_preserves_others(
         self, 
-        audio_id_1: str, 
-        audio_id_2: str, 
+        audio_ids: list, 
         positions_1: list, 
         positions_2: list
     ):
@@ -338,21 +347,13 @@ class TestSingleAudioBreakpointClear:
         3. 第一个音频断点列表应为空
         4. 第二个音频断点列表应保持不变
         """
-        # 确保两个音频 ID 不同
-        assume(audio_id_1 != audio_id_2)
+        audio_id_1, audio_id_2 = audio_ids
         
-        manager = BreakpointManager()
+        manager = get_manager()
         
         # 为两个音频保存断点
-        ids_1 = []
-        for pos in positions_1:
-            bp_id = manager.save_breakpoint(audio_id_1, pos)
-            ids_1.append(bp_id)
-        
-        ids_2 = []
-        for pos in positions_2:
-            bp_id = manager.save_breakpoint(audio_id_2, pos)
-            ids_2.append(bp_id)
+        ids_1 = manager.save_breakpoints(audio_id_1, positions_1)
+        ids_2 = manager.save_breakpoints(audio_id_2, positions_2)
         
         # 清除第一个音频的断点
         manager.clear_audio_breakpoints(audio_id_1)
@@ -365,16 +366,15 @@ class TestSingleAudioBreakpointClear:
         assert len(breakpoints_2) == len(positions_2)
         
         bp_ids_2 = {bp.id for bp in breakpoints_2}
-        for bp_id in ids_2:
-            assert bp_id in bp_ids_2
+        assert bp_ids_2.issuperset(ids_2)
 
     @given(audio_id=audio_id_strategy)
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_clear_empty_audio_is_safe(self, audio_id: str):
         """
         属性测试：清除没有断点的音频应该是安全的（不抛出异常）
         """
-        manager = BreakpointManager()
+        manager = get_manager()
         
         # 清除不存在的音频断点（不应抛出异常）
         manager.clear_audio_breakpoints(audio_id)
@@ -382,6 +382,29 @@ class TestSingleAudioBreakpointClear:
         # 验证断点列表为空
         assert len(manager.get_breakpoints(audio_id)) == 0
 
+    @given(
+        entries=st.lists(
+            st.tuples(audio_id_strategy, position_strategy, st.booleans()),
+            min_size=0,
+            max_size=8
+        )
+    )
+    @FAST_SETTINGS
+    def test_clear_removes_all_breakpoints(self, entries: list):
+        """
+        属性测试：clear 应清除所有音频的全部断点（包括自动保存的断点）
+        """
+        manager = get_manager()
+        
+        for audio_id, position, auto_saved in entries:
+            manager.save_breakpoint(audio_id, position, auto_saved=auto_saved)
+        
+        manager.clear()
+        
+        assert manager.get_all_breakpoint_ids() == []
+        assert manager.get_breakpoint_count() == 0
+        for audio_id, _, _ in entries:
+            assert manager.get_breakpoints(audio_id) == []
 
 
 class TestBreakpointStorageIndependence:
@@ -393,16 +416,14 @@ class TestBreakpointStorageIndependence:
     """
 
     @given(
-        audio_id_1=audio_id_strategy,
-        audio_id_2=audio_id_strategy,
+        audio_ids=distinct_audio_ids,
         position_1=position_strategy,
         position_2=position_strategy
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_add_breakpoint_to_one_audio_preserves_other(
         self, 
-        audio_id_1: str, 
-        audio_id_2: str, 
+        audio_ids: list, 
         position_1: float, 
         position_2: float
     ):
@@ -414,9 +435,9 @@ class TestBreakpointStorageIndependence:
         2. 为第二个音频保存断点
         3. 两个音频的断点列表应相互独立
         """
-        assume(audio_id_1 != audio_id_2)
+        audio_id_1, audio_id_2 = audio_ids
         
-        manager = BreakpointManager()
+        manager = get_manager()
         
         # 为第一个音频保存断点
         bp_id_1 = manager.save_breakpoint(audio_id_1, position_1)
@@ -439,16 +460,14 @@ class TestBreakpointStorageIndependence:
         assert breakpoints_2[0].audio_id == audio_id_2
 
     @given(
-        audio_id_1=audio_id_strategy,
-        audio_id_2=audio_id_strategy,
-        positions_1=st.lists(position_strategy, min_size=2, max_size=10),
-        positions_2=st.lists(position_strategy, min_size=1, max_size=10)
+        audio_ids=distinct_audio_ids,
+        positions_1=st.lists(position_strategy, min_size=2, max_size=5),
+        positions_2=st.lists(position_strategy, min_size=1, max_size=5)
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_delete_from_one_audio_preserves_other(
         self, 
-        audio_id_1: str, 
-        audio_id_2: str, 
+        audio_ids: list, 
         positions_1: list, 
         positions_2: list
     ):
@@ -460,20 +479,13 @@ class TestBreakpointStorageIndependence:
         2. 从第一个音频删除一个断点
         3. 第二个音频的断点列表应保持不变
         """
-        assume(audio_id_1 != audio_id_2)
+        audio_id_1, audio_id_2 = audio_ids
         
-        manager = BreakpointManager()
+        manager = get_manager()
         
         # 为两个音频保存断点
-        ids_1 = []
-        for pos in positions_1:
-            bp_id = manager.save_breakpoint(audio_id_1, pos)
-            ids_1.append(bp_id)
-        
-        ids_2 = []
-        for pos in positions_2:
-            bp_id = manager.save_breakpoint(audio_id_2, pos)
-            ids_2.append(bp_id)
+        ids_1 = manager.save_breakpoints(audio_id_1, positions_1)
+        ids_2 = manager.save_breakpoints(audio_id_2, positions_2)
         
         # 记录第二个音频的断点状态
         original_breakpoints_2 = manager.get_breakpoints(audio_id_2)
@@ -490,24 +502,15 @@ class TestBreakpointStorageIndependence:
         assert len(current_breakpoints_2) == len(positions_2)
 
     @given(
-        audio_ids=st.lists(
-            audio_id_strategy, 
-            min_size=2, 
-            max_size=5, 
-            unique=True
-        ),
-        positions_per_audio=st.lists(
-            st.lists(position_strategy, min_size=1, max_size=5),
+        audio_spec=st.dictionaries(
+            keys=st.sampled_from(_AUDIO_ID_POOL),
+            values=st.lists(position_strategy, min_size=1, max_size=5),
             min_size=2,
             max_size=5
         )
     )
-    @settings(max_examples=100)
-    def test_multiple_audios_independent_storage(
-        self, 
-        audio_ids: list, 
-        positions_per_audio: list
-    ):
+    @FAST_SETTINGS
+    def test_multiple_audios_independent_storage(self, audio_spec: dict):
         """
         属性测试：多个音频的断点存储完全独立
         
@@ -516,38 +519,26 @@ class TestBreakpointStorageIndependence:
         2. 每个音频的断点列表应只包含该音频的断点
         3. 断点数量应与保存的数量一致
         """
-        # 确保音频数量和位置列表数量匹配
-        num_audios = min(len(audio_ids), len(positions_per_audio))
-        assume(num_audios >= 2)
-        
-        manager = BreakpointManager()
+        manager = get_manager()
         saved_ids = {}
         
         # 为每个音频保存断点
-        for i in range(num_audios):
-            audio_id = audio_ids[i]
-            positions = positions_per_audio[i]
-            saved_ids[audio_id] = []
-            
-            for pos in positions:
-                bp_id = manager.save_breakpoint(audio_id, pos)
-                saved_ids[audio_id].append(bp_id)
+        for audio_id, positions in audio_spec.items():
+            saved_ids[audio_id] = manager.save_breakpoints(audio_id, positions)
         
         # 验证每个音频的断点列表独立
-        for i in range(num_audios):
-            audio_id = audio_ids[i]
-            expected_count = len(positions_per_audio[i])
-            
+        for audio_id, positions in audio_spec.items():
             breakpoints = manager.get_breakpoints(audio_id)
             
             # 验证数量
-            assert len(breakpoints) == expected_count
+            assert len(breakpoints) == len(positions)
             
             # 验证所有断点都属于该音频
-            for bp in breakpoints:
-                assert bp.audio_id == audio_id
+            assert all(bp.audio_id == audio_id for bp in breakpoints)
             
             # 验证所有保存的 ID 都存在
             bp_ids = {bp.id for bp in breakpoints}
-            for saved_id in saved_ids[audio_id]:
-                assert saved_id in bp_ids
+            assert bp_ids.issuperset(saved_ids[audio_id])
+        
+        # 验证断点总数
+        assert manager.get_breakpoint_count() == sum(map(len, audio_spec.values()))
@@ -4,37 +4,49 @@ Breakpoint 属性测试
 **Feature: multi-audio-player, Property 21: 断点数据序列化往返**
 **Validates: Requirements 8.3**
 """
+import json
+import string
+from dataclasses import asdict
 import pytest
 from hypothesis import given, strategies as st, settings
-from datetime import datetime, timezone
+from datetime import datetime
 
 from src.models.breakpoint import Breakpoint
 
 
 # 定义 Breakpoint 的生成策略
-# 使用有效的 datetime 范围，避免序列化问题
+# 断点时间为本地时间，一年的范围足以覆盖 isoformat 往返；
+# 保留微秒：isoformat 在微秒为 0 时省略小数部分，两种格式都需要验证
 datetime_strategy = st.datetimes(
-    min_value=datetime(2000, 1, 1),
-    max_value=datetime(2100, 12, 31),
+    min_value=datetime(2024, 1, 1),
+    max_value=datetime(2024, 12, 31, 23, 59, 59, 999999),
+    timezones=st.none(),
 )
 
+# ID 使用固定字母表（比按 Unicode 分类筛选字符快），包含若干汉字以覆盖非 ASCII 的序列化
+_ID_ALPHABET = string.ascii_letters + string.digits + "_-" + "音频断点背景音乐效果"
+
+# 各字段的策略在模块级别创建，所有测试共用同一组策略对象
+id_strategy = st.text(min_size=1, max_size=50, alphabet=_ID_ALPHABET)
+position_strategy = st.floats(min_value=0.0, max_value=36000.0, allow_nan=False, allow_infinity=False)
+label_strategy = st.text(min_size=0, max_size=100)
+
 breakpoint_strategy = st.builds(
     Breakpoint,
-    id=st.text(min_size=1, max_size=50, alphabet=st.characters(
-        whitelist_categories=('L', 'N'),
-        whitelist_characters='_-'
-    )),
-    audio_id=st.text(min_size=1, max_size=50, alphabet=st.characters(
-        whitelist_categories=('L', 'N'),
-        whitelist_characters='_-'
-    )),
-    position=st.floats(min_value=0.0, max_value=36000.0, allow_nan=False, allow_infinity=False),
-    label=st.text(min_size=0, max_size=100),
+    id=id_strategy,
+    audio_id=id_strategy,
+    position=position_strategy,
+    label=label_strategy,
     created_at=datetime_strategy,
     auto_saved=st.booleans(),
 )
 
 
+def _bp_key(bp: Breakpoint) -> tuple:
+    """断点所有字段组成的元组，用于整体比较"""
+    return (bp.id, bp.audio_id, bp.position, bp.label, bp.created_at, bp.auto_saved)
+
+
 class TestBreakpointRoundTrip:
     """
     **Feature: multi-audio-player, Property 21: 断点数据序列化往返**
@@ -61,12 +73,7 @@ class TestBreakpointRoundTrip:
         restored = Breakpoint.from_json(json_str)
         
         # 验证所有字段一致
-        assert restored.id == bp.id
-        assert restored.audio_id == bp.audio_id
-        assert restored.position == bp.position
-        assert restored.label == bp.label
-        assert restored.created_at == bp.created_at
-        assert restored.auto_saved == bp.auto_saved
+        assert _bp_key(restored) == _bp_key(bp)
 
     @given(bp=breakpoint_strategy)
     @settings(max_examples=100)
@@ -86,14 +93,26 @@ class TestBreakpointRoundTrip:
         restored = Breakpoint.from_dict(data)
         
         # 验证所有字段一致
-        assert restored.id == bp.id
-        assert restored.audio_id == bp.audio_id
-        assert restored.position == bp.position
-        assert restored.label == bp.label
-        assert restored.created_at == bp.created_at
-        assert restored.auto_saved == bp.auto_saved
-
-    @given(breakpoints=st.lists(breakpoint_strategy, min_size=0, max_size=20))
+        assert _bp_key(restored) == _bp_key(bp)
+
+    @given(bp=breakpoint_strategy)
+    @settings(max_examples=100)
+    def test_to_dict_matches_asdict(self, bp: Breakpoint):
+        """
+        属性测试：to_dict 包含所有字段
+        
+        对于任意有效的 Breakpoint 对象，to_dict 的结果（含键顺序）应与
+        dataclasses.asdict 一致，仅 created_at 转换为 ISO 格式字符串
+        """
+        expected = asdict(bp)
+        expected["created_at"] = bp.created_at.isoformat()
+        
+        data = bp.to_dict()
+        
+        assert data == expected
+        assert list(data) == list(expected)
+
+    @given(breakpoints=st.lists(breakpoint_strategy, min_size=0, max_size=8))
     @settings(max_examples=100)
     def test_breakpoint_collection_round_trip(self, breakpoints: list):
         """
@@ -104,8 +123,6 @@ class TestBreakpointRoundTrip:
         2. 从字典列表恢复所有断点
         3. 结果应与原始集合等价
         """
-        import json
-        
         # 序列化为字典列表
         data_list = [bp.to_dict() for bp in breakpoints]
         
@@ -116,26 +133,14 @@ class TestBreakpointRoundTrip:
         loaded_data = json.loads(json_str)
         restored_breakpoints = [Breakpoint.from_dict(d) for d in loaded_data]
         
-        # 验证数量一致
-        assert len(restored_breakpoints) == len(breakpoints)
-        
-        # 验证每个断点的所有字段一致
-        for original, restored in zip(breakpoints, restored_breakpoints):
-            assert restored.id == original.id
-            assert restored.audio_id == original.audio_id
-            assert restored.position == original.position
-            assert restored.label == original.label
-            assert restored.created_at == original.created_at
-            assert restored.auto_saved == original.auto_saved
+        # 验证数量和每个断点的所有字段一致
+        assert list(map(_bp_key, restored_breakpoints)) == list(map(_bp_key, breakpoints))
 
     @given(audio_breakpoints=st.dictionaries(
-        keys=st.text(min_size=1, max_size=30, alphabet=st.characters(
-            whitelist_categories=('L', 'N'),
-            whitelist_characters='_-'
-        )),
-        values=st.lists(breakpoint_strategy, min_size=0, max_size=10),
+        keys=st.text(min_size=1, max_size=30, alphabet=_ID_ALPHABET),
+        values=st.lists(breakpoint_strategy, min_size=0, max_size=5),
         min_size=0,
-        max_size=10
+        max_size=5
     ))
     @settings(max_examples=100)
     def test_audio_breakpoints_map_round_trip(self, audio_breakpoints: dict):
@@ -150,8 +155,6 @@ class TestBreakpointRoundTrip:
         
         这模拟了 breakpoints.json 文件的完整往返过程
         """
-        import json
-        
         # 转换为可序列化格式
         serializable = {
             audio_id: [bp.to_dict() for bp in bps]
@@ -176,12 +179,4 @@ class TestBreakpointRoundTrip:
             original_list = audio_breakpoints[audio_id]
             restored_list = restored_map[audio_id]
             
-            assert len(restored_list) == len(original_list)
-            
-            for original, restored in zip(original_list, restored_list):
-                assert restored.id == original.id
-                assert restored.audio_id == original.audio_id
-                assert restored.position == original.position
-                assert restored.label == original.label
-                assert restored.created_at == original.created_at
-                assert restored.auto_saved == original.auto_saved
+            assert list(map(_bp_key, restored_list)) == list(map(_bp_key, original_list))
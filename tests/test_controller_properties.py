@@ -4,23 +4,134 @@
 """
 import asyncio
 import pytest
-from hypothesis import given, strategies as st, settings, assume, HealthCheck
+from hypothesis import given, strategies as st, settings, assume
+from hypothesis.stateful import RuleBasedStateMachine, invariant, rule
 import time
-import threading
+from dataclasses import replace
 
-from src.core.controller import CoreController, PlayMode, EventType
-from src.core.cue_manager import CueManager
-from src.core.breakpoint_manager import BreakpointManager
+from src.core.controller import PlayMode
 from src.models.audio_track import AudioTrack
 from src.models.cue import Cue
+from tests.controller_factory import frozen_clock, make_controller_getter
 
 
 # ==================== 测试策略 ====================
 
+# 各测试共用的策略对象，模块加载时创建一次
+# 有效的音量值
+volume_strategy = st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False)
+# 播放位置（秒）
+position_strategy = st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
+
+
 @st.composite
-def volume_strategy(draw):
-    """生成有效的音量值"""
-    return draw(st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False))
+def cue_count_and_index(draw):
+    """生成 (Cue 数量, 初始索引)，初始索引不是最后一个"""
+    num_cues = draw(st.integers(min_value=2, max_value=10))
+    initial_index = draw(st.integers(min_value=0, max_value=num_cues - 2))
+    return num_cues, initial_index
+
+
+# 音效 ID 只用作字典键，测试只关心不同 ID 之间互不影响，从固定集合中取样
+_SFX_IDS = [f"sfx_{i}" for i in range(32)]
+sfx_id_strategy = st.sampled_from(_SFX_IDS)
+
+
+# 默认设置：不读写样例数据库，不做单样例超时检查
+THOROUGH_SETTINGS = settings(max_examples=100, deadline=None, database=None)
+# 取值空间很小（布尔、小整数）或取值不影响结果的属性，少量固定种子样例即可覆盖
+FAST_SETTINGS = settings(THOROUGH_SETTINGS, max_examples=25, derandomize=True)
+
+
+# ==================== 测试数据 ====================
+# 以下模型在各样例之间保持不变，模块加载时创建一次，避免每个样例重复构造
+
+_TEST_AUDIO = AudioTrack(
+    id="test_audio",
+    file_path="/fake/path/test.mp3",
+    duration=200.0,
+    title="Test Audio",
+    track_type="bgm"
+)
+
+_TEST_BGM = AudioTrack(
+    id="test_bgm",
+    file_path="/fake/path/bgm.mp3",
+    duration=200.0,
+    title="Test BGM",
+    track_type="bgm"
+)
+
+_OLD_BGM = AudioTrack(
+    id="old_bgm",
+    file_path="/fake/path/old.mp3",
+    duration=200.0,
+    title="Old BGM",
+    track_type="bgm"
+)
+
+_NEW_BGM = AudioTrack(
+    id="new_bgm",
+    file_path="/fake/path/new.mp3",
+    duration=200.0,
+    title="New BGM",
+    track_type="bgm"
+)
+
+_AUDIO_1 = AudioTrack(
+    id="audio_1",
+    file_path="/fake/path/audio1.mp3",
+    duration=200.0,
+    title="Audio 1",
+    track_type="bgm"
+)
+
+_AUDIO_2 = AudioTrack(
+    id="audio_2",
+    file_path="/fake/path/audio2.mp3",
+    duration=200.0,
+    title="Audio 2",
+    track_type="bgm"
+)
+
+_TEST_CUE = Cue(
+    id="test_cue",
+    audio_id="test_audio",
+    start_time=0.0,
+    end_time=150.0,
+    silence_before=0.0,
+    silence_after=0.0,
+    volume=1.0,
+    label="Test Cue"
+)
+
+# 音效 ID -> 对应的音效轨道
+_SFX_TRACKS = {
+    sfx_id: AudioTrack(
+        id=sfx_id,
+        file_path=f"/fake/path/{sfx_id}.mp3",
+        duration=5.0,
+        title="Test SFX",
+        track_type="sfx"
+    )
+    for sfx_id in _SFX_IDS
+}
+
+# 跳转测试使用的 Cue 列表，按需截取前 num_cues 个
+_MAX_CUES = 10
+_CUE_LIST = [
+    Cue(
+        id=f"cue_{i}",
+        audio_id="test_audio",
+        start_time=0.0,
+        end_time=10.0,
+        silence_before=0.0,
+        silence_after=0.0,
+        volume=1.0,
+        label=f"Cue {i}"
+    )
+    for i in range(_MAX_CUES)
+]
 
 
 # ==================== Mock 音频引擎 ====================
@@ -28,7 +139,16 @@ def volume_strategy(draw):
 class MockAudioEngine:
     """模拟音频引擎，用于测试"""
     
+    # 时间来源，测试中替换为固定时钟
+    _clock = staticmethod(time.time)
+    
     def __init__(self):
+        # reset() 原地清空集合，这里先创建
+        self._playing_sfx = set()
+        self.reset()
+    
+    def reset(self) -> None:
+        """恢复初始状态"""
         self._bgm_playing = False
         self._bgm_paused = False
         self._bgm_position = 0.0
@@ -36,7 +156,7 @@ class MockAudioEngine:
         self._bgm_volume = 1.0
         self._sfx_volume = 1.0
         self._current_bgm = None
-        self._playing_sfx = {}
+        self._playing_sfx.clear()
         self._on_bgm_end = None
         self._play_start_time = None
     
@@ -46,19 +166,19 @@ class MockAudioEngine:
         self._bgm_start_pos = start_pos
         self._bgm_position = start_pos
         self._current_bgm = track
-        self._play_start_time = time.time()
+        self._play_start_time = self._clock()
     
     def pause_bgm(self) -> None:
         if self._bgm_playing:
             self._bgm_paused = True
             if self._play_start_time:
-                elapsed = time.time() - self._play_start_time
+                elapsed = self._clock() - self._play_start_time
                 self._bgm_position = self._bgm_start_pos + elapsed
     
     def resume_bgm(self) -> None:
         if self._bgm_paused:
             self._bgm_paused = False
-            self._play_start_time = time.time()
+            self._play_start_time = self._clock()
             self._bgm_start_pos = self._bgm_position
     
     def stop_bgm(self) -> float:
@@ -82,12 +202,12 @@ class MockAudioEngine:
         return self._current_bgm
     
     def play_sfx(self, sfx_id: str, track: AudioTrack) -> bool:
-        self._playing_sfx[sfx_id] = track
+        self._playing_sfx.add(sfx_id)
         return True
     
     def stop_sfx(self, sfx_id: str) -> bool:
         if sfx_id in self._playing_sfx:
-            del self._playing_sfx[sfx_id]
+            self._playing_sfx.discard(sfx_id)
             return True
         return False
     
@@ -98,7 +218,7 @@ class MockAudioEngine:
         return sfx_id in self._playing_sfx
     
     def get_playing_sfx_ids(self):
-        return list(self._playing_sfx.keys())
+        return list(self._playing_sfx)
     
     def set_bgm_volume(self, volume: float) -> None:
         self._bgm_volume = max(0.0, min(1.0, volume))
@@ -127,55 +247,83 @@ class MockAudioEngine:
 
 # ==================== 工厂函数 ====================
 
-def create_controller():
-    """创建新的控制器实例"""
-    # 重置单例
-    CoreController._instance = None
-    
-    mock_engine = MockAudioEngine()
-    cue_manager = CueManager()
-    breakpoint_manager = BreakpointManager()
-    
-    # 创建新实例
-    ctrl = CoreController.__new__(CoreController)
-    ctrl._initialized = False
-    ctrl._audio_engine = mock_engine
-    ctrl._cue_manager = cue_manager
-    ctrl._breakpoint_manager = breakpoint_manager
-    
-    # 初始化状态
-    ctrl._mode = PlayMode.AUTO
-    ctrl._is_playing = False
-    ctrl._is_paused = False
-    ctrl._current_audio_id = None
-    ctrl._current_position = 0.0
-    ctrl._bgm_volume = 1.0
-    ctrl._sfx_volume = 1.0
-    ctrl._in_silence = False
-    ctrl._silence_remaining = 0.0
-    ctrl._silence_start_time = None
-    ctrl._silence_duration = 0.0
-    ctrl._manual_audio = None
-    ctrl._manual_start_pos = 0.0
-    ctrl._manual_silence_before = 0.0
-    ctrl._operation_lock = threading.Lock()
-    ctrl._local_priority = True
-    ctrl._pending_remote_ops = []
-    ctrl._listeners = {event_type: [] for event_type in EventType}
-    ctrl._playback_start_time = None
-    ctrl._playback_start_position = 0.0
-    ctrl._initialized = True
-    
-    return ctrl
+def _frozen_engine() -> MockAudioEngine:
+    """创建使用固定时钟的模拟音频引擎"""
+    engine = MockAudioEngine()
+    engine._clock = frozen_clock
+    return engine
+
+
+# 所有测试共用的控制器实例，每次获取时重置状态
+get_controller = make_controller_getter(_frozen_engine)
+
+
+# 模块内共用的事件循环，避免每次调用都创建新循环
+_TEST_LOOP = asyncio.new_event_loop()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def close_test_loop():
+    """模块结束时关闭事件循环"""
+    yield
+    _TEST_LOOP.close()
 
 
 def run_async(coro):
     """运行异步函数"""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return _TEST_LOOP.run_until_complete(coro)
+
+
+# 以下组合协程把一个样例中的多步操作放进一次 run_async，减少进出事件循环的次数
+
+async def _play_pause_resume(ctrl):
+    """依次播放、暂停、继续
+    
+    Returns:
+        (暂停时位置, 继续后位置)
+    """
+    await ctrl.play()
+    assert ctrl._is_playing
+    assert not ctrl._is_paused
+    
+    await ctrl.pause()
+    assert ctrl._is_paused
+    pos_at_pause = ctrl._get_current_position()
+    
+    await ctrl.resume()
+    assert not ctrl._is_paused
+    return pos_at_pause, ctrl._get_current_position()
+
+
+async def _play_then_replay(ctrl, played_position=None):
+    """开始播放后执行重播
+    
+    Args:
+        ctrl: 控制器
+        played_position: 重播前模拟播放到的位置，None 表示保持播放起点
+        
+    Returns:
+        重播前的位置
+    """
+    await ctrl.play()
+    if played_position is not None:
+        ctrl._current_position = played_position
+    position_before = ctrl._current_position
+    await ctrl.replay()
+    return position_before
+
+
+async def _play_then_switch_bgm(ctrl, new_bgm, start_pos):
+    """播放当前手动音频后切换到新 BGM
+    
+    Returns:
+        切换前正在播放的音频 ID
+    """
+    await ctrl.play()
+    assert ctrl._is_playing
+    audio_id_before = ctrl._current_audio_id
+    await ctrl.play_new_bgm(new_bgm, start_pos)
+    return audio_id_before
 
 
 # ==================== Property 3: 暂停/继续位置保持 ====================
@@ -189,55 +337,24 @@ class TestPauseResumePositionProperty:
     """
     
     @given(
-        position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
+        position=position_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_pause_resume_preserves_position(self, position):
         """暂停后继续播放，位置应保持不变"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 设置手动模式并配置音频
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = audio
+        controller._manual_audio = _TEST_AUDIO
         controller._manual_start_pos = position
         controller._manual_silence_before = 0.0
         
-        # 开始播放
-        run_async(controller.play())
-        
-        # 验证正在播放
-        assert controller._is_playing
-        assert not controller._is_paused
-        
-        # 暂停
-        run_async(controller.pause())
-        
-        # 验证已暂停
-        assert controller._is_paused
-        
-        # 记录暂停时位置
-        pos_at_pause = controller._get_current_position()
-        
-        # 继续播放
-        run_async(controller.resume())
+        # 播放、暂停、继续
+        pos_at_pause, pos_after_resume = run_async(_play_pause_resume(controller))
         
-        # 验证继续播放
-        assert not controller._is_paused
-        
-        # 获取继续后的位置
-        pos_after_resume = controller._get_current_position()
-        
-        # 验证位置保持（允许 ±0.1 秒误差）
-        assert abs(pos_at_pause - pos_after_resume) <= 0.1, \
+        # 验证位置保持（固定时钟下应完全一致）
+        assert pos_at_pause == pos_after_resume, \
             f"Position changed after resume: {pos_at_pause} -> {pos_after_resume}"
 
 
@@ -251,40 +368,16 @@ class TestNextCueIndexProperty:
     **Validates: Requirements 2.3**
     """
     
-    @given(
-        num_cues=st.integers(min_value=2, max_value=10),
-        initial_index=st.integers(min_value=0, max_value=8)
-    )
-    @settings(max_examples=100)
-    def test_next_cue_increments_index(self, num_cues, initial_index):
+    @given(cue_state=cue_count_and_index())
+    @settings(THOROUGH_SETTINGS)
+    def test_next_cue_increments_index(self, cue_state):
         """跳至下一段后，索引应递增 1"""
-        # 确保初始索引有效
-        assume(initial_index < num_cues - 1)  # 不是最后一个
-        
-        controller = create_controller()
-        
-        # 创建测试音频和 Cue
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=100.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
-        controller._cue_manager.add_audio_file(audio)
-        
-        for i in range(num_cues):
-            cue = Cue(
-                id=f"cue_{i}",
-                audio_id="test_audio",
-                start_time=0.0,
-                end_time=10.0,
-                silence_before=0.0,
-                silence_after=0.0,
-                volume=1.0,
-                label=f"Cue {i}"
-            )
-            controller._cue_manager.add_cue(cue)
+        num_cues, initial_index = cue_state
+        
+        controller = get_controller()
+        
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
+        controller._cue_manager.add_cues(_CUE_LIST[:num_cues])
         
         # 设置初始索引
         controller._cue_manager.set_index(initial_index)
@@ -304,33 +397,13 @@ class TestNextCueIndexProperty:
     @given(
         num_cues=st.integers(min_value=1, max_value=10)
     )
-    @settings(max_examples=100)
+    @settings(FAST_SETTINGS)
     def test_next_cue_at_last_does_not_exceed(self, num_cues):
         """在最后一个 Cue 时，跳至下一段不应超出范围"""
-        controller = create_controller()
-        
-        # 创建测试音频和 Cue
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=100.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
-        controller._cue_manager.add_audio_file(audio)
-        
-        for i in range(num_cues):
-            cue = Cue(
-                id=f"cue_{i}",
-                audio_id="test_audio",
-                start_time=0.0,
-                end_time=10.0,
-                silence_before=0.0,
-                silence_after=0.0,
-                volume=1.0,
-                label=f"Cue {i}"
-            )
-            controller._cue_manager.add_cue(cue)
+        controller = get_controller()
+        
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
+        controller._cue_manager.add_cues(_CUE_LIST[:num_cues])
         
         # 设置到最后一个
         controller._cue_manager.set_index(num_cues - 1)
@@ -357,21 +430,14 @@ class TestSfxToggleProperty:
     """
     
     @given(
-        sfx_id=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N')))
+        sfx_id=sfx_id_strategy
     )
-    @settings(max_examples=100)
+    @settings(FAST_SETTINGS)
     def test_toggle_sfx_stops_playing(self, sfx_id):
         """再次触发正在播放的音效应停止"""
-        controller = create_controller()
-        
-        # 创建测试音效
-        sfx = AudioTrack(
-            id=sfx_id,
-            file_path=f"/fake/path/{sfx_id}.mp3",
-            duration=5.0,
-            title="Test SFX",
-            track_type="sfx"
-        )
+        controller = get_controller()
+        
+        sfx = _SFX_TRACKS[sfx_id]
         
         # 第一次触发 - 开始播放
         result1 = controller.toggle_sfx(sfx_id, sfx)
@@ -384,21 +450,14 @@ class TestSfxToggleProperty:
         assert not controller.is_sfx_playing(sfx_id)
     
     @given(
-        sfx_id=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N')))
+        sfx_id=sfx_id_strategy
     )
-    @settings(max_examples=100)
+    @settings(FAST_SETTINGS)
     def test_toggle_sfx_starts_when_not_playing(self, sfx_id):
         """触发未播放的音效应开始播放"""
-        controller = create_controller()
-        
-        # 创建测试音效
-        sfx = AudioTrack(
-            id=sfx_id,
-            file_path=f"/fake/path/{sfx_id}.mp3",
-            duration=5.0,
-            title="Test SFX",
-            track_type="sfx"
-        )
+        controller = get_controller()
+        
+        sfx = _SFX_TRACKS[sfx_id]
         
         # 确保未播放
         assert not controller.is_sfx_playing(sfx_id)
@@ -420,33 +479,19 @@ class TestBgmSfxIndependentProperty:
     """
     
     @given(
-        bgm_position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-        sfx_id=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N')))
+        bgm_position=position_strategy,
+        sfx_id=sfx_id_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_sfx_play_does_not_affect_bgm(self, bgm_position, sfx_id):
         """播放音效不应影响 BGM 状态"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        bgm = AudioTrack(
-            id="test_bgm",
-            file_path="/fake/path/bgm.mp3",
-            duration=200.0,
-            title="Test BGM",
-            track_type="bgm"
-        )
-        sfx = AudioTrack(
-            id=sfx_id,
-            file_path=f"/fake/path/{sfx_id}.mp3",
-            duration=5.0,
-            title="Test SFX",
-            track_type="sfx"
-        )
+        controller = get_controller()
+        
+        sfx = _SFX_TRACKS[sfx_id]
         
         # 设置手动模式并播放 BGM
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = bgm
+        controller._manual_audio = _TEST_BGM
         controller._manual_start_pos = bgm_position
         controller._manual_silence_before = 0.0
         run_async(controller.play())
@@ -465,33 +510,19 @@ class TestBgmSfxIndependentProperty:
         assert controller._current_audio_id == bgm_audio_id_before
     
     @given(
-        bgm_position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-        sfx_id=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N')))
+        bgm_position=position_strategy,
+        sfx_id=sfx_id_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_sfx_stop_does_not_affect_bgm(self, bgm_position, sfx_id):
         """停止音效不应影响 BGM 状态"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        bgm = AudioTrack(
-            id="test_bgm",
-            file_path="/fake/path/bgm.mp3",
-            duration=200.0,
-            title="Test BGM",
-            track_type="bgm"
-        )
-        sfx = AudioTrack(
-            id=sfx_id,
-            file_path=f"/fake/path/{sfx_id}.mp3",
-            duration=5.0,
-            title="Test SFX",
-            track_type="sfx"
-        )
+        controller = get_controller()
+        
+        sfx = _SFX_TRACKS[sfx_id]
         
         # 设置手动模式并播放 BGM
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = bgm
+        controller._manual_audio = _TEST_BGM
         controller._manual_start_pos = bgm_position
         controller._manual_silence_before = 0.0
         run_async(controller.play())
@@ -526,34 +557,22 @@ class TestReplayPositionProperty:
     @given(
         initial_position=st.floats(min_value=10.0, max_value=100.0, allow_nan=False, allow_infinity=False)
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_replay_resets_position_manual_mode(self, initial_position):
         """手动模式重播后位置应归零"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 设置手动模式
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = audio
+        controller._manual_audio = _TEST_AUDIO
         controller._manual_start_pos = initial_position
         controller._manual_silence_before = 0.0
         
-        # 开始播放
-        run_async(controller.play())
+        # 开始播放后执行重播
+        position_before = run_async(_play_then_replay(controller))
         
         # 验证初始位置
-        assert controller._current_position == initial_position
-        
-        # 执行重播
-        run_async(controller.replay())
+        assert position_before == initial_position
         
         # 验证位置归零
         assert controller._current_position == 0.0
@@ -561,42 +580,20 @@ class TestReplayPositionProperty:
     @given(
         cue_start_time=st.floats(min_value=0.0, max_value=50.0, allow_nan=False, allow_infinity=False)
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_replay_resets_to_cue_start_auto_mode(self, cue_start_time):
         """自动模式重播后位置应回到 Cue 的 start_time"""
-        controller = create_controller()
-        
-        # 创建测试音频和 Cue
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
-        cue = Cue(
-            id="test_cue",
-            audio_id="test_audio",
-            start_time=cue_start_time,
-            end_time=100.0,
-            silence_before=0.0,
-            silence_after=0.0,
-            volume=1.0,
-            label="Test Cue"
-        )
+        controller = get_controller()
+        
+        # 只有 start_time 随样例变化
+        cue = replace(_TEST_CUE, start_time=cue_start_time, end_time=100.0)
         
-        controller._cue_manager.add_audio_file(audio)
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
         controller._cue_manager.add_cue(cue)
         controller._mode = PlayMode.AUTO
         
-        # 开始播放
-        run_async(controller.play())
-        
-        # 模拟播放一段时间后
-        controller._current_position = cue_start_time + 30.0
-        
-        # 执行重播
-        run_async(controller.replay())
+        # 开始播放，模拟播放一段时间后执行重播
+        run_async(_play_then_replay(controller, cue_start_time + 30.0))
         
         # 验证位置回到 Cue 的 start_time
         assert controller._current_position == cue_start_time
@@ -613,26 +610,17 @@ class TestVolumeAdjustmentProperty:
     """
     
     @given(
-        initial_volume=volume_strategy(),
-        new_volume=volume_strategy()
+        initial_volume=volume_strategy,
+        new_volume=volume_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_bgm_volume_change_preserves_playback(self, initial_volume, new_volume):
         """调节 BGM 音量不应中断播放"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 设置手动模式并播放
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = audio
+        controller._manual_audio = _TEST_AUDIO
         controller._manual_start_pos = 0.0
         controller._manual_silence_before = 0.0
         controller.set_bgm_volume(initial_volume)
@@ -650,26 +638,17 @@ class TestVolumeAdjustmentProperty:
         assert controller._is_paused == is_paused_before
     
     @given(
-        initial_volume=volume_strategy(),
-        new_volume=volume_strategy()
+        initial_volume=volume_strategy,
+        new_volume=volume_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_sfx_volume_change_preserves_playback(self, initial_volume, new_volume):
         """调节音效音量不应中断 BGM 播放"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 设置手动模式并播放
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = audio
+        controller._manual_audio = _TEST_AUDIO
         controller._manual_start_pos = 0.0
         controller._manual_silence_before = 0.0
         controller.set_sfx_volume(initial_volume)
@@ -698,34 +677,15 @@ class TestModeSwitchPositionProperty:
     """
     
     @given(
-        position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
+        position=position_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_auto_to_manual_preserves_position(self, position):
         """从自动模式切换到手动模式，位置应保持"""
-        controller = create_controller()
-        
-        # 创建测试音频和 Cue
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
-        cue = Cue(
-            id="test_cue",
-            audio_id="test_audio",
-            start_time=0.0,
-            end_time=150.0,
-            silence_before=0.0,
-            silence_after=0.0,
-            volume=1.0,
-            label="Test Cue"
-        )
+        controller = get_controller()
         
-        controller._cue_manager.add_audio_file(audio)
-        controller._cue_manager.add_cue(cue)
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
+        controller._cue_manager.add_cue(_TEST_CUE)
         controller._mode = PlayMode.AUTO
         
         # 开始播放
@@ -734,7 +694,7 @@ class TestModeSwitchPositionProperty:
         # 设置当前位置
         controller._current_position = position
         controller._playback_start_position = position
-        controller._playback_start_time = time.time()
+        controller._playback_start_time = controller._clock()
         
         # 记录位置
         pos_before = controller._get_current_position()
@@ -745,44 +705,25 @@ class TestModeSwitchPositionProperty:
         # 验证模式已切换
         assert controller._mode == PlayMode.MANUAL
         
-        # 验证位置保持（允许小误差）
+        # 验证位置保持
         pos_after = controller._get_current_position()
-        assert abs(pos_before - pos_after) <= 0.2, \
+        assert pos_after == pos_before, \
             f"Position changed after mode switch: {pos_before} -> {pos_after}"
     
     @given(
-        position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
+        position=position_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_manual_to_auto_preserves_position(self, position):
         """从手动模式切换到自动模式，位置应保持"""
-        controller = create_controller()
-        
-        # 创建测试音频和 Cue
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
-        cue = Cue(
-            id="test_cue",
-            audio_id="test_audio",
-            start_time=0.0,
-            end_time=150.0,
-            silence_before=0.0,
-            silence_after=0.0,
-            volume=1.0,
-            label="Test Cue"
-        )
+        controller = get_controller()
         
-        controller._cue_manager.add_audio_file(audio)
-        controller._cue_manager.add_cue(cue)
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
+        controller._cue_manager.add_cue(_TEST_CUE)
         
         # 设置手动模式并播放
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = audio
+        controller._manual_audio = _TEST_AUDIO
         controller._manual_start_pos = position
         controller._manual_silence_before = 0.0
         run_async(controller.play())
@@ -790,7 +731,7 @@ class TestModeSwitchPositionProperty:
         # 设置当前位置
         controller._current_position = position
         controller._playback_start_position = position
-        controller._playback_start_time = time.time()
+        controller._playback_start_time = controller._clock()
         
         # 记录位置
         pos_before = controller._get_current_position()
@@ -801,9 +742,9 @@ class TestModeSwitchPositionProperty:
         # 验证模式已切换
         assert controller._mode == PlayMode.AUTO
         
-        # 验证位置保持（允许小误差）
+        # 验证位置保持
         pos_after = controller._get_current_position()
-        assert abs(pos_before - pos_after) <= 0.2, \
+        assert pos_after == pos_before, \
             f"Position changed after mode switch: {pos_before} -> {pos_after}"
 
 
@@ -821,35 +762,16 @@ class TestModeSwitchStateSyncProperty:
         is_playing=st.booleans(),
         is_paused=st.booleans()
     )
-    @settings(max_examples=100)
+    @settings(FAST_SETTINGS)
     def test_mode_switch_syncs_state(self, is_playing, is_paused):
         """模式切换后状态应同步"""
         # 排除无效状态组合
         assume(not (is_paused and not is_playing))  # 暂停必须在播放中
         
-        controller = create_controller()
-        
-        # 创建测试音频和 Cue
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
-        cue = Cue(
-            id="test_cue",
-            audio_id="test_audio",
-            start_time=0.0,
-            end_time=150.0,
-            silence_before=0.0,
-            silence_after=0.0,
-            volume=1.0,
-            label="Test Cue"
-        )
+        controller = get_controller()
         
-        controller._cue_manager.add_audio_file(audio)
-        controller._cue_manager.add_cue(cue)
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
+        controller._cue_manager.add_cue(_TEST_CUE)
         
         # 设置初始状态
         controller._mode = PlayMode.AUTO
@@ -883,48 +805,25 @@ class TestBgmMutexAutoBreakpointProperty:
         old_position=st.floats(min_value=1.0, max_value=100.0, allow_nan=False, allow_infinity=False),
         new_position=st.floats(min_value=0.0, max_value=50.0, allow_nan=False, allow_infinity=False)
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_new_bgm_stops_old_and_saves_breakpoint(self, old_position, new_position):
         """播放新 BGM 时，旧 BGM 应停止并保存断点"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        old_bgm = AudioTrack(
-            id="old_bgm",
-            file_path="/fake/path/old.mp3",
-            duration=200.0,
-            title="Old BGM",
-            track_type="bgm"
-        )
-        new_bgm = AudioTrack(
-            id="new_bgm",
-            file_path="/fake/path/new.mp3",
-            duration=200.0,
-            title="New BGM",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 设置手动模式并播放旧 BGM
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = old_bgm
+        controller._manual_audio = _OLD_BGM
         controller._manual_start_pos = old_position
         controller._manual_silence_before = 0.0
-        run_async(controller.play())
-        
-        # 设置当前位置
-        controller._current_position = old_position
-        controller._playback_start_position = old_position
-        controller._playback_start_time = time.time()
-        
-        # 验证旧 BGM 正在播放
-        assert controller._is_playing
-        assert controller._current_audio_id == "old_bgm"
         
         # 记录旧 BGM 断点数量
         old_breakpoints_count = len(controller._breakpoint_manager.get_breakpoints("old_bgm"))
         
-        # 播放新 BGM
-        run_async(controller.play_new_bgm(new_bgm, new_position))
+        # 播放旧 BGM（固定时钟下位置停留在 old_position），再播放新 BGM
+        audio_id_before = run_async(_play_then_switch_bgm(controller, _NEW_BGM, new_position))
+        
+        # 验证切换前播放的是旧 BGM
+        assert audio_id_before == "old_bgm"
         
         # 验证新 BGM 正在播放
         assert controller._is_playing
@@ -938,45 +837,32 @@ class TestBgmMutexAutoBreakpointProperty:
         # 验证断点位置
         breakpoints = controller._breakpoint_manager.get_breakpoints("old_bgm")
         latest_bp = breakpoints[-1]
-        assert abs(latest_bp.position - old_position) <= 0.2, \
-            f"Breakpoint position should match: expected ~{old_position}, got {latest_bp.position}"
+        assert latest_bp.position == old_position, \
+            f"Breakpoint position should match: expected {old_position}, got {latest_bp.position}"
         assert latest_bp.auto_saved == True, "Breakpoint should be marked as auto-saved"
     
     @given(
-        position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
+        position=position_strategy
     )
-    @settings(max_examples=100)
+    @settings(THOROUGH_SETTINGS)
     def test_new_bgm_when_not_playing_no_breakpoint(self, position):
         """未播放时播放新 BGM 不应创建断点"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        new_bgm = AudioTrack(
-            id="new_bgm",
-            file_path="/fake/path/new.mp3",
-            duration=200.0,
-            title="New BGM",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 确保未播放
         assert not controller._is_playing
         
         # 记录断点数量
-        all_breakpoints_before = sum(
-            len(bps) for bps in controller._breakpoint_manager.breakpoints.values()
-        )
+        all_breakpoints_before = controller._breakpoint_manager.get_breakpoint_count()
         
         # 播放新 BGM
-        run_async(controller.play_new_bgm(new_bgm, position))
+        run_async(controller.play_new_bgm(_NEW_BGM, position))
         
         # 验证新 BGM 正在播放
         assert controller._is_playing
         
         # 验证没有创建新断点
-        all_breakpoints_after = sum(
-            len(bps) for bps in controller._breakpoint_manager.breakpoints.values()
-        )
+        all_breakpoints_after = controller._breakpoint_manager.get_breakpoint_count()
         assert all_breakpoints_after == all_breakpoints_before, \
             "No breakpoint should be created when not playing"
 
@@ -992,24 +878,15 @@ class TestBreakpointRestorePositionProperty:
     """
     
     @given(
-        breakpoint_position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
+        breakpoint_position=position_strategy
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @settings(THOROUGH_SETTINGS)
     def test_restore_breakpoint_sets_correct_position(self, breakpoint_position):
         """从断点恢复播放后，播放位置应等于断点记录的位置"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 将音频添加到 cue_manager 以便 restore_breakpoint 能找到它
-        controller._cue_manager.add_audio_file(audio)
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
         
         # 保存一个断点
         bp_id = controller._breakpoint_manager.save_breakpoint(
@@ -1030,7 +907,7 @@ class TestBreakpointRestorePositionProperty:
         
         # 验证播放位置等于断点位置
         current_pos = controller._get_current_position()
-        assert abs(current_pos - breakpoint_position) <= 0.1, \
+        assert current_pos == breakpoint_position, \
             f"Position should match breakpoint: expected {breakpoint_position}, got {current_pos}"
         
         # 验证当前音频 ID
@@ -1041,34 +918,17 @@ class TestBreakpointRestorePositionProperty:
         bp_position=st.floats(min_value=1.0, max_value=50.0, allow_nan=False, allow_infinity=False),
         current_position=st.floats(min_value=10.0, max_value=100.0, allow_nan=False, allow_infinity=False)
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @settings(THOROUGH_SETTINGS)
     def test_restore_breakpoint_while_playing_saves_current_position(self, bp_position, current_position):
         """在播放中恢复断点时，应保存当前播放位置为断点"""
-        controller = create_controller()
-        
-        # 创建两个测试音频
-        audio1 = AudioTrack(
-            id="audio_1",
-            file_path="/fake/path/audio1.mp3",
-            duration=200.0,
-            title="Audio 1",
-            track_type="bgm"
-        )
-        audio2 = AudioTrack(
-            id="audio_2",
-            file_path="/fake/path/audio2.mp3",
-            duration=200.0,
-            title="Audio 2",
-            track_type="bgm"
-        )
+        controller = get_controller()
         
         # 将音频添加到 cue_manager
-        controller._cue_manager.add_audio_file(audio1)
-        controller._cue_manager.add_audio_file(audio2)
+        controller._cue_manager.add_audio_files([_AUDIO_1, _AUDIO_2])
         
         # 设置手动模式并播放 audio1
         controller._mode = PlayMode.MANUAL
-        controller._manual_audio = audio1
+        controller._manual_audio = _AUDIO_1
         controller._manual_start_pos = current_position
         controller._manual_silence_before = 0.0
         run_async(controller.play())
@@ -1076,7 +936,7 @@ class TestBreakpointRestorePositionProperty:
         # 设置当前位置
         controller._current_position = current_position
         controller._playback_start_position = current_position
-        controller._playback_start_time = time.time()
+        controller._playback_start_time = controller._clock()
         
         # 记录 audio1 的断点数量
         audio1_bp_count_before = len(controller._breakpoint_manager.get_breakpoints("audio_1"))
@@ -1104,26 +964,14 @@ class TestBreakpointRestorePositionProperty:
         
         # 验证播放位置等于断点位置
         current_pos = controller._get_current_position()
-        assert abs(current_pos - bp_position) <= 0.1, \
+        assert current_pos == bp_position, \
             f"Position should match breakpoint: expected {bp_position}, got {current_pos}"
     
-    @given(
-        bp_position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_restore_nonexistent_breakpoint_fails(self, bp_position):
-        """恢复不存在的断点应返回 False"""
-        controller = create_controller()
-        
-        # 创建测试音频
-        audio = AudioTrack(
-            id="test_audio",
-            file_path="/fake/path/test.mp3",
-            duration=200.0,
-            title="Test Audio",
-            track_type="bgm"
-        )
-        controller._cue_manager.add_audio_file(audio)
+    def test_restore_nonexistent_breakpoint_fails(self):
+        """恢复不存在的断点应返回 False（与位置无关，运行一次即可）"""
+        controller = get_controller()
+        
+        controller._cue_manager.add_audio_file(_TEST_AUDIO)
         
         # 尝试恢复不存在的断点
         result = run_async(controller.restore_breakpoint("test_audio", "nonexistent_bp_id"))
@@ -1131,13 +979,10 @@ class TestBreakpointRestorePositionProperty:
         # 验证返回 False
         assert result == False, "Should return False for nonexistent breakpoint"
     
-    @given(
-        bp_position=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @pytest.mark.parametrize("bp_position", [0.0, 50.0, 100.0])
     def test_restore_breakpoint_for_nonexistent_audio_fails(self, bp_position):
-        """恢复不存在音频的断点应返回 False"""
-        controller = create_controller()
+        """恢复不存在音频的断点应返回 False（位置不影响该分支，只取边界和中点）"""
+        controller = get_controller()
         
         # 保存一个断点（但不添加对应的音频到 cue_manager）
         bp_id = controller._breakpoint_manager.save_breakpoint(
@@ -1151,3 +996,124 @@ class TestBreakpointRestorePositionProperty:
         
         # 验证返回 False（因为音频不存在）
         assert result == False, "Should return False when audio doesn't exist"
+
+
+# ==================== 状态机：连续操作下的状态一致性 ====================
+
+class ControllerMachine(RuleBasedStateMachine):
+    """
+    **Feature: multi-audio-player, Property 3/4/8/18/19: 连续操作下的状态一致性**
+    
+    *对于任意* 播放、暂停、继续、停止、跳转、模式切换和音效操作序列，
+    每一步都应满足对应属性（位置保持、索引递增、BGM 不受音效影响、模式切换状态同步）
+    **Validates: Requirements 2.2, 2.3, 3.3, 3.4, 7.1, 7.2, 7.4**
+    """
+    
+    # 状态机中使用的 Cue 数量
+    NUM_CUES = 3
+    
+    def __init__(self):
+        super().__init__()
+        self.controller = get_controller()
+        self.controller._cue_manager.add_audio_file(_TEST_AUDIO)
+        self.controller._cue_manager.add_cues(_CUE_LIST[:self.NUM_CUES])
+        self.controller._manual_audio = _TEST_AUDIO
+        self.controller._manual_start_pos = 5.0
+    
+    def _bgm_state(self):
+        """BGM 播放状态快照"""
+        ctrl = self.controller
+        return ctrl._is_playing, ctrl._is_paused, ctrl._current_audio_id
+    
+    @rule()
+    def play(self):
+        run_async(self.controller.play())
+    
+    @rule()
+    def stop(self):
+        run_async(self.controller.stop())
+        assert not self.controller._is_playing
+        assert not self.controller._is_paused
+    
+    @rule()
+    def pause(self):
+        ctrl = self.controller
+        was_active = ctrl._is_playing and not ctrl._is_paused
+        position = ctrl._get_current_position()
+        
+        result = run_async(ctrl.pause())
+        
+        assert result == was_active
+        if result:
+            assert ctrl._is_paused
+            assert ctrl._current_position == position
+    
+    @rule()
+    def resume(self):
+        ctrl = self.controller
+        was_paused = ctrl._is_paused
+        position = ctrl._get_current_position()
+        
+        result = run_async(ctrl.resume())
+        
+        assert result == was_paused
+        if result:
+            # Property 3: 继续后位置与暂停时一致
+            assert not ctrl._is_paused
+            assert ctrl._get_current_position() == position
+    
+    @rule()
+    def next_cue(self):
+        ctrl = self.controller
+        index_before = ctrl._cue_manager.current_index
+        
+        run_async(ctrl.next_cue())
+        
+        # Property 4: 自动模式下索引递增 1（已是最后一个时不变）
+        if ctrl._mode == PlayMode.AUTO:
+            expected = min(index_before + 1, self.NUM_CUES - 1)
+        else:
+            expected = index_before
+        assert ctrl._cue_manager.current_index == expected
+    
+    @rule(mode=st.sampled_from(PlayMode))
+    def switch_mode(self, mode):
+        ctrl = self.controller
+        is_playing, is_paused, _ = self._bgm_state()
+        position = ctrl._get_current_position()
+        
+        run_async(ctrl.switch_mode(mode))
+        
+        # Property 18/19: 模式切换后位置与播放状态保持
+        assert ctrl._mode == mode
+        assert ctrl._is_playing == is_playing
+        assert ctrl._is_paused == is_paused
+        assert ctrl._get_current_position() == position
+    
+    @rule(sfx_id=sfx_id_strategy)
+    def play_sfx(self, sfx_id):
+        # Property 8: 播放音效不影响 BGM
+        before = self._bgm_state()
+        self.controller.play_sfx(sfx_id, _SFX_TRACKS[sfx_id])
+        assert self.controller.is_sfx_playing(sfx_id)
+        assert self._bgm_state() == before
+    
+    @rule(sfx_id=sfx_id_strategy)
+    def stop_sfx(self, sfx_id):
+        # Property 8: 停止音效不影响 BGM
+        before = self._bgm_state()
+        self.controller.stop_sfx(sfx_id)
+        assert not self.controller.is_sfx_playing(sfx_id)
+        assert self._bgm_state() == before
+    
+    @invariant()
+    def paused_implies_playing(self):
+        assert self.controller._is_playing or not self.controller._is_paused
+    
+    @invariant()
+    def cue_index_in_range(self):
+        assert 0 <= self.controller._cue_manager.current_index < self.NUM_CUES
+
+
+ControllerMachine.TestCase.settings = settings(THOROUGH_SETTINGS, stateful_step_count=20)
+TestControllerMachine = ControllerMachine.TestCase
@@ -4,22 +4,29 @@ CueListConfig 属性测试
 **Feature: multi-audio-player, Property 23: 配置序列化往返**
 **Validates: Requirements 9.4, 9.5**
 """
+import string
+
 import pytest
-from hypothesis import given, strategies as st, settings
-from datetime import datetime, timezone
+from hypothesis import given, strategies as st
+from datetime import datetime, timedelta
 
 from src.models.cue_config import CueListConfig
 from src.models.cue import Cue
 from src.models.audio_track import AudioTrack
 
 
+# ID 字母表：ASCII 加若干汉字，覆盖非 ASCII 字符的 JSON 往返
+_ID_ALPHABET = string.ascii_letters + string.digits + "_-" + "音频提示背景音乐效果"
+id_strategy = st.text(min_size=1, max_size=50, alphabet=_ID_ALPHABET)
+
+
 # 定义 AudioTrack 的生成策略
 audio_track_strategy = st.builds(
     AudioTrack,
-    id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-')),
-    file_path=st.text(min_size=1, max_size=100, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-./\\')),
+    id=id_strategy,
+    file_path=st.text(min_size=1, max_size=40, alphabet=_ID_ALPHABET + "./\\"),
     duration=st.floats(min_value=0.1, max_value=36000.0, allow_nan=False, allow_infinity=False),
-    title=st.text(min_size=0, max_size=100),
+    title=st.text(min_size=0, max_size=20),
     track_type=st.sampled_from(["bgm", "sfx"]),
 )
 
@@ -27,32 +34,36 @@ audio_track_strategy = st.builds(
 # 定义 Cue 的生成策略
 cue_strategy = st.builds(
     Cue,
-    id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-')),
-    audio_id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-')),
+    id=id_strategy,
+    audio_id=id_strategy,
     start_time=st.floats(min_value=0.0, max_value=36000.0, allow_nan=False, allow_infinity=False),
     end_time=st.one_of(st.none(), st.floats(min_value=0.0, max_value=36000.0, allow_nan=False, allow_infinity=False)),
     silence_before=st.floats(min_value=0.0, max_value=60.0, allow_nan=False, allow_infinity=False),
     silence_after=st.floats(min_value=0.0, max_value=60.0, allow_nan=False, allow_infinity=False),
     volume=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
-    label=st.text(min_size=0, max_size=100),
+    label=st.text(min_size=0, max_size=20),
 )
 
 
 # 定义 datetime 的生成策略（使用 naive datetime 避免时区问题）
-datetime_strategy = st.datetimes(
-    min_value=datetime(2000, 1, 1),
-    max_value=datetime(2100, 12, 31),
+# 以 2000-01-01 为基准叠加一个整数微秒偏移：只需一次整数抽取，
+# 比 st.datetimes 逐字段（年月日时分秒微秒）生成和收缩更便宜，
+# 且保留微秒精度以覆盖 isoformat 往返
+_DATETIME_BASE = datetime(2000, 1, 1)
+_DATETIME_SPAN_US = (datetime(2100, 12, 31) - _DATETIME_BASE) // timedelta(microseconds=1)
+datetime_strategy = st.integers(min_value=0, max_value=_DATETIME_SPAN_US).map(
+    lambda us: _DATETIME_BASE + timedelta(microseconds=us)
 )
 
 
 # 定义 CueListConfig 的生成策略
 cue_list_config_strategy = st.builds(
     CueListConfig,
-    version=st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='.')),
+    version=st.text(min_size=1, max_size=20, alphabet=string.ascii_letters + string.digits + "."),
     name=st.text(min_size=0, max_size=100),
     created_at=datetime_strategy,
-    cues=st.lists(cue_strategy, min_size=0, max_size=20),
-    audio_files=st.lists(audio_track_strategy, min_size=0, max_size=20),
+    cues=st.lists(cue_strategy, min_size=0, max_size=10),
+    audio_files=st.lists(audio_track_strategy, min_size=0, max_size=5),
 )
 
 
@@ -66,15 +77,15 @@ class TestCueListConfigRoundTrip:
     """
 
     @given(config=cue_list_config_strategy)
-    @settings(max_examples=100)
     def test_json_round_trip(self, config: CueListConfig):
         """
         属性测试：JSON 序列化往返一致性
         
+        from_json/to_json 分别经由 from_dict/to_dict，JSON 往返同时覆盖字典往返。
         对于任意有效的 CueListConfig 对象：
         1. 序列化为 JSON 字符串
-        2. 从 JSON 字符串反序列化
-        3. 结果应与原始对象等价
+        2. 从 JSON 字符串反序列化，结果应与原始对象等价
+        3. 再次序列化，应得到完全相同的 JSON 字符串
         """
         # 序列化
         json_str = config.to_json()
@@ -88,65 +99,10 @@ class TestCueListConfigRoundTrip:
         assert restored.created_at == config.created_at
         
         # 验证 cues 列表
-        assert len(restored.cues) == len(config.cues)
-        for orig_cue, rest_cue in zip(config.cues, restored.cues):
-            assert rest_cue.id == orig_cue.id
-            assert rest_cue.audio_id == orig_cue.audio_id
-            assert rest_cue.start_time == orig_cue.start_time
-            assert rest_cue.end_time == orig_cue.end_time
-            assert rest_cue.silence_before == orig_cue.silence_before
-            assert rest_cue.silence_after == orig_cue.silence_after
-            assert rest_cue.volume == orig_cue.volume
-            assert rest_cue.label == orig_cue.label
+        assert restored.cues == config.cues
         
         # 验证 audio_files 列表
-        assert len(restored.audio_files) == len(config.audio_files)
-        for orig_track, rest_track in zip(config.audio_files, restored.audio_files):
-            assert rest_track.id == orig_track.id
-            assert rest_track.file_path == orig_track.file_path
-            assert rest_track.duration == orig_track.duration
-            assert rest_track.title == orig_track.title
-            assert rest_track.track_type == orig_track.track_type
-
-    @given(config=cue_list_config_strategy)
-    @settings(max_examples=100)
-    def test_dict_round_trip(self, config: CueListConfig):
-        """
-        属性测试：字典序列化往返一致性
-        
-        对于任意有效的 CueListConfig 对象：
-        1. 转换为字典
-        2. 从字典创建新实例
-        3. 结果应与原始对象等价
-        """
-        # 转换为字典
-        data = config.to_dict()
-        
-        # 从字典创建
-        restored = CueListConfig.from_dict(data)
-        
-        # 验证基本字段
-        assert restored.version == config.version
-        assert restored.name == config.name
-        assert restored.created_at == config.created_at
-        
-        # 验证 cues 列表长度和内容
-        assert len(restored.cues) == len(config.cues)
-        for orig_cue, rest_cue in zip(config.cues, restored.cues):
-            assert rest_cue.id == orig_cue.id
-            assert rest_cue.audio_id == orig_cue.audio_id
-            assert rest_cue.start_time == orig_cue.start_time
-            assert rest_cue.end_time == orig_cue.end_time
-            assert rest_cue.silence_before == orig_cue.silence_before
-            assert rest_cue.silence_after == orig_cue.silence_after
-            assert rest_cue.volume == orig_cue.volume
-            assert rest_cue.label == orig_cue.label
+        assert restored.audio_files == config.audio_files
         
-        # 验证 audio_files 列表长度和内容
-        assert len(restored.audio_files) == len(config.audio_files)
-        for orig_track, rest_track in zip(config.audio_files, restored.audio_files):
-            assert rest_track.id == orig_track.id
-            assert rest_track.file_path == orig_track.file_path
-            assert rest_track.duration == orig_track.duration
-            assert rest_track.title == orig_track.title
-            assert rest_track.track_type == orig_track.track_type
+        # 再次序列化应与第一次输出逐字一致
+        assert restored.to_json() == json_str
@@ -4,6 +4,8 @@ CueManager 属性测试
 **Feature: multi-audio-player, Property 22: Cue 添加完整性**
 **Validates: Requirements 9.2**
 """
+import string
+
 import pytest
 from hypothesis import given, strategies as st, settings
 from datetime import datetime
@@ -13,17 +15,32 @@ from src.models.cue import Cue
 from src.models.audio_track import AudioTrack
 
 
+# ID 只用于查找和比较，从固定的 ASCII 字母表生成
+id_strategy = st.text(min_size=1, max_size=50, alphabet=string.ascii_letters + string.digits + "_-")
+
+
 # 定义 Cue 的生成策略
 cue_strategy = st.builds(
     Cue,
-    id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-')),
-    audio_id=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-')),
+    id=id_strategy,
+    audio_id=id_strategy,
     start_time=st.floats(min_value=0.0, max_value=36000.0, allow_nan=False, allow_infinity=False),
     end_time=st.one_of(st.none(), st.floats(min_value=0.0, max_value=36000.0, allow_nan=False, allow_infinity=False)),
     silence_before=st.floats(min_value=0.0, max_value=60.0, allow_nan=False, allow_infinity=False),
     silence_after=st.floats(min_value=0.0, max_value=60.0, allow_nan=False, allow_infinity=False),
     volume=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
-    label=st.text(min_size=0, max_size=100),
+    label=st.text(min_size=0, max_size=20),
+)
+
+
+# 定义 AudioTrack 的生成策略
+audio_track_strategy = st.builds(
+    AudioTrack,
+    id=id_strategy,
+    file_path=st.text(min_size=1, max_size=40),
+    duration=st.floats(min_value=0.0, max_value=36000.0, allow_nan=False, allow_infinity=False),
+    title=st.text(min_size=0, max_size=20),
+    track_type=st.sampled_from(["bgm", "sfx"]),
 )
 
 
@@ -36,7 +53,6 @@ class TestCueAddIntegrity:
     """
 
     @given(cue=cue_strategy)
-    @settings(max_examples=100)
     def test_add_cue_contains_cue(self, cue: Cue):
         """
         属性测试：添加 Cue 后列表应包含该 Cue
@@ -57,7 +73,6 @@ class TestCueAddIntegrity:
 
 
     @given(cue=cue_strategy)
-    @settings(max_examples=100)
     def test_add_cue_preserves_attributes(self, cue: Cue):
         """
         属性测试：添加 Cue 后属性应完整保留
@@ -89,7 +104,6 @@ class TestCueAddIntegrity:
         assert retrieved.label == cue.label
 
     @given(cues=st.lists(cue_strategy, min_size=1, max_size=20, unique_by=lambda c: c.id))
-    @settings(max_examples=100)
     def test_add_multiple_cues_all_present(self, cues: list):
         """
         属性测试：添加多个 Cue 后所有 Cue 都应存在
@@ -108,16 +122,14 @@ class TestCueAddIntegrity:
         # 验证数量正确
         assert manager.get_cue_count() == len(cues)
         
-        # 验证所有 Cue 都存在
+        # 验证所有 Cue 都存在（每个 ID 只查一次索引，contains_cue 由其他属性覆盖）
         for cue in cues:
-            assert manager.contains_cue(cue.id)
             retrieved = manager.get_cue_by_id(cue.id)
             assert retrieved is not None
             assert retrieved.id == cue.id
             assert retrieved.audio_id == cue.audio_id
 
     @given(cues=st.lists(cue_strategy, min_size=1, max_size=20, unique_by=lambda c: c.id))
-    @settings(max_examples=100)
     def test_add_cues_preserves_order(self, cues: list):
         """
         属性测试：添加 Cue 后顺序应保持一致
@@ -140,3 +152,250 @@ class TestCueAddIntegrity:
         assert len(cue_list) == len(cues)
         for i, (original, retrieved) in enumerate(zip(cues, cue_list)):
             assert retrieved.id == original.id, f"Cue at index {i} has wrong id"
+
+
+class TestCueBatchUpdate:
+    """
+    批量更新 Cue 属性
+    
+    *对于任意* Cue 列表和更新集合，update_cues 的结果应与依次调用 update_cue 相同
+    """
+
+    @given(
+        cues=st.lists(cue_strategy, min_size=1, max_size=20),
+        data=st.data(),
+    )
+    @settings(max_examples=100)
+    def test_update_cues_matches_update_cue(self, cues: list, data):
+        """
+        属性测试：批量更新与逐个更新结果一致
+        
+        对于任意 Cue 列表（可能包含重复 ID）：
+        1. 随机选择部分 Cue ID（可能包含不存在的 ID）并生成新的音量
+        2. 分别用 update_cues 和 update_cue 更新两个 CueManager
+        3. 两者的 Cue 列表和返回的更新数量应一致
+        """
+        ids = [c.id for c in cues] + ["missing_cue_id"]
+        targets = data.draw(st.lists(st.sampled_from(ids), unique=True))
+        volumes = data.draw(st.lists(
+            st.floats(min_value=0.0, max_value=1.0, allow_nan=False),
+            min_size=len(targets), max_size=len(targets)
+        ))
+        updates = {cid: {"volume": v} for cid, v in zip(targets, volumes)}
+        
+        batch = CueManager()
+        single = CueManager()
+        for cue in cues:
+            batch.add_cue(cue)
+            single.add_cue(cue)
+        
+        updated = batch.update_cues(updates)
+        expected = sum(single.update_cue(cid, **kwargs) for cid, kwargs in updates.items())
+        
+        assert updated == expected
+        assert [c.to_dict() for c in batch.cue_list] == [c.to_dict() for c in single.cue_list]
+
+
+class TestCueBatchAdd:
+    """
+    批量添加 Cue
+    
+    *对于任意* Cue 列表（包括重复 ID），add_cues 的结果应与依次调用 add_cue 相同
+    """
+
+    @given(
+        existing=st.lists(cue_strategy, max_size=10),
+        cues=st.lists(cue_strategy, max_size=20),
+    )
+    @settings(max_examples=100)
+    def test_add_cues_matches_add_cue(self, existing: list, cues: list):
+        """
+        属性测试：批量添加与逐个添加后，列表和 ID 查找结果一致
+        """
+        batch = CueManager()
+        single = CueManager()
+        batch.add_cues(existing)
+        for cue in existing:
+            single.add_cue(cue)
+        
+        batch.add_cues(cues)
+        for cue in cues:
+            single.add_cue(cue)
+        
+        assert batch.cue_list == single.cue_list
+        for cue in existing + cues:
+            assert batch.get_cue_by_id(cue.id) is single.get_cue_by_id(cue.id)
+
+
+class TestAudioBatchAdd:
+    """
+    批量添加音频文件
+    
+    *对于任意* 音频列表，add_audio_files 的结果应与依次调用 add_audio_file 相同
+    """
+
+    @given(
+        existing=st.lists(audio_track_strategy, max_size=10),
+        audios=st.lists(audio_track_strategy, max_size=20),
+    )
+    @settings(max_examples=100)
+    def test_add_audio_files_matches_add_audio_file(self, existing: list, audios: list):
+        """
+        属性测试：批量添加与逐个添加结果一致，且保持顺序
+        """
+        batch = CueManager()
+        single = CueManager()
+        for audio in existing:
+            batch.add_audio_file(audio)
+            single.add_audio_file(audio)
+        
+        batch.add_audio_files(audios)
+        for audio in audios:
+            single.add_audio_file(audio)
+        
+        assert [a.to_dict() for a in batch.audio_files] == [a.to_dict() for a in single.audio_files]
+        assert batch.audio_files[len(existing):] == audios
+
+
+class TestCueIdIndex:
+    """
+    Cue ID 索引一致性
+    
+    *对于任意* 操作序列（包括重复 ID），get_cue_by_id 的结果应与按顺序扫描列表相同
+    """
+
+    @given(
+        cues=st.lists(cue_strategy, max_size=10),
+        data=st.data(),
+    )
+    @settings(max_examples=100)
+    def test_get_cue_by_id_matches_linear_scan(self, cues: list, data):
+        """
+        属性测试：任意增删改移操作后，索引查找与线性扫描结果一致
+        """
+        manager = CueManager()
+        pool = list(cues)
+        
+        for cue in cues:
+            manager.add_cue(cue)
+        
+        operations = data.draw(st.lists(
+            st.sampled_from(["insert", "remove", "update", "rename", "move", "clear"]),
+            max_size=15
+        ))
+        for op in operations:
+            current = manager.cue_list
+            if op == "insert":
+                cue = data.draw(cue_strategy | st.sampled_from(pool) if pool else cue_strategy)
+                pool.append(cue)
+                manager.insert_cue(data.draw(st.integers(0, len(current))), cue)
+            elif op == "remove" and current:
+                manager.remove_cue(data.draw(st.sampled_from(current)).id)
+            elif op == "update" and current:
+                manager.update_cue(data.draw(st.sampled_from(current)).id, volume=0.5)
+            elif op == "rename" and current:
+                new_id = data.draw(st.sampled_from([c.id for c in current] + ["renamed"]))
+                manager.update_cue(data.draw(st.sampled_from(current)).id, id=new_id)
+            elif op == "move" and current:
+                manager.move_cue(
+                    data.draw(st.integers(0, len(current) - 1)),
+                    data.draw(st.integers(0, len(current) - 1))
+                )
+            elif op == "clear":
+                manager.clear_cues()
+        
+        cue_list = manager.cue_list
+        ids = {c.id for c in cue_list} | {c.id for c in pool} | {"renamed"}
+        for cue_id in ids:
+            expected = next((c for c in cue_list if c.id == cue_id), None)
+            assert manager.get_cue_by_id(cue_id) is expected
+            assert manager.contains_cue(cue_id) == (expected is not None)
+
+
+class TestBatchRemove:
+    """
+    批量移除 Cue 和音频文件
+    
+    *对于任意* 列表（包括重复 ID）和 ID 集合，批量移除的结果应与逐个移除相同
+    """
+
+    @given(
+        cues=st.lists(cue_strategy, max_size=20),
+        data=st.data(),
+    )
+    @settings(max_examples=100)
+    def test_remove_cues_matches_remove_cue(self, cues: list, data):
+        """
+        属性测试：remove_cues 后列表、当前索引和 ID 查找与逐个 remove_cue 一致
+        """
+        ids = [c.id for c in cues] + ["missing_cue_id"]
+        targets = data.draw(st.lists(st.sampled_from(ids), unique=True))
+        
+        batch = CueManager()
+        single = CueManager()
+        for cue in cues:
+            batch.add_cue(cue)
+            single.add_cue(cue)
+        if cues:
+            index = data.draw(st.integers(0, len(cues) - 1))
+            batch.set_index(index)
+            single.set_index(index)
+        
+        removed = batch.remove_cues(targets)
+        expected = sum(single.remove_cue(cid) for cid in targets)
+        
+        assert removed == expected
+        assert batch.cue_list == single.cue_list
+        assert batch.current_index == single.current_index
+        for cue_id in ids:
+            assert batch.get_cue_by_id(cue_id) is single.get_cue_by_id(cue_id)
+
+    @given(
+        audios=st.lists(audio_track_strategy, max_size=20),
+        data=st.data(),
+    )
+    @settings(max_examples=100)
+    def test_remove_audio_files_matches_remove_audio_file(self, audios: list, data):
+        """
+        属性测试：remove_audio_files 后音频列表与逐个 remove_audio_file 一致
+        """
+        ids = [a.id for a in audios] + ["missing_audio_id"]
+        targets = data.draw(st.lists(st.sampled_from(ids), unique=True))
+        
+        batch = CueManager()
+        single = CueManager()
+        batch.add_audio_files(audios)
+        single.add_audio_files(audios)
+        
+        removed = batch.remove_audio_files(targets)
+        expected = sum(single.remove_audio_file(aid) for aid in targets)
+        
+        assert removed == expected
+        assert batch.audio_files == single.audio_files
+
+
+class TestIterViews:
+    """
+    不复制的遍历接口
+    
+    *对于任意* Cue 和音频列表，iter_cues / iter_audio_files 应按顺序返回与副本相同的元素
+    """
+
+    @given(
+        cues=st.lists(cue_strategy, max_size=20),
+        audios=st.lists(audio_track_strategy, max_size=20),
+    )
+    @settings(max_examples=100)
+    def test_iter_matches_copies(self, cues: list, audios: list):
+        """
+        属性测试：遍历结果与 cue_list / audio_files 副本一致
+        """
+        manager = CueManager()
+        for cue in cues:
+            manager.add_cue(cue)
+        manager.add_audio_files(audios)
+        
+        assert list(manager.iter_cues()) == manager.cue_list
+        assert list(manager.iter_audio_files()) == manager.audio_files
+        assert manager.get_audio_ids() == {a.id for a in manager.audio_files}
+        assert manager.get_audio_count() == len(manager.audio_files)
@@ -0,0 +1,40 @@
+"""
+配置编辑器音频时长缓存测试
+
+测试 _DurationCache 在缓存文件无法打开时退化为不缓存，而不是让编辑器启动失败
+"""
+from src.tools.config_editor import _DurationCache
+
+
+class TestDurationCacheUnavailable:
+    """
+    测试缓存路径不可用时的退化行为
+    """
+
+    def test_parent_is_regular_file_disables_cache(self, tmp_path):
+        """
+        缓存目录与已有普通文件同名时（mkdir 抛出 OSError）：
+        1. 构造不应抛出异常
+        2. get() 始终返回 None
+        3. put_many() 不做任何事
+        """
+        blocker = tmp_path / "config"
+        blocker.write_text("not a directory")
+
+        cache = _DurationCache(blocker / "duration_cache.db")
+
+        assert cache.get("a.mp3", 1, 2) is None
+        cache.put_many([("a.mp3", 1, 2, 3.0)])
+        assert cache.get("a.mp3", 1, 2) is None
+        assert blocker.read_text() == "not a directory"
+        cache.close()
+
+    def test_usable_path_round_trip(self, tmp_path):
+        """路径可用时写入的记录可按 (路径, mtime, size) 查回，文件变化后不命中"""
+        cache = _DurationCache(tmp_path / "config" / "duration_cache.db")
+
+        cache.put_many([("a.mp3", 1, 2, 3.0)])
+
+        assert cache.get("a.mp3", 1, 2) == 3.0
+        assert cache.get("a.mp3", 1, 3) is None
+        cache.close()
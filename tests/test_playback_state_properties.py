@@ -5,7 +5,8 @@ PlaybackState 属性测试
 **Validates: Requirements 8.2**
 """
 import pytest
-from hypothesis import given, strategies as st, settings
+from dataclasses import asdict
+from hypothesis import given, strategies as st
 
 from src.models.playback_state import PlaybackState
 
@@ -35,59 +36,32 @@ class TestPlaybackStateRoundTrip:
     """
 
     @given(state=playback_state_strategy)
-    @settings(max_examples=100)
-    def test_json_round_trip(self, state: PlaybackState):
+    def test_round_trip(self, state: PlaybackState):
         """
         属性测试：JSON 序列化往返一致性
         
+        from_json/to_json 分别经由 from_dict/to_dict，JSON 往返同时覆盖字典往返。
         对于任意有效的 PlaybackState 对象：
-        1. 序列化为 JSON 字符串
-        2. 从 JSON 字符串反序列化
-        3. 结果应与原始对象等价
+        1. 序列化为 JSON 字符串后反序列化，结果应与原始对象等价
+        2. 再次序列化，应得到完全相同的 JSON 字符串
         """
-        # 序列化
         json_str = state.to_json()
-        
-        # 反序列化
         restored = PlaybackState.from_json(json_str)
         
-        # 验证所有字段一致
-        assert restored.mode == state.mode
-        assert restored.is_playing == state.is_playing
-        assert restored.is_paused == state.is_paused
-        assert restored.current_audio_id == state.current_audio_id
-        assert restored.current_position == state.current_position
-        assert restored.current_cue_index == state.current_cue_index
-        assert restored.bgm_volume == state.bgm_volume
-        assert restored.sfx_volume == state.sfx_volume
-        assert restored.in_silence == state.in_silence
-        assert restored.silence_remaining == state.silence_remaining
+        # dataclass 按字段逐一比较
+        assert restored == state
+        
+        # 再次序列化应与第一次输出逐字一致
+        assert restored.to_json() == json_str
 
     @given(state=playback_state_strategy)
-    @settings(max_examples=100)
-    def test_dict_round_trip(self, state: PlaybackState):
+    def test_to_dict_matches_asdict(self, state: PlaybackState):
         """
-        属性测试：字典序列化往返一致性
+        属性测试：to_dict 包含所有字段
         
-        对于任意有效的 PlaybackState 对象：
-        1. 转换为字典
-        2. 从字典创建新实例
-        3. 结果应与原始对象等价
+        对于任意有效的 PlaybackState 对象，to_dict 的结果（含键顺序）应与 dataclasses.asdict 一致
         """
-        # 转换为字典
         data = state.to_dict()
         
-        # 从字典创建
-        restored = PlaybackState.from_dict(data)
-        
-        # 验证所有字段一致
-        assert restored.mode == state.mode
-        assert restored.is_playing == state.is_playing
-        assert restored.is_paused == state.is_paused
-        assert restored.current_audio_id == state.current_audio_id
-        assert restored.current_position == state.current_position
-        assert restored.current_cue_index == state.current_cue_index
-        assert restored.bgm_volume == state.bgm_volume
-        assert restored.sfx_volume == state.sfx_volume
-        assert restored.in_silence == state.in_silence
-        assert restored.silence_remaining == state.silence_remaining
+        assert data == asdict(state)
+        assert list(data) == list(asdict(state))